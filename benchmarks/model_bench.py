@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Ticket model and JSON benchmark
+
+Builds a synthetic TicketGet response (tickets with dynamic fields and
+articles) and compares, before and after:
+  - decode time: json.loads vs the fast backend (orjson when installed)
+  - serialize time and size: json.dumps(indent=2) vs compact output
+  - memory per cached ticket: raw dicts vs compact Ticket objects
+
+Usage:
+  python benchmarks/model_bench.py --tickets 500 --articles 10
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from otrs_mcp import jsonutil
+from otrs_mcp.models import Ticket, compact_ticket_result, expand_ticket_result
+
+QUEUES = ["Raw", "Junk", "Misc", "Postmaster", "Service Desk"]
+STATES = ["new", "open", "pending reminder", "closed successful"]
+PRIORITIES = ["1 very low", "2 low", "3 normal", "4 high", "5 very high"]
+
+
+def make_ticket(ticket_id: int, articles: int, dynamic_fields: int) -> dict:
+    rnd = random.Random(ticket_id)
+    return {
+        "TicketID": str(ticket_id),
+        "TicketNumber": f"2024{ticket_id:08d}",
+        "Title": f"Printer on floor {rnd.randint(1, 9)} does not print #{ticket_id}",
+        "Age": rnd.randint(60, 10_000_000),
+        "Created": "2024-05-01 10:00:00",
+        "Changed": "2024-05-02 11:30:00",
+        "Queue": rnd.choice(QUEUES),
+        "QueueID": str(rnd.randint(1, 5)),
+        "State": rnd.choice(STATES),
+        "StateID": str(rnd.randint(1, 4)),
+        "StateType": "open",
+        "Priority": rnd.choice(PRIORITIES),
+        "PriorityID": str(rnd.randint(1, 5)),
+        "Type": "Unclassified",
+        "TypeID": "1",
+        "Lock": "unlock",
+        "LockID": "1",
+        "Owner": "root@localhost",
+        "OwnerID": "1",
+        "Responsible": "root@localhost",
+        "ResponsibleID": "1",
+        "CustomerID": "ACME",
+        "CustomerUserID": f"customer{rnd.randint(1, 50)}",
+        "ArchiveFlag": "n",
+        "UnlockTimeout": "0",
+        "UntilTime": 0,
+        "EscalationTime": "0",
+        "DynamicField": [
+            {"Name": f"Field{i}", "Value": rnd.choice([None, "yes", "no", str(rnd.randint(1, 100))])}
+            for i in range(dynamic_fields)
+        ],
+        "Article": [
+            {
+                "ArticleID": str(ticket_id * 1000 + a),
+                "TicketID": str(ticket_id),
+                "From": f"customer{a}@example.com",
+                "To": "support@example.com",
+                "Subject": f"Re: Printer #{ticket_id}",
+                "Body": "Hello,\n\nthe printer still does not work.\n\nRegards\n" * 3,
+                "ContentType": "text/plain; charset=utf8",
+                "Charset": "utf8",
+                "MimeType": "text/plain",
+                "CreateTime": "2024-05-01 10:00:00",
+                "SenderType": "customer",
+                "ArticleType": "email-external",
+            }
+            for a in range(articles)
+        ],
+    }
+
+
+def timed(func, repeat: int) -> float:
+    """Best wall time of `repeat` runs in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def measure_memory(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=500)
+    parser.add_argument("--articles", type=int, default=10)
+    parser.add_argument("--dynamic-fields", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response = {"Ticket": [make_ticket(i, args.articles, args.dynamic_fields) for i in range(1, args.tickets + 1)]}
+    raw = json.dumps(response).encode("utf-8")
+    n = args.tickets
+
+    decode_std = timed(lambda: json.loads(raw), args.repeat)
+    decode_fast = timed(lambda: jsonutil.loads(raw), args.repeat)
+
+    pretty = json.dumps(response, indent=2)
+    compact = jsonutil.dumps(response)
+    serialize_std = timed(lambda: json.dumps(response, indent=2), args.repeat)
+    serialize_fast = timed(lambda: jsonutil.dumps(response), args.repeat)
+
+    compact_result = compact_ticket_result(response)
+    to_model = timed(lambda: compact_ticket_result(response), args.repeat)
+    from_model = timed(lambda: expand_ticket_result(compact_result), args.repeat)
+    assert expand_ticket_result(compact_result)["Ticket"] == response["Ticket"]
+
+    memory_dicts = measure_memory(lambda: json.loads(raw))
+    memory_models = measure_memory(lambda: [Ticket.from_dict(t) for t in json.loads(raw)["Ticket"]])
+
+    print(f"Tickets: {n}, articles per ticket: {args.articles}, dynamic fields: {args.dynamic_fields}")
+    print(f"JSON backend: {jsonutil.BACKEND}")
+    print()
+    print(f"{'':32}{'before':>12}{'after':>12}{'change':>10}")
+
+    def row(label: str, before: float, after: float, unit: str) -> None:
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{label:32}{before:>10.2f}{unit}{after:>10.2f}{unit}{change:>9.1f}%")
+
+    row("Decode per ticket (us)", decode_std * 1000 / n, decode_fast * 1000 / n, "  ")
+    row("Serialize per ticket (us)", serialize_std * 1000 / n, serialize_fast * 1000 / n, "  ")
+    row("Output per ticket (bytes)", len(pretty.encode()) / n, len(compact.encode()) / n, "  ")
+    row("Memory per ticket (bytes)", memory_dicts / n, memory_models / n, "  ")
+    print()
+    print(f"Dict -> Ticket per ticket:   {to_model * 1000 / n:8.2f} us")
+    print(f"Ticket -> dict per ticket:   {from_model * 1000 / n:8.2f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
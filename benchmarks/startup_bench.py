@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the stdio entry point
+
+Measures, over several fresh processes:
+  - import time of otrs_mcp.main and otrs_mcp.server (python -X importtime)
+  - time from process spawn to the `initialize` response
+  - time from process spawn to the first `tools/list` response
+
+Exits non-zero when the median time to first response exceeds --budget-ms,
+so it can run in CI to catch startup regressions.
+
+Usage:
+  python benchmarks/startup_bench.py --runs 10 --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SERVER_CMD = [sys.executable, "-c", "from otrs_mcp.main import run_server; run_server()"]
+
+SERVER_ENV = {
+    "OTRS_BASE_URL": "https://otrs.invalid/otrs/nph-genericinterface.pl/Webservice/Bench",
+    "OTRS_USERNAME": "bench",
+    "OTRS_PASSWORD": "bench",
+    "OTRS_WARMUP": "false",
+}
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-bench", "version": "0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+TOOLS_LIST = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of `module` in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **SERVER_ENV},
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000.0
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def first_response_ms() -> dict:
+    """Spawn the server and time the initialize and tools/list responses"""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        SERVER_CMD,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env={**os.environ, **SERVER_ENV},
+        text=True,
+    )
+    try:
+        process.stdin.write(json.dumps(INITIALIZE) + "\n")
+        process.stdin.flush()
+        response = json.loads(process.stdout.readline())
+        initialize_ms = (time.perf_counter() - started) * 1000
+        if response.get("id") != 1 or "result" not in response:
+            raise RuntimeError(f"Unexpected initialize response: {response}")
+
+        process.stdin.write(json.dumps(INITIALIZED) + "\n")
+        process.stdin.write(json.dumps(TOOLS_LIST) + "\n")
+        process.stdin.flush()
+        response = json.loads(process.stdout.readline())
+        tools_ms = (time.perf_counter() - started) * 1000
+        return {
+            "initialize_ms": initialize_ms,
+            "tools_list_ms": tools_ms,
+            "tools": len(response["result"]["tools"]),
+        }
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes to measure")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if median initialize time exceeds this")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    imports = {
+        module: statistics.median(import_time_ms(module) for _ in range(args.runs))
+        for module in ("otrs_mcp.main", "otrs_mcp.server")
+    }
+    samples = [first_response_ms() for _ in range(args.runs)]
+    results = {
+        "runs": args.runs,
+        "import_ms": {module: round(ms, 1) for module, ms in imports.items()},
+        "initialize_ms_median": round(statistics.median(s["initialize_ms"] for s in samples), 1),
+        "initialize_ms_max": round(max(s["initialize_ms"] for s in samples), 1),
+        "tools_list_ms_median": round(statistics.median(s["tools_list_ms"] for s in samples), 1),
+        "tools": samples[0]["tools"],
+        "budget_ms": args.budget_ms,
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Runs:                       {results['runs']}")
+        for module, ms in results["import_ms"].items():
+            print(f"Import {module:<20} {ms:8.1f} ms")
+        print(f"Time to initialize (median) {results['initialize_ms_median']:8.1f} ms")
+        print(f"Time to initialize (max)    {results['initialize_ms_max']:8.1f} ms")
+        print(f"Time to tools/list (median) {results['tools_list_ms_median']:8.1f} ms")
+        print(f"Registered tools:           {results['tools']}")
+
+    if args.budget_ms is not None and results["initialize_ms_median"] > args.budget_ms:
+        print(
+            f"[FAIL] Median time to initialize {results['initialize_ms_median']} ms "
+            f"exceeds budget {args.budget_ms} ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+import html
+import re
+from typing import Any, Dict
+
+from otrs_mcp.models import Article
+
+_BLOCK_TAGS = re.compile(r"<\s*(br|/p|/div|/li|/tr|/h[1-6])\b[^>]*>", re.IGNORECASE)
+_DROP_BLOCKS = re.compile(r"<\s*(script|style|head)\b.*?<\s*/\s*\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAGS = re.compile(r"<[^>]+>")
+_BLANK_LINES = re.compile(r"\n\s*\n\s*\n+")
+_SPACES = re.compile(r"[ \t\r\f\v]+")
+
+SUMMARY_FIELDS = ("ArticleID", "CreateTime", "From", "To", "Cc", "Subject", "SenderType", "ContentType")
+
+
+def strip_html(text: str) -> str:
+    """Convert an HTML body to readable plain text"""
+    text = _DROP_BLOCKS.sub("", text)
+    text = _BLOCK_TAGS.sub("\n", text)
+    text = html.unescape(_TAGS.sub("", text))
+    text = _SPACES.sub(" ", text)
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def is_html(article: Article) -> bool:
+    content_type = article.get("ContentType") or article.get("MimeType") or ""
+    return "html" in str(content_type).lower()
+
+
+def article_view(article: Article, max_body_chars: int = 2000, strip: bool = False) -> Dict[str, Any]:
+    """Summary of an article with its body optionally converted to text and truncated"""
+    view = {name: article.get(name) for name in SUMMARY_FIELDS if article.get(name) is not None}
+    body = article.get("Body") or ""
+    if strip and is_html(article):
+        body = strip_html(body)
+    view["BodyLength"] = len(body)
+    if max_body_chars > 0 and len(body) > max_body_chars:
+        body = body[:max_body_chars]
+        view["BodyTruncated"] = True
+    else:
+        view["BodyTruncated"] = False
+    view["Body"] = body
+    return view
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from otrs_mcp.cache import TTLCache
+from otrs_mcp.config import OTRSConfig, backend_names
+from otrs_mcp import jsonutil, recording
+from otrs_mcp.customers import CustomerDirectory
+from otrs_mcp.hedging import Hedger
+from otrs_mcp.ratelimit import RateLimiter
+from otrs_mcp.tracing import HttpTimings, current_span, span
+from otrs_mcp.warmup import OTRSMetadata
+from otrs_mcp.watch import TicketWatcher
+
+ALL_BACKENDS = "all"
+
+
+class Backend:
+    """One OTRS instance with its own connection pool, rate limits and caches"""
+
+    def __init__(self, name: str, config: OTRSConfig):
+        self.name = name
+        self.config = config
+        self.rate_limiter = RateLimiter.from_spec(config.rate_limits)
+        self.metadata = OTRSMetadata()
+        self.warmup_report: Dict[str, Any] = {}
+        self.ticket_cache = TTLCache(config.ticket_cache_ttl, config.cache_size)
+        self.history_cache = TTLCache(config.ticket_cache_ttl, config.cache_size)
+        # Articles by (ticket ID, article ID), and the article IDs per ticket seen so far
+        self.article_cache = TTLCache(config.article_cache_ttl, config.cache_size * 10)
+        self.article_index_cache = TTLCache(config.article_index_cache_ttl, config.cache_size)
+        self.config_item_cache = TTLCache(config.config_item_cache_ttl, config.cache_size)
+        self.config_item_search_cache = TTLCache(config.config_item_cache_ttl, config.cache_size)
+        self.customers = CustomerDirectory(
+            config.customer_directory_limit, config.customer_directory_refresh, config.customer_directory_miss_ttl
+        )
+        # Per-operation latency histograms, also used to decide when to hedge reads
+        self.hedger = Hedger.from_spec(
+            config.hedge_operations, config.hedge_percentile, config.hedge_budget, config.hedge_min_samples
+        )
+        # One change poller for every watched or subscribed ticket of this backend
+        self.watcher = TicketWatcher(self.request, config.watch_interval)
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def get_http_client(self) -> httpx.AsyncClient:
+        """Return this backend's pooled HTTP client, creating it on first use"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                verify=self.config.verify_ssl,
+                follow_redirects=True,
+                timeout=30,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections
+                )
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        await self.watcher.stop()
+        await self.customers.stop()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def request(self, operation: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make API request using UserLogin/Password authentication (no session)"""
+        if not recording.recorder.enabled:
+            return await self._request(operation, data)
+        
+        # Record mode: log the request and response, linked to the calling tool's trace
+        parent = current_span()
+        trace_id = parent.trace_id if parent is not None else None
+        started = time.perf_counter()
+        try:
+            result = await self._request(operation, data)
+        except Exception as e:
+            recording.recorder.record_otrs(
+                self.name, operation, data, None, (time.perf_counter() - started) * 1000, trace_id,
+                f"{type(e).__name__}: {e}"
+            )
+            raise
+        recording.recorder.record_otrs(self.name, operation, data, result, (time.perf_counter() - started) * 1000, trace_id)
+        return result
+
+    async def _request(self, operation: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        url = f"{self.config.base_url}/{operation}"
+        
+        request_data = {
+            "UserLogin": self.config.username,
+            "Password": self.config.password
+        }
+        if data:
+            request_data.update(data)
+        
+        with span(f"otrs.{operation}", backend=self.name, operation=operation) as current:
+            started = time.perf_counter()
+            body = jsonutil.dumps_bytes(request_data)
+            serialize_ms = (time.perf_counter() - started) * 1000
+            
+            # Respect the per-operation budget granted by the OTRS admins. The
+            # hedge delay starts after this, so waiting here never triggers a hedge.
+            waited = await self.rate_limiter.acquire(operation)
+            response, timings, hedged = await self.hedger.run(
+                operation, lambda hedge: self._post(operation, url, body, hedge)
+            )
+            current.set(status_code=response.status_code, response_bytes=len(response.content))
+            if hedged:
+                current.set(hedged=True)
+            response.raise_for_status()
+            
+            started = time.perf_counter()
+            result = jsonutil.loads(response.content)
+            current.set(
+                rate_limit_wait_ms=round(waited * 1000, 3),
+                serialize_ms=round(serialize_ms, 3),
+                decode_ms=round((time.perf_counter() - started) * 1000, 3),
+                otrs_error=isinstance(result, dict) and bool(result.get("Error")),
+                **timings.as_dict()
+            )
+            return result
+
+    async def _post(self, operation: str, url: str, body: bytes, hedge: bool) -> Tuple[httpx.Response, HttpTimings, bool]:
+        """
+        Send one attempt of a request and record its latency.
+
+        Hedged attempts get their own span so both copies show up in traces,
+        and take their own rate limit token (the caller took the primary's).
+        Server errors raise here, so a failing attempt never beats a working one.
+        """
+        with span(f"otrs.{operation}.hedge") if hedge else nullcontext() as current:
+            if hedge:
+                waited = await self.rate_limiter.acquire(operation)
+                current.set(rate_limit_wait_ms=round(waited * 1000, 3))
+            
+            timings = HttpTimings()
+            started = time.perf_counter()
+            response = await self.get_http_client().post(
+                url,
+                content=body,
+                headers={"Content-Type": "application/json", "Accept": "application/json"},
+                extensions={"trace": timings.trace}
+            )
+            self.hedger.record(operation, time.perf_counter() - started)
+            if response.status_code >= 500:
+                response.raise_for_status()
+            return response, timings, hedge
+
+    async def resolve_customer_user(self, value: str) -> Optional[str]:
+        """
+        Look a customer login or email up in the local directory.
+
+        Returns the login, or None if the directory is disabled or could not be
+        loaded (callers then fall back to their previous behaviour). A value
+        the directory does not know is searched for in OTRS, as it may have
+        been added since the last full reload; LookupError is raised if OTRS
+        does not know it either. Such values are remembered for a while, so
+        retrying an invalid customer does not search again.
+        """
+        if not self.config.customer_directory or not await self.customers.ensure_loaded(self.request):
+            return None
+        login = self.customers.resolve(value)
+        if login is not None:
+            return login
+        miss_key = value.strip().lower()
+        if self.customers.misses.get(miss_key):
+            raise LookupError(value)
+        try:
+            result = await self.customers.refresh(self.request, search=value)
+        except Exception:
+            return None
+        if result.get("Error"):
+            return None
+        login = self.customers.resolve(value)
+        if login is None:
+            self.customers.misses.set(miss_key, True)
+            raise LookupError(value)
+        return login
+
+    def invalidate_ticket(self, ticket_id: str) -> None:
+        """Drop every cached variant of a ticket, its history and its article list"""
+        ticket_id = str(ticket_id)
+        self.watcher.remember(ticket_id, None)
+        for dynamic_fields in (True, False):
+            for extended in (True, False):
+                self.ticket_cache.discard((ticket_id, dynamic_fields, extended))
+        self.history_cache.discard(ticket_id)
+        for newest_first in (True, False):
+            self.article_index_cache.discard((ticket_id, newest_first))
+
+
+class BackendRegistry:
+    """Named OTRS backends configured with OTRS_BACKENDS"""
+
+    def __init__(self, backends: List[Backend], default: Optional[str] = None):
+        if not backends:
+            raise ValueError("At least one backend is required")
+        self.backends = {backend.name: backend for backend in backends}
+        self.default = default if default in self.backends else backends[0].name
+
+    @classmethod
+    def from_env(cls, default_config: OTRSConfig, default: Optional[str] = None) -> "BackendRegistry":
+        names = backend_names()
+        if names == ["default"]:
+            return cls([Backend("default", default_config)])
+        return cls([Backend(name, OTRSConfig.for_backend(name)) for name in names], default)
+
+    def get(self, name: Optional[str] = None) -> Backend:
+        """Resolve a backend name, using the default backend when none is given"""
+        backend = self.backends.get(name or self.default)
+        if backend is None:
+            raise ValueError(f"Unknown OTRS backend {name!r}; configured backends: {', '.join(self.backends)}")
+        return backend
+
+    def select(self, name: Optional[str] = None) -> List[Backend]:
+        """Backends addressed by `name`, where "all" selects every backend"""
+        if name == ALL_BACKENDS:
+            return list(self.backends.values())
+        return [self.get(name)]
+
+    def names(self) -> List[str]:
+        return list(self.backends)
+
+    async def close(self) -> None:
+        for backend in self.backends.values():
+            await backend.close()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+import os
+import tempfile
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, List
+
+import dotenv
+
+dotenv.load_dotenv()
+
+@dataclass
+class OTRSConfig:
+    base_url: str = os.getenv("OTRS_BASE_URL", "https://192.168.5.159/otrs/nph-genericinterface.pl/Webservice/TestInterface")
+    username: str = os.getenv("OTRS_USERNAME", "seasonpoon.admin")
+    password: str = os.getenv("OTRS_PASSWORD", "HOJTDVKm")
+    verify_ssl: bool = os.getenv("OTRS_VERIFY_SSL", "false").lower() == "true"
+    default_queue: str = os.getenv("OTRS_DEFAULT_QUEUE", "Raw")
+    default_state: str = os.getenv("OTRS_DEFAULT_STATE", "new")
+    default_priority: str = os.getenv("OTRS_DEFAULT_PRIORITY", "3 normal")
+    default_type: str = os.getenv("OTRS_DEFAULT_TYPE", "Unclassified")
+    # Extract web interface base URL from API URL
+    web_base_url: str = os.getenv("OTRS_WEB_BASE_URL", "https://192.168.5.159/otrs")
+    # Background job workers running at the same time
+    job_concurrency: int = int(os.getenv("OTRS_JOB_CONCURRENCY", "2"))
+    # Per-operation token buckets, e.g. "TicketSearch=20,TicketCreate=5:10" (rate per second[:burst])
+    rate_limits: str = os.getenv("OTRS_RATE_LIMITS", "")
+    # Connection pool shared by all requests
+    max_connections: int = int(os.getenv("OTRS_MAX_CONNECTIONS", "10"))
+    # Optional startup warm-up of connections, session and metadata
+    warmup: bool = os.getenv("OTRS_WARMUP", "false").lower() == "true"
+    warmup_budget: float = float(os.getenv("OTRS_WARMUP_BUDGET", "5"))
+    # Seconds to cache TicketGet/TicketHistoryGet results (0 disables caching)
+    ticket_cache_ttl: float = float(os.getenv("OTRS_TICKET_CACHE_TTL", "0"))
+    cache_size: int = int(os.getenv("OTRS_CACHE_SIZE", "1000"))
+    # Articles never change once created, so they are cached independently of tickets
+    article_cache_ttl: float = float(os.getenv("OTRS_ARTICLE_CACHE_TTL", "3600"))
+    # The article IDs of a ticket grow with every reply, so the list is kept briefly
+    article_index_cache_ttl: float = float(os.getenv("OTRS_ARTICLE_INDEX_CACHE_TTL", "60"))
+    # CMDB data changes rarely, so config items are cached for an hour by default
+    config_item_cache_ttl: float = float(os.getenv("OTRS_CONFIG_ITEM_CACHE_TTL", "3600"))
+    # Config item IDs per ConfigItemGet request, and batches fetched at once
+    config_item_batch_size: int = int(os.getenv("OTRS_CONFIG_ITEM_BATCH_SIZE", "20"))
+    config_item_concurrency: int = int(os.getenv("OTRS_CONFIG_ITEM_CONCURRENCY", "4"))
+    # Local customer user directory for validating and autocompleting customers
+    customer_directory: bool = os.getenv("OTRS_CUSTOMER_DIRECTORY", "false").lower() == "true"
+    customer_directory_limit: int = int(os.getenv("OTRS_CUSTOMER_DIRECTORY_LIMIT", "10000"))
+    customer_directory_refresh: float = float(os.getenv("OTRS_CUSTOMER_DIRECTORY_REFRESH", "3600"))
+    # Seconds an unknown customer is rejected without searching OTRS again
+    customer_directory_miss_ttl: float = float(os.getenv("OTRS_CUSTOMER_DIRECTORY_MISS_TTL", "300"))
+    # Local endpoint receiving ticket events from an OTRS invoker (0 disables it)
+    webhook_port: int = int(os.getenv("OTRS_WEBHOOK_PORT", "0"))
+    webhook_host: str = os.getenv("OTRS_WEBHOOK_HOST", "127.0.0.1")
+    webhook_token: str = os.getenv("OTRS_WEBHOOK_TOKEN", "")
+    # Re-fetch invalidated tickets right away instead of on the next read
+    webhook_refresh: bool = os.getenv("OTRS_WEBHOOK_REFRESH", "false").lower() == "true"
+    # Read operations sent a second time when slower than the given latency percentile,
+    # e.g. "TicketGet,TicketSearch,TicketHistoryGet" (empty disables hedging)
+    hedge_operations: str = os.getenv("OTRS_HEDGE_OPERATIONS", "")
+    hedge_percentile: float = float(os.getenv("OTRS_HEDGE_PERCENTILE", "95"))
+    # Hedged requests allowed per request, e.g. 0.05 caps the extra load at 5%
+    hedge_budget: float = float(os.getenv("OTRS_HEDGE_BUDGET", "0.05"))
+    hedge_min_samples: int = int(os.getenv("OTRS_HEDGE_MIN_SAMPLES", "20"))
+    # Seconds between checks of watched and subscribed tickets
+    watch_interval: float = float(os.getenv("OTRS_WATCH_INTERVAL", "30"))
+    # Admin tool profiling the live server; off unless explicitly enabled
+    profiling: bool = os.getenv("OTRS_PROFILING", "false").lower() == "true"
+    profile_dir: str = os.getenv("OTRS_PROFILE_DIR", os.path.join(tempfile.gettempdir(), "otrs-mcp-profiles"))
+
+    @classmethod
+    def for_backend(cls, name: str) -> "OTRSConfig":
+        """
+        Configuration of a named backend.
+
+        Every field can be overridden with OTRS_<NAME>_<FIELD>, for example
+        OTRS_EU_BASE_URL or OTRS_US_RATE_LIMITS. Unset fields fall back to the
+        global OTRS_<FIELD> value.
+        """
+        base = cls()
+        prefix = f"OTRS_{name.upper()}_"
+        overrides: Dict[str, Any] = {}
+        for f in fields(cls):
+            raw = os.getenv(prefix + f.name.upper())
+            if raw is None:
+                continue
+            current = getattr(base, f.name)
+            if isinstance(current, bool):
+                overrides[f.name] = raw.lower() == "true"
+            else:
+                overrides[f.name] = type(current)(raw)
+        return replace(base, **overrides)
+
+def backend_names() -> List[str]:
+    """Names listed in OTRS_BACKENDS, or a single "default" backend"""
+    names = [name.strip() for name in os.getenv("OTRS_BACKENDS", "").split(",") if name.strip()]
+    return names or ["default"]
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+
+import asyncio
+import bisect
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from otrs_mcp.cache import TTLCache
+
+Request = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# "First Last <user@example.com>" as returned by OTRS customer searches
+_NAME_EMAIL = re.compile(r"^\s*(?P<name>.*?)\s*<(?P<email>[^>]+)>\s*$")
+
+
+class CustomerUser:
+    """One customer user login with its email address and display name"""
+
+    __slots__ = ("login", "email", "name")
+
+    def __init__(self, login: str, email: str = "", name: str = ""):
+        self.login = login
+        self.email = email
+        self.name = name
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"UserLogin": self.login, "UserEmail": self.email, "Name": self.name}
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CustomerUser) and (self.login, self.email, self.name) == (other.login, other.email, other.name)
+
+
+class PrefixIndex:
+    """
+    Sorted (key, login) pairs searched with bisect.
+
+    Keys are the lower-cased login, email and each word of the name, so a
+    prefix matches any of them. Lookups are O(log n + matches).
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[str] = []
+        self._logins: List[str] = []
+
+    @staticmethod
+    def keys_for(user: CustomerUser) -> Iterable[str]:
+        keys = {user.login.lower()}
+        if user.email:
+            keys.add(user.email.lower())
+        keys.update(word.lower() for word in user.name.split() if word)
+        return keys
+
+    def rebuild(self, users: Iterable[CustomerUser]) -> None:
+        pairs = sorted((key, user.login) for user in users for key in self.keys_for(user))
+        self._keys = [key for key, _ in pairs]
+        self._logins = [login for _, login in pairs]
+
+    def add(self, user: CustomerUser) -> None:
+        for key in self.keys_for(user):
+            position = bisect.bisect_left(self._keys, key)
+            # Skip exact duplicates of (key, login)
+            while position < len(self._keys) and self._keys[position] == key:
+                if self._logins[position] == user.login:
+                    break
+                position += 1
+            else:
+                self._keys.insert(position, key)
+                self._logins.insert(position, user.login)
+
+    def search(self, prefix: str, limit: int = 10) -> List[str]:
+        prefix = prefix.lower()
+        position = bisect.bisect_left(self._keys, prefix)
+        logins: List[str] = []
+        while position < len(self._keys) and self._keys[position].startswith(prefix) and len(logins) < limit:
+            login = self._logins[position]
+            if login not in logins:
+                logins.append(login)
+            position += 1
+        return logins
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def parse_customer_users(result: Dict[str, Any]) -> List[CustomerUser]:
+    """
+    Read customer users from a CustomerUserSearch response.
+
+    Accepts a list of user records, a {login: "Name <email>"} mapping as
+    returned by OTRS' CustomerSearch, or a plain list of logins.
+    """
+    data = result.get("CustomerUser")
+    if data is None:
+        data = result.get("CustomerUserLogin", [])
+    users = []
+    if isinstance(data, dict):
+        for login, label in data.items():
+            match = _NAME_EMAIL.match(str(label))
+            if match:
+                users.append(CustomerUser(str(login), match["email"], match["name"]))
+            else:
+                users.append(CustomerUser(str(login), name=str(label)))
+    else:
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get("UserLogin"):
+                name = " ".join(part for part in (item.get("UserFirstname"), item.get("UserLastname")) if part)
+                users.append(CustomerUser(str(item["UserLogin"]), item.get("UserEmail") or "", name))
+            elif isinstance(item, str) and item:
+                users.append(CustomerUser(item))
+    return users
+
+
+class CustomerDirectory:
+    """In-memory directory of customer users for local validation and autocomplete"""
+
+    def __init__(self, limit: int = 10000, refresh_interval: float = 3600, miss_ttl: float = 300):
+        self.limit = limit
+        self.refresh_interval = refresh_interval
+        # Lower-cased values that neither the directory nor a search in OTRS knew
+        self.misses = TTLCache(miss_ttl, 1000)
+        self.users: Dict[str, CustomerUser] = {}
+        self._by_lower: Dict[str, str] = {}
+        self.index = PrefixIndex()
+        self.loaded_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._reload: Optional["asyncio.Task[Any]"] = None
+
+    @property
+    def available(self) -> bool:
+        return self.loaded_at is not None
+
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.time() - self.loaded_at > self.refresh_interval
+
+    def merge(self, users: Iterable[CustomerUser], replace: bool = False) -> Tuple[int, int]:
+        """Merge users into the directory; returns (added or changed, removed)"""
+        incoming = {user.login: user for user in users}
+        changed = [user for login, user in incoming.items() if self.users.get(login) != user]
+        removed = [login for login in self.users if login not in incoming] if replace else []
+        if not changed and not removed:
+            return 0, 0
+        # A few new logins are inserted in place; changes and removals rebuild once
+        only_new = not removed and len(changed) <= 32 and all(user.login not in self.users for user in changed)
+        for login in removed:
+            del self.users[login]
+        self.users.update((user.login, user) for user in changed)
+        if only_new:
+            for user in changed:
+                self._add_lookup(user)
+                self.index.add(user)
+        else:
+            self._by_lower = {}
+            for user in self.users.values():
+                self._add_lookup(user)
+            self.index.rebuild(self.users.values())
+        return len(changed), len(removed)
+
+    def _add_lookup(self, user: CustomerUser) -> None:
+        self._by_lower[user.login.lower()] = user.login
+        if user.email:
+            self._by_lower.setdefault(user.email.lower(), user.login)
+
+    async def refresh(self, request: Request, search: str = "*") -> Dict[str, Any]:
+        """
+        Load customer users with CustomerUserSearch.
+
+        A full refresh (search "*") replaces the directory; a narrower search
+        only merges its results, which is how single logins are picked up
+        between full refreshes. Only full refreshes are serialized, so a
+        narrow search never waits for a running reload.
+        """
+        if search != "*":
+            return await self._search(request, search)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            return await self._search(request, search)
+
+    async def _search(self, request: Request, search: str) -> Dict[str, Any]:
+        started = time.monotonic()
+        result = await request("CustomerUserSearch", {"Search": search, "Limit": self.limit})
+        if result.get("Error"):
+            self.error = str(result["Error"])
+            return {"Error": result["Error"]}
+        full = search == "*"
+        changed, removed = self.merge(parse_customer_users(result), replace=full)
+        if full:
+            self.loaded_at = time.time()
+            self.misses.clear()
+        self.error = None
+        return {
+            "Users": len(self.users),
+            "Changed": changed,
+            "Removed": removed,
+            "Seconds": round(time.monotonic() - started, 3),
+        }
+
+    async def ensure_loaded(self, request: Request) -> bool:
+        """
+        Load the directory on first use; returns whether it can be used.
+
+        A loaded directory that went stale keeps answering while a full
+        reload runs in the background, so callers never wait for it.
+        """
+        if self.loaded_at is None:
+            await self._reload_all(request)
+        elif self.is_stale() and (self._reload is None or self._reload.done()):
+            self._reload = asyncio.create_task(self._reload_all(request))
+        return self.available
+
+    async def _reload_all(self, request: Request) -> None:
+        try:
+            await self.refresh(request)
+        except Exception as e:
+            self.error = str(e)
+
+    async def stop(self) -> None:
+        """Cancel a background reload"""
+        if self._reload is not None:
+            self._reload.cancel()
+            try:
+                await self._reload
+            except asyncio.CancelledError:
+                pass
+            self._reload = None
+
+    def resolve(self, value: str) -> Optional[str]:
+        """Return the login matching a login or email address, ignoring case"""
+        return self._by_lower.get(value.strip().lower())
+
+    def search(self, prefix: str, limit: int = 10) -> List[Dict[str, str]]:
+        return [self.users[login].to_dict() for login in self.index.search(prefix, limit)]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "Users": len(self.users),
+            "IndexKeys": len(self.index),
+            "LoadedAt": self.loaded_at,
+            "RememberedMisses": len(self.misses),
+            "Error": self.error,
+        }
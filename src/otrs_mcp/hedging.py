@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+
+import asyncio
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Only reads may be sent twice; hedging a TicketCreate would create two tickets
+HEDGEABLE_OPERATIONS = frozenset({"TicketGet", "TicketSearch", "TicketHistoryGet"})
+
+
+class LatencyHistogram:
+    """
+    Log-scale latency histogram that forgets old samples.
+
+    Buckets grow by 10% from 1 ms to ~2 minutes, so percentiles are accurate
+    to about 10%. When `window` samples have been recorded all counts are
+    halved, which keeps the percentiles tracking recent latency.
+    """
+
+    GROWTH = 1.1
+    MIN_SECONDS = 0.001
+    BUCKETS = 125
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self.counts = [0.0] * self.BUCKETS
+        self.total = 0.0
+        self.samples = 0
+        self._since_decay = 0
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.MIN_SECONDS:
+            return 0
+        index = int(math.log(seconds / self.MIN_SECONDS, self.GROWTH)) + 1
+        return min(index, self.BUCKETS - 1)
+
+    def _upper_bound(self, index: int) -> float:
+        return self.MIN_SECONDS * self.GROWTH ** index
+
+    def record(self, seconds: float) -> None:
+        self.counts[self._bucket(seconds)] += 1
+        self.total += 1
+        self.samples += 1
+        self._since_decay += 1
+        if self._since_decay >= self.window:
+            self.counts = [count / 2 for count in self.counts]
+            self.total /= 2
+            self._since_decay = 0
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency in seconds below which a fraction `q` of recent requests finished"""
+        if self.total <= 0:
+            return None
+        threshold = q * self.total
+        seen = 0.0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return self._upper_bound(index)
+        return self._upper_bound(self.BUCKETS - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        def ms(q: float) -> Optional[float]:
+            value = self.percentile(q)
+            return round(value * 1000, 1) if value is not None else None
+        return {"Samples": self.samples, "P50Ms": ms(0.5), "P90Ms": ms(0.9), "P95Ms": ms(0.95), "P99Ms": ms(0.99)}
+
+
+class HedgeBudget:
+    """Allows hedged requests for at most `ratio` of all requests, with a small burst"""
+
+    def __init__(self, ratio: float = 0.05, burst: float = 10.0):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = burst
+
+    def on_request(self) -> None:
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class Hedger:
+    """
+    Sends a second copy of an idempotent request when the first one is slower
+    than the configured percentile of recent latency, and uses whichever
+    answers first.
+    """
+
+    def __init__(
+        self,
+        operations: Iterable[str] = (),
+        percentile: float = 0.95,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.01,
+    ):
+        self.operations = frozenset(operations)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.budget = HedgeBudget(budget_ratio)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.denied = 0
+
+    @classmethod
+    def from_spec(cls, operations: str, percentile: float, budget_ratio: float, min_samples: int) -> "Hedger":
+        """
+        Build a hedger from configuration values such as "TicketGet,TicketSearch".
+
+        The percentile may be given as 95 or 0.95. Raises ValueError for
+        operations that are not safe to send twice.
+        """
+        names = [op.strip() for op in operations.split(",") if op.strip()]
+        unsafe = sorted(set(names) - HEDGEABLE_OPERATIONS)
+        if unsafe:
+            raise ValueError(f"Cannot hedge {', '.join(unsafe)}; only {', '.join(sorted(HEDGEABLE_OPERATIONS))} are idempotent")
+        if percentile > 1:
+            percentile /= 100
+        if not 0 < percentile < 1:
+            raise ValueError("Hedge percentile must be between 0 and 100")
+        return cls(names, percentile=percentile, budget_ratio=budget_ratio, min_samples=min_samples)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.operations)
+
+    def histogram(self, operation: str) -> LatencyHistogram:
+        histogram = self.histograms.get(operation)
+        if histogram is None:
+            histogram = self.histograms[operation] = LatencyHistogram()
+        return histogram
+
+    def record(self, operation: str, seconds: float) -> None:
+        self.histogram(operation).record(seconds)
+
+    def delay_for(self, operation: str) -> Optional[float]:
+        """Seconds to wait before hedging `operation`, or None if it is not hedged"""
+        if operation not in self.operations:
+            return None
+        histogram = self.histogram(operation)
+        if histogram.samples < self.min_samples:
+            return None
+        delay = histogram.percentile(self.percentile)
+        return max(self.min_delay, delay) if delay is not None else None
+
+    async def run(self, operation: str, attempt: Callable[[bool], Awaitable[T]]) -> T:
+        """
+        Run `attempt(False)`, adding `attempt(True)` if it is slower than the
+        hedge delay. The first successful result wins and the other attempt is
+        cancelled; if both fail, the primary's error is raised.
+
+        A primary beaten by its hedge never records its own latency, so the time
+        it had taken when cancelled is recorded instead; leaving it out would
+        drag the percentiles (and the hedge delay) down to the fast answers.
+        """
+        if operation not in self.operations:
+            return await attempt(False)
+        self.budget.on_request()
+        delay = self.delay_for(operation)
+        if delay is None:
+            return await attempt(False)
+
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(attempt(False))
+        hedge: Optional["asyncio.Future[T]"] = None
+        # Cancelling the caller must cancel the attempts too
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+            if not self.budget.try_acquire():
+                self.denied += 1
+                return await primary
+
+            self.hedged += 1
+            hedge = asyncio.ensure_future(attempt(True))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                            if not primary.done():
+                                self.record(operation, time.perf_counter() - started)
+                        return task.result()
+            # Both attempts failed
+            return primary.result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "HedgedOperations": sorted(self.operations),
+            "Percentile": self.percentile,
+            "Hedged": self.hedged,
+            "HedgeWins": self.hedge_wins,
+            "DeniedByBudget": self.denied,
+            "Latency": {operation: h.stats() for operation, h in self.histograms.items()},
+        }
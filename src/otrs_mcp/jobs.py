@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from otrs_mcp.tracing import span
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATES = (JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED)
+
+
+@dataclass
+class Job:
+    """A unit of background work with progress tracking"""
+    job_id: str
+    kind: str
+    status: str = JOB_PENDING
+    total: Optional[int] = None
+    done: int = 0
+    message: str = ""
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    task: Optional["asyncio.Task[Any]"] = field(default=None, repr=False)
+
+    def update(self, done: Optional[int] = None, total: Optional[int] = None, message: Optional[str] = None) -> None:
+        """Report progress from inside a job function"""
+        if total is not None:
+            self.total = total
+        if done is not None:
+            self.done = done
+        if message is not None:
+            self.message = message
+
+    def advance(self, count: int = 1) -> None:
+        """Increment the number of processed items"""
+        self.done += count
+
+    def elapsed(self) -> float:
+        """Seconds spent running (0 while still queued)"""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def throughput(self) -> float:
+        """Processed items per second"""
+        elapsed = self.elapsed()
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until completion, if it can be computed"""
+        if self.status != JOB_RUNNING or not self.total:
+            return None
+        rate = self.throughput()
+        if rate <= 0:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+    def to_status(self) -> Dict[str, Any]:
+        """Status summary returned by the job_status tool"""
+        percent = None
+        if self.total:
+            percent = round(100.0 * min(self.done, self.total) / self.total, 1)
+        eta = self.eta()
+        return {
+            "JobID": self.job_id,
+            "Kind": self.kind,
+            "Status": self.status,
+            "Progress": {
+                "Done": self.done,
+                "Total": self.total,
+                "Percent": percent,
+                "Message": self.message,
+            },
+            "ElapsedSeconds": round(self.elapsed(), 3),
+            "ItemsPerSecond": round(self.throughput(), 2),
+            "ETASeconds": round(eta, 1) if eta is not None else None,
+            "Error": self.error,
+        }
+
+
+JobFunc = Callable[[Job], Awaitable[Any]]
+
+
+class JobManager:
+    """Runs job functions as asyncio tasks with a concurrency cap"""
+
+    def __init__(self, max_concurrency: int = 2, max_retained: int = 100):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retained = max_retained
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def submit(self, kind: str, func: JobFunc) -> Job:
+        """Schedule a job and return it immediately; must be called inside the event loop"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        job = Job(job_id=uuid.uuid4().hex[:12], kind=kind)
+        self.jobs[job.job_id] = job
+        job.task = asyncio.create_task(self._run(job, func))
+        self._prune()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a queued or running job"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        if job.status not in FINISHED_STATES and job.task is not None:
+            job.task.cancel()
+            # A job that never started would otherwise stay pending until the task is scheduled
+            if job.status == JOB_PENDING:
+                job.status = JOB_CANCELLED
+                job.finished_at = time.time()
+        return job
+
+    async def _run(self, job: Job, func: JobFunc) -> None:
+        assert self._semaphore is not None
+        try:
+            async with self._semaphore:
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+                with span(f"job.{job.kind}", job_id=job.job_id):
+                    job.result = await func(job)
+                job.status = JOB_COMPLETED
+        except asyncio.CancelledError:
+            job.status = JOB_CANCELLED
+        except Exception as e:
+            job.status = JOB_FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs once more than max_retained are tracked"""
+        excess = len(self.jobs) - self.max_retained
+        if excess <= 0:
+            return
+        for job_id in [j.job_id for j in self.jobs.values() if j.status in FINISHED_STATES][:excess]:
+            del self.jobs[job_id]
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+import json
+from typing import Any, Union
+
+# orjson is optional (pip install "otrs-mcp-server[fast]"); it decodes and
+# encodes OTRS responses several times faster than the standard library.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON with the fastest available backend"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode JSON compactly, without the whitespace of indent=2"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode JSON compactly as UTF-8 bytes, e.g. for request bodies"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
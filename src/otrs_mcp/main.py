@@ -1,11 +1,18 @@
 #!/usr/bin/env python
 import sys
 import os
-from otrs_mcp.server import mcp
+
+# Heavy modules (FastMCP, httpx, the tool definitions) are imported inside
+# run_server so that environment validation and --help style failures stay
+# instant. stdout carries the MCP protocol, so all diagnostics go to stderr.
+
+def log(message: str = "") -> None:
+    """Print a diagnostic line without touching the stdio protocol channel"""
+    print(message, file=sys.stderr)
 
 def setup_environment():
     """Setup and validate environment configuration"""
-    print("[CONFIG] OTRS MCP Server Configuration:")
+    log("[CONFIG] OTRS MCP Server Configuration:")
     
     # Check required environment variables
     required_vars = ["OTRS_BASE_URL", "OTRS_USERNAME", "OTRS_PASSWORD"]
@@ -18,36 +25,65 @@ def setup_environment():
         else:
             # Mask password for display
             display_value = "*" * len(value) if "PASSWORD" in var else value
-            print(f"  {var}: {display_value}")
+            log(f"  {var}: {display_value}")
     
     if missing_vars:
-        print(f"[ERROR] Missing required environment variables: {', '.join(missing_vars)}")
-        print("\n[INFO] Set these environment variables:")
-        print("  export OTRS_BASE_URL='https://your-otrs-server/otrs/nph-genericinterface.pl/Webservice/TestInterface'")
-        print("  export OTRS_USERNAME='your-username'")
-        print("  export OTRS_PASSWORD='your-password'")
-        print("  export OTRS_VERIFY_SSL='false'  # Optional, for self-signed certificates")
+        log(f"[ERROR] Missing required environment variables: {', '.join(missing_vars)}")
+        log("\n[INFO] Set these environment variables:")
+        log("  export OTRS_BASE_URL='https://your-otrs-server/otrs/nph-genericinterface.pl/Webservice/TestInterface'")
+        log("  export OTRS_USERNAME='your-username'")
+        log("  export OTRS_PASSWORD='your-password'")
+        log("  export OTRS_VERIFY_SSL='false'  # Optional, for self-signed certificates")
         return False
     
     # Display optional configuration
     optional_vars = ["OTRS_VERIFY_SSL", "OTRS_DEFAULT_QUEUE", "OTRS_DEFAULT_STATE", "OTRS_DEFAULT_PRIORITY"]
     for var in optional_vars:
         value = os.getenv(var, "default")
-        print(f"  {var}: {value}")
+        log(f"  {var}: {value}")
     
     return True
 
+async def serve_with_background_tasks():
+    """Run the stdio server alongside the warm-up and the webhook endpoint"""
+    import asyncio
+    from otrs_mcp.server import close_http_client, config, create_webhook_app, mcp, warm_up_server
+    
+    tasks = []
+    if config.warmup:
+        tasks.append(asyncio.create_task(warm_up_server()))
+    if config.webhook_port:
+        from otrs_mcp.webhook import serve
+        tasks.append(asyncio.create_task(serve(create_webhook_app(), config.webhook_host, config.webhook_port)))
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await close_http_client()
+
 def run_server():
     """Main entry point for the OTRS MCP Server"""
     if not setup_environment():
         sys.exit(1)
     
-    print("\n[START] Starting OTRS MCP Server...")
-    print("[MODE] Running server in standard mode...")
-    print("[OPS] Available operations: SessionCreate, TicketCreate, TicketGet, TicketSearch, TicketUpdate, TicketHistoryGet, ConfigItemGet, ConfigItemSearch")
+    # Deferred so a misconfigured environment fails before the heavy imports
+    import asyncio
+    from otrs_mcp.server import config, mcp
+    
+    log("\n[START] Starting OTRS MCP Server...")
+    log("[MODE] Running server in standard mode...")
+    log("[OPS] Available operations: SessionCreate, TicketCreate, TicketGet, TicketSearch, TicketUpdate, TicketHistoryGet, ConfigItemGet, ConfigItemSearch")
     
     # Run the server with the stdio transport
-    mcp.run(transport="stdio")
+    if config.warmup:
+        log(f"[WARMUP] Warming up connections and metadata (budget {config.warmup_budget}s)")
+    if config.webhook_port:
+        log(f"[WEBHOOK] Receiving OTRS ticket events on http://{config.webhook_host}:{config.webhook_port}/otrs/events")
+    if config.warmup or config.webhook_port:
+        asyncio.run(serve_with_background_tasks())
+    else:
+        mcp.run(transport="stdio")
 
 if __name__ == "__main__":
     run_server()
\ No newline at end of file
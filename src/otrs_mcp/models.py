@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+import sys
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+# Compact, __slots__-based representations of OTRS tickets, articles and
+# history entries. They are used for data the server keeps in memory (the
+# ticket and history caches); tools still return plain dicts. Converting with
+# from_dict()/to_dict() round-trips every key, including ones not listed in
+# FIELDS, which are kept in `extra`.
+
+_MISSING: Any = object()
+
+
+class DynamicFieldSchema:
+    """Ordered dynamic field names shared by every ticket that has the same set"""
+
+    __slots__ = ("names",)
+
+    def __init__(self, names: Tuple[str, ...]):
+        self.names = names
+
+
+_schemas: Dict[Tuple[str, ...], DynamicFieldSchema] = {}
+_MAX_SCHEMAS = 1024
+
+
+def schema_for(names: Tuple[str, ...]) -> DynamicFieldSchema:
+    """Return the cached schema for a tuple of dynamic field names"""
+    schema = _schemas.get(names)
+    if schema is None:
+        schema = DynamicFieldSchema(tuple(sys.intern(name) for name in names))
+        if len(_schemas) < _MAX_SCHEMAS:
+            _schemas[names] = schema
+    return schema
+
+
+class _Record:
+    """Base class mapping known OTRS keys to slots and keeping the rest in `extra`"""
+
+    __slots__ = ("extra",)
+    FIELDS: Tuple[str, ...] = ()
+    # Fields with a small set of repeated values (queue names, states, ...)
+    INTERNED: FrozenSet[str] = frozenset()
+    _FIELD_SET: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Any:
+        record = cls.__new__(cls)
+        record._load(data)
+        return record
+
+    def _load(self, data: Dict[str, Any]) -> None:
+        interned = self.INTERNED
+        for name in self.FIELDS:
+            value = data.get(name, _MISSING)
+            if name in interned and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, name, value)
+        field_set = self._FIELD_SET
+        extra = {key: value for key, value in data.items() if key not in field_set}
+        self.extra: Optional[Dict[str, Any]] = extra or None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not _MISSING:
+                data[name] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self._FIELD_SET:
+            value = getattr(self, name)
+            return default if value is _MISSING else value
+        return (self.extra or {}).get(name, default)
+
+
+class Article(_Record):
+    FIELDS = (
+        "ArticleID", "TicketID", "ArticleNumber", "From", "To", "Cc", "Subject", "Body",
+        "ContentType", "Charset", "MimeType", "CreateTime", "ChangeTime", "IncomingTime",
+        "SenderType", "SenderTypeID", "ArticleType", "ArticleTypeID", "CommunicationChannel",
+        "IsVisibleForCustomer", "MessageID", "ReplyTo", "InReplyTo", "References",
+    )
+    INTERNED = frozenset({
+        "ContentType", "Charset", "MimeType", "SenderType", "SenderTypeID",
+        "ArticleType", "ArticleTypeID", "CommunicationChannel", "TicketID",
+    })
+    __slots__ = FIELDS
+
+
+class HistoryEntry(_Record):
+    FIELDS = (
+        "HistoryID", "TicketID", "ArticleID", "Name", "HistoryType", "HistoryTypeID",
+        "CreateTime", "CreateBy", "OwnerID", "PriorityID", "QueueID", "StateID", "TypeID",
+    )
+    INTERNED = frozenset({
+        "HistoryType", "HistoryTypeID", "CreateBy", "OwnerID", "PriorityID",
+        "QueueID", "StateID", "TypeID", "TicketID",
+    })
+    __slots__ = FIELDS
+
+
+class Ticket(_Record):
+    FIELDS = (
+        "TicketID", "TicketNumber", "Title", "Age", "Created", "Changed", "CreateBy", "ChangeBy",
+        "Queue", "QueueID", "State", "StateID", "StateType", "Priority", "PriorityID",
+        "Type", "TypeID", "Lock", "LockID", "Owner", "OwnerID", "Responsible", "ResponsibleID",
+        "CustomerID", "CustomerUserID", "Service", "ServiceID", "SLA", "SLAID",
+        "ArchiveFlag", "UnlockTimeout", "UntilTime", "EscalationTime",
+        "EscalationResponseTime", "EscalationUpdateTime", "EscalationSolutionTime",
+        "RealTillTimeNotUsed", "GroupID",
+    )
+    INTERNED = frozenset({
+        "Queue", "QueueID", "State", "StateID", "StateType", "Priority", "PriorityID",
+        "Type", "TypeID", "Lock", "LockID", "Owner", "OwnerID", "Responsible", "ResponsibleID",
+        "CustomerID", "Service", "ServiceID", "SLA", "SLAID", "ArchiveFlag", "CreateBy",
+        "ChangeBy", "GroupID",
+    })
+    __slots__ = FIELDS + ("dynamic_schema", "dynamic_values", "articles")
+
+    def _load(self, data: Dict[str, Any]) -> None:
+        data = dict(data)
+        self.dynamic_schema: Optional[DynamicFieldSchema] = None
+        self.dynamic_values: Optional[Tuple[Any, ...]] = None
+        self.articles: Optional[Tuple[Article, ...]] = None
+
+        dynamic_fields = data.get("DynamicField")
+        if isinstance(dynamic_fields, list) and all(
+            isinstance(item, dict) and item.keys() == {"Name", "Value"} for item in dynamic_fields
+        ):
+            del data["DynamicField"]
+            self.dynamic_schema = schema_for(tuple(item["Name"] for item in dynamic_fields))
+            self.dynamic_values = tuple(item["Value"] for item in dynamic_fields)
+
+        articles = data.get("Article")
+        if isinstance(articles, list) and all(isinstance(item, dict) for item in articles):
+            del data["Article"]
+            self.articles = tuple(Article.from_dict(item) for item in articles)
+
+        super()._load(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        if self.dynamic_schema is not None and self.dynamic_values is not None:
+            data["DynamicField"] = [
+                {"Name": name, "Value": value}
+                for name, value in zip(self.dynamic_schema.names, self.dynamic_values)
+            ]
+        if self.articles is not None:
+            data["Article"] = [article.to_dict() for article in self.articles]
+        return data
+
+    def dynamic_field(self, name: str, default: Any = None) -> Any:
+        if self.dynamic_schema is None or self.dynamic_values is None:
+            return default
+        try:
+            return self.dynamic_values[self.dynamic_schema.names.index(name)]
+        except ValueError:
+            return default
+
+
+def compact_ticket_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the ticket dicts of a TicketGet result with Ticket objects"""
+    compact = dict(result)
+    tickets = result.get("Ticket")
+    if isinstance(tickets, list):
+        compact["Ticket"] = tuple(Ticket.from_dict(t) if isinstance(t, dict) else t for t in tickets)
+    return compact
+
+
+def expand_ticket_result(compact: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of compact_ticket_result"""
+    result = dict(compact)
+    tickets = compact.get("Ticket")
+    if isinstance(tickets, tuple):
+        result["Ticket"] = [t.to_dict() if isinstance(t, Ticket) else t for t in tickets]
+    return result
+
+
+def compact_history_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the history entries of a TicketHistoryGet result with HistoryEntry objects"""
+    compact = dict(result)
+    histories = result.get("TicketHistory")
+    if isinstance(histories, list):
+        compact["TicketHistory"] = tuple(
+            {**h, "History": tuple(HistoryEntry.from_dict(e) if isinstance(e, dict) else e for e in h["History"])}
+            if isinstance(h, dict) and isinstance(h.get("History"), list) else h
+            for h in histories
+        )
+    return compact
+
+
+def expand_history_result(compact: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of compact_history_result"""
+    result = dict(compact)
+    histories = compact.get("TicketHistory")
+    if isinstance(histories, tuple):
+        result["TicketHistory"] = [
+            {**h, "History": [e.to_dict() if isinstance(e, HistoryEntry) else e for e in h["History"]]}
+            if isinstance(h, dict) and isinstance(h.get("History"), tuple) else h
+            for h in histories
+        ]
+    return result
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+
+import asyncio
+import collections.abc
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+
+def _frame_label(code: Any, roots: List[str]) -> str:
+    """"package/module.py:function" with the path shortened to the importable part"""
+    filename = code.co_filename
+    for root in roots:
+        if filename.startswith(root):
+            filename = filename[len(root):]
+            break
+    return f"{filename}:{code.co_name}".replace(";", ",").replace(" ", "_")
+
+
+def _is_idle(code: Any) -> bool:
+    """True for the event loop waiting in select/epoll, i.e. not using CPU"""
+    return code.co_name in ("select", "poll", "wait") and code.co_filename.endswith(("selectors.py", "threading.py"))
+
+
+class StackSampler:
+    """
+    Samples the Python stacks of every thread from a background thread.
+
+    Busy and idle samples are counted for `loop_thread` only, the thread
+    running the event loop, where all tool calls execute.
+    """
+
+    def __init__(self, interval: float = 0.005, loop_thread: Optional[int] = None):
+        self.interval = interval
+        self.loop_thread = loop_thread if loop_thread is not None else threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.idle = 0
+        self._roots = sorted((path + os.sep for path in sys.path if path), key=len, reverse=True)
+        self._labels: Dict[Any, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="otrs-mcp-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                codes.reverse()
+                if ident == self.loop_thread:
+                    self.samples += 1
+                    if codes and _is_idle(codes[-1]):
+                        self.idle += 1
+                self.stacks[(names.get(ident, str(ident)),) + tuple(codes)] += 1
+
+    def label(self, code: Any) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = _frame_label(code, self._roots)
+        return label
+
+    def folded(self) -> List[str]:
+        """Stacks in the folded format read by flamegraph.pl, speedscope and others"""
+        lines = []
+        for stack, count in self.stacks.most_common():
+            thread, codes = stack[0], stack[1:]
+            frames = [thread.replace(";", ",").replace(" ", "_")] + [self.label(code) for code in codes]
+            lines.append(f"{';'.join(frames)} {count}")
+        return lines
+
+    def top_functions(self, limit: int = 15) -> List[Dict[str, Any]]:
+        """Functions by samples on top of the stack (self time), idle waits excluded"""
+        own: Counter = Counter()
+        for stack, count in self.stacks.items():
+            if len(stack) > 1 and not _is_idle(stack[-1]):
+                own[self.label(stack[-1])] += count
+        busy = max(1, self.samples - self.idle)
+        return [
+            {"Function": name, "Samples": count, "Percent": round(count * 100 / busy, 1)}
+            for name, count in own.most_common(limit)
+        ]
+
+
+class CoroutineStats:
+    """Run and wall time of the coroutines of one name"""
+
+    __slots__ = ("count", "finished", "run", "wall", "longest_step")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.finished = 0
+        self.run = 0.0
+        self.wall = 0.0
+        self.longest_step = 0.0
+
+    def to_dict(self, name: str) -> Dict[str, Any]:
+        return {
+            "Coroutine": name,
+            "Tasks": self.count,
+            "Finished": self.finished,
+            "RunMs": round(self.run * 1000, 3),
+            "WaitMs": round(max(0.0, self.wall - self.run) * 1000, 3),
+            "LongestStepMs": round(self.longest_step * 1000, 3),
+        }
+
+
+class TimedCoroutine(collections.abc.Coroutine):
+    """
+    Wraps a task's coroutine to time each step it runs on the event loop.
+
+    Run time is the sum of send()/throw() calls; the rest of the task's
+    lifetime was spent waiting. A long single step means the coroutine
+    blocked the event loop.
+    """
+
+    def __init__(self, coro: Any, stats: CoroutineStats):
+        self._coro = coro
+        self._stats = stats
+        self._started = time.perf_counter()
+        self._done = False
+        stats.count += 1
+        self.__name__ = getattr(coro, "__name__", type(coro).__name__)
+        self.__qualname__ = getattr(coro, "__qualname__", self.__name__)
+
+    def _step(self, method: Any, *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        except BaseException:
+            self._finish()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._stats.run += elapsed
+            if elapsed > self._stats.longest_step:
+                self._stats.longest_step = elapsed
+
+    def _finish(self) -> None:
+        if not self._done:
+            self._done = True
+            self._stats.finished += 1
+            self._stats.wall += time.perf_counter() - self._started
+
+    def send(self, value: Any) -> Any:
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args: Any) -> Any:
+        return self._step(self._coro.throw, *args)
+
+    def close(self) -> None:
+        self._finish()
+        self._coro.close()
+
+    def __await__(self) -> Any:
+        return self._coro.__await__()
+
+    @property
+    def cr_frame(self) -> Any:
+        return getattr(self._coro, "cr_frame", None)
+
+    @property
+    def cr_code(self) -> Any:
+        return getattr(self._coro, "cr_code", None)
+
+    @property
+    def cr_running(self) -> bool:
+        return getattr(self._coro, "cr_running", False)
+
+    @property
+    def cr_await(self) -> Any:
+        return getattr(self._coro, "cr_await", None)
+
+    def open_wall(self) -> float:
+        """Lifetime so far of a task that has not finished"""
+        return 0.0 if self._done else time.perf_counter() - self._started
+
+
+class CoroutineTimer:
+    """Task factory timing every coroutine started while it is installed"""
+
+    def __init__(self) -> None:
+        self.stats: Dict[str, CoroutineStats] = {}
+        self._open: List[TimedCoroutine] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._previous: Any = None
+
+    def install(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._previous = loop.get_task_factory()
+        loop.set_task_factory(self._factory)
+
+    def uninstall(self) -> None:
+        if self._loop is not None:
+            self._loop.set_task_factory(self._previous)
+            self._loop = None
+
+    def _factory(self, loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> "asyncio.Task[Any]":
+        if asyncio.iscoroutine(coro) and not isinstance(coro, TimedCoroutine):
+            name = getattr(coro, "__qualname__", type(coro).__name__)
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = CoroutineStats()
+            coro = TimedCoroutine(coro, stats)
+            self._open.append(coro)
+        if self._previous is not None:
+            return self._previous(loop, coro, **kwargs)
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    def report(self, limit: int = 20) -> List[Dict[str, Any]]:
+        # Tasks still running count up to now
+        for coro in self._open:
+            wall = coro.open_wall()
+            if wall:
+                coro._stats.wall += wall
+        self._open.clear()
+        ranked = sorted(self.stats.items(), key=lambda item: item[1].run, reverse=True)
+        return [stats.to_dict(name) for name, stats in ranked[:limit]]
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes up a sleeping task"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.lags: List[float] = []
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, loop.time() - expected))
+
+    def stats(self) -> Dict[str, Any]:
+        if not self.lags:
+            return {"Samples": 0}
+        lags = sorted(self.lags)
+
+        def ms(q: float) -> float:
+            return round(lags[min(len(lags) - 1, int(q * len(lags)))] * 1000, 3)
+        return {"Samples": len(lags), "P50Ms": ms(0.5), "P99Ms": ms(0.99), "MaxMs": round(lags[-1] * 1000, 3)}
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a profile is requested while another one is running"""
+
+
+_running = False
+
+
+def is_running() -> bool:
+    return _running
+
+
+async def profile(seconds: float, directory: str, interval: float = 0.005) -> Dict[str, Any]:
+    """
+    Profile the running server for `seconds`.
+
+    Samples every thread's Python stack, the event loop's wake-up lag and
+    the run and wait time of tasks started meanwhile. Writes the stacks in
+    folded format to `directory` and returns a summary.
+    """
+    global _running
+    if _running:
+        raise ProfilerBusy("A profile is already running")
+    _running = True
+    loop = asyncio.get_running_loop()
+    sampler = StackSampler(interval, threading.get_ident())
+    lag = LoopLagMonitor()
+    timer = CoroutineTimer()
+    started = time.time()
+    try:
+        timer.install(loop)
+        lag.start()
+        sampler.start()
+        await asyncio.sleep(seconds)
+    finally:
+        sampler.stop()
+        await lag.stop()
+        timer.uninstall()
+        _running = False
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"otrs-mcp-{time.strftime('%Y%m%d-%H%M%S', time.localtime(started))}.folded")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(sampler.folded()) + "\n")
+
+    busy = sampler.samples - sampler.idle
+    return {
+        "File": path,
+        "Seconds": seconds,
+        "Samples": sampler.samples,
+        "LoopBusyPercent": round(busy * 100 / sampler.samples, 1) if sampler.samples else 0.0,
+        "TopFunctions": sampler.top_functions(),
+        "EventLoopLag": lag.stats(),
+        "Coroutines": timer.report(),
+    }
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` acquisitions per second with bursts up to `burst`.
+
+    Waiters are served in arrival order: the lock is held while a caller sleeps
+    for its tokens, and asyncio.Lock wakes waiters first-in first-out.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        # A bucket that cannot hold a whole token would go into debt on every acquire
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        # Statistics for reporting
+        self.acquired = 0
+        self.delayed = 0
+        self.waiting = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until `tokens` are available and take them; returns the seconds waited"""
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                self._refill()
+                if self._tokens < tokens:
+                    await asyncio.sleep((tokens - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= tokens
+        finally:
+            self.waiting -= 1
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        # Lock hand-off alone takes a few microseconds; only count real throttling
+        if waited >= 0.001:
+            self.delayed += 1
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "RatePerSecond": self.rate,
+            "Burst": self.burst,
+            "AvailableTokens": round(self._tokens, 2),
+            "Acquired": self.acquired,
+            "Delayed": self.delayed,
+            "Waiting": self.waiting,
+            "TotalWaitSeconds": round(self.total_wait, 3),
+            "AverageWaitMs": round(1000 * self.total_wait / self.acquired, 2) if self.acquired else 0.0,
+            "MaxWaitMs": round(1000 * self.max_wait, 2),
+        }
+
+
+def parse_rate_limits(spec: str) -> Dict[str, TokenBucket]:
+    """
+    Parse a rate limit specification such as "TicketSearch=20,TicketCreate=5:10".
+
+    Each entry is `Operation=rate[:burst]` with the rate in requests per second.
+    The operation `*` applies to every operation without its own entry.
+    """
+    limits: Dict[str, TokenBucket] = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        operation, sep, value = entry.partition("=")
+        if not sep or not operation.strip():
+            raise ValueError(f"Invalid rate limit entry {entry!r}, expected Operation=rate[:burst]")
+        rate, _, burst = value.partition(":")
+        limits[operation.strip()] = TokenBucket(
+            float(rate),
+            float(burst) if burst else None
+        )
+    return limits
+
+
+class RateLimiter:
+    """Per-operation token buckets for GenericInterface requests"""
+
+    def __init__(self, buckets: Optional[Dict[str, TokenBucket]] = None):
+        self.buckets = buckets or {}
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "RateLimiter":
+        return cls(parse_rate_limits(spec))
+
+    def bucket_for(self, operation: str) -> Optional[TokenBucket]:
+        return self.buckets.get(operation) or self.buckets.get("*")
+
+    async def acquire(self, operation: str) -> float:
+        """Wait for permission to call `operation`; returns the seconds waited"""
+        bucket = self.bucket_for(operation)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire()
+
+    def stats(self) -> Dict[str, Any]:
+        return {operation: bucket.stats() for operation, bucket in self.buckets.items()}
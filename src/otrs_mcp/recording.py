@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+import json
+import os
+import time
+from typing import Any, Dict, Optional, TextIO
+
+# Keys whose string values are kept when recording in "shape" mode: IDs,
+# numbers, timestamps and small enumerations that replays depend on but that
+# do not identify people or contain ticket text.
+KEEP_KEYS = frozenset({
+    "Queue", "State", "StateType", "Priority", "Type", "Lock", "Changed", "Created",
+    "CreateTime", "ChangeTime", "IncomingTime", "ContentType", "MimeType", "Charset",
+    "SenderType", "ArticleType", "HistoryType", "ArchiveFlag", "Limit", "Class",
+    "DeplState", "InciState", "ErrorCode",
+})
+# Credentials, masked in "full" mode too
+CREDENTIAL_KEYS = frozenset({"SessionID", "Password", "Token", "UserLogin", "ChallengeToken"})
+# Identify customers or mail, or grant access, even though the key ends in ID
+MASK_KEYS = frozenset({"CustomerUserID", "CustomerID", "MessageID"}) | CREDENTIAL_KEYS
+# Mappings keyed by customer login or email, e.g. {"jdoe": "John Doe <john@example.com>"}
+# from CustomerUserSearch; their keys are masked as well
+KEYED_BY_PERSON = frozenset({"CustomerUser", "CustomerUserLogin"})
+KEEP_ARGS = frozenset({
+    "backend", "queue", "state", "priority", "ticket_type", "class_name", "job_id",
+    "deployment_state", "incident_state",
+})
+
+
+def _keep(key: str) -> bool:
+    if key in MASK_KEYS:
+        return False
+    return key in KEEP_KEYS or key.endswith(("ID", "IDs", "Number", "Numbers"))
+
+
+def _mask_key(key: str, index: int) -> str:
+    # Unique per mapping, and as long as the original where possible
+    return f"x{index}".ljust(len(key), "x")
+
+
+def shape(value: Any, keep: bool = False, mask_keys: bool = False) -> Any:
+    """
+    Replace free text with placeholders of the same length.
+
+    Structure, key names, numbers and the strings of keys in KEEP_KEYS (or
+    ending in ID/Number) are kept, so a replay decodes the same amount of
+    JSON and finds the same IDs without storing ticket contents. Key names
+    are masked too in mappings under KEYED_BY_PERSON, whose keys are data.
+    """
+    if isinstance(value, dict):
+        if mask_keys:
+            return {_mask_key(str(key), index): shape(item) for index, (key, item) in enumerate(value.items())}
+        return {key: shape(item, keep or _keep(key), key in KEYED_BY_PERSON) for key, item in value.items()}
+    if isinstance(value, list):
+        return [shape(item, keep) for item in value]
+    if isinstance(value, str) and not keep:
+        return "x" * len(value)
+    return value
+
+
+def redact(value: Any) -> Any:
+    """Mask the values of CREDENTIAL_KEYS and keep everything else"""
+    if isinstance(value, dict):
+        return {key: shape(item) if key in CREDENTIAL_KEYS else redact(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def sanitize_args(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Mask tool arguments except IDs, limits, flags and the names in KEEP_ARGS"""
+    return {
+        name: value if name in KEEP_ARGS or name.endswith(("_id", "_ids")) else shape(value)
+        for name, value in arguments.items()
+    }
+
+
+class Recorder:
+    """
+    Appends tool calls and the OTRS requests they make to a JSONL file.
+
+    Every line is one event. "tool" events hold the sanitized arguments and
+    timing of a top-level tool or resource call; "otrs" events hold one
+    GenericInterface request with its response, linked to the call by
+    trace ID. In "shape" mode (the default) free text in requests and
+    responses is masked; "full" keeps responses as received except for
+    credentials such as session IDs.
+    """
+
+    def __init__(self, path: str = "", responses: str = "shape"):
+        self.path = path
+        self.full = responses == "full"
+        self.events = 0
+        self._file: Optional[TextIO] = None
+
+    @classmethod
+    def from_env(cls) -> "Recorder":
+        return cls(
+            path=os.getenv("OTRS_RECORD_FILE", ""),
+            responses=os.getenv("OTRS_RECORD_RESPONSES", "shape"),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _write(self, event: Dict[str, Any]) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(event, default=str) + "\n")
+        self._file.flush()
+        self.events += 1
+
+    def record_tool(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+        started: float,
+        duration_ms: float,
+        trace_id: str,
+        error: Optional[str] = None,
+    ) -> None:
+        self._write({
+            "type": "tool",
+            "tool": name,
+            "args": sanitize_args(arguments),
+            "start": started,
+            "duration_ms": round(duration_ms, 3),
+            "trace_id": trace_id,
+            "error": error,
+        })
+
+    def record_otrs(
+        self,
+        backend: str,
+        operation: str,
+        data: Optional[Dict[str, Any]],
+        response: Any,
+        duration_ms: float,
+        trace_id: Optional[str],
+        error: Optional[str] = None,
+    ) -> None:
+        self._write({
+            "type": "otrs",
+            "backend": backend,
+            "operation": operation,
+            "request": shape(data or {}),
+            "response": redact(response) if self.full else shape(response),
+            "duration_ms": round(duration_ms, 3),
+            "trace_id": trace_id,
+            "error": error,
+            "time": time.time(),
+        })
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+recorder = Recorder.from_env()
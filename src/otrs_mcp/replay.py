@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Replay recorded tool-call traffic against a fake OTRS
+
+Reads a recording made with OTRS_RECORD_FILE, answers every OTRS request
+from the recorded responses (with their recorded latency) and re-issues
+the recorded tool calls through the MCP server, in the same mix and order.
+Reports throughput, latency percentiles and OTRS round trips per call next
+to the recorded values, so changes to caching, batching or other settings
+(e.g. OTRS_TICKET_CACHE_TTL) can be compared on real traffic.
+
+Usage:
+  python -m otrs_mcp.replay recording.jsonl --speed 1
+  python -m otrs_mcp.replay recording.jsonl --speed 10
+  python -m otrs_mcp.replay recording.jsonl --speed max --concurrency 16
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import logging
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from otrs_mcp import recording
+from otrs_mcp.recording import shape
+
+# OTRS round trips made by the replayed call running in the current task
+_round_trips: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar("otrs_mcp_round_trips", default=None)
+
+
+def load_recording(path: str) -> List[Dict[str, Any]]:
+    """Read recorded events, skipping lines that are not valid JSON objects"""
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(event, dict) and event.get("type") in ("tool", "otrs"):
+                events.append(event)
+    return events
+
+
+def _request_key(operation: str, data: Dict[str, Any]) -> str:
+    # Requests are compared in their recorded (masked) form
+    return operation + " " + json.dumps(shape(data), sort_keys=True, default=str)
+
+
+class FakeOTRS:
+    """
+    Answers GenericInterface requests from recorded OTRS events.
+
+    A request is matched by backend, operation and masked body first, then
+    without the backend. TicketGet requests for other combinations of IDs
+    (e.g. after a batching change) are assembled from every ticket seen in
+    the recording. Anything else gets a recorded response of the same
+    operation, or an OTRS-style error if there is none.
+    """
+
+    def __init__(self, events: Iterable[Dict[str, Any]], latency: bool = True):
+        self.latency = latency
+        self.exact: Dict[Tuple[Optional[str], str], List[Dict[str, Any]]] = defaultdict(list)
+        self.by_operation: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.tickets: Dict[str, Any] = {}
+        self.ticket_get_ms: List[float] = []
+        self._cursor: Dict[Any, int] = defaultdict(int)
+        self.requests = 0
+        self.unmatched = 0
+        for event in events:
+            if event.get("type") != "otrs":
+                continue
+            key = _request_key(event["operation"], event.get("request") or {})
+            self.exact[(event.get("backend"), key)].append(event)
+            self.exact[(None, key)].append(event)
+            self.by_operation[event["operation"]].append(event)
+            response = event.get("response")
+            if event["operation"] == "TicketGet" and isinstance(response, dict):
+                self.ticket_get_ms.append(event.get("duration_ms") or 0.0)
+                for ticket in response.get("Ticket") or []:
+                    if isinstance(ticket, dict) and ticket.get("TicketID") is not None:
+                        self.tickets[str(ticket["TicketID"])] = ticket
+
+    def _next(self, key: Any, candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # Cycle through repeated recordings of the same request in order
+        event = candidates[self._cursor[key] % len(candidates)]
+        self._cursor[key] += 1
+        return event
+
+    def lookup(self, backend: str, operation: str, data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Return (recorded event or None, latency in ms) for a request"""
+        key = _request_key(operation, data)
+        for scope in (backend, None):
+            candidates = self.exact.get((scope, key))
+            if candidates:
+                event = self._next((scope, key), candidates)
+                return event, event.get("duration_ms") or 0.0
+
+        if operation == "TicketGet":
+            ids = [i.strip() for i in str(data.get("TicketID", "")).split(",") if i.strip()]
+            if ids and all(i in self.tickets for i in ids):
+                latency = sorted(self.ticket_get_ms)[len(self.ticket_get_ms) // 2] if self.ticket_get_ms else 0.0
+                return {"response": {"Ticket": [self.tickets[i] for i in ids]}}, latency
+
+        candidates = self.by_operation.get(operation)
+        if candidates:
+            event = self._next(operation, candidates)
+            return event, event.get("duration_ms") or 0.0
+        return None, 0.0
+
+    def transport(self, backend: str) -> httpx.MockTransport:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.requests += 1
+            counter = _round_trips.get()
+            if counter is not None:
+                counter[0] += 1
+            operation = request.url.path.rsplit("/", 1)[-1]
+            data = json.loads(request.content or b"{}")
+            data.pop("UserLogin", None)
+            data.pop("Password", None)
+
+            event, latency_ms = self.lookup(backend, operation, data)
+            if self.latency and latency_ms:
+                await asyncio.sleep(latency_ms / 1000)
+            if event is None:
+                self.unmatched += 1
+                return httpx.Response(200, json={"Error": {
+                    "ErrorCode": "Replay.NoRecordedResponse",
+                    "ErrorMessage": f"No recorded response for {operation}",
+                }})
+            if event.get("error"):
+                return httpx.Response(502, json={"Error": event["error"]})
+            return httpx.Response(200, json=event.get("response") or {})
+        return httpx.MockTransport(handler)
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+
+async def replay(
+    events: List[Dict[str, Any]],
+    speed: Optional[float] = 1.0,
+    concurrency: int = 8,
+    latency: bool = True,
+) -> Dict[str, Any]:
+    """
+    Re-issue the recorded tool calls and return a report.
+
+    With a speed, calls start at their recorded offsets divided by the speed
+    (open loop, so slow calls overlap as they would in production). With
+    speed None, calls run back to back with `concurrency` in flight.
+    """
+    # Imported here so the server's configuration is read after argument parsing
+    from otrs_mcp import server
+
+    recording.recorder = recording.Recorder()
+    fake = FakeOTRS(events, latency)
+    for backend in server.backends.backends.values():
+        backend._http_client = httpx.AsyncClient(transport=fake.transport(backend.name))
+
+    calls = sorted((e for e in events if e["type"] == "tool"), key=lambda e: e.get("start") or 0.0)
+    results: List[Dict[str, Any]] = []
+
+    async def run(call: Dict[str, Any]) -> None:
+        counter = [0]
+        _round_trips.set(counter)
+        error = None
+        started = time.perf_counter()
+        try:
+            # Called like FastMCP calls it, and timed the same way as when recorded
+            await getattr(server, call["tool"])(**(call.get("args") or {}))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        results.append({
+            "tool": call["tool"],
+            "ms": (time.perf_counter() - started) * 1000,
+            "round_trips": counter[0],
+            "error": error,
+        })
+
+    started = time.perf_counter()
+    if speed is None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(call: Dict[str, Any]) -> None:
+            async with semaphore:
+                await run(call)
+        await asyncio.gather(*(limited(call) for call in calls))
+    else:
+        tasks = []
+        first = (calls[0].get("start") or 0.0) if calls else 0.0
+        for call in calls:
+            delay = ((call.get("start") or 0.0) - first) / speed - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(run(call)))
+        await asyncio.gather(*tasks)
+    wall = time.perf_counter() - started
+    await server.close_http_client()
+
+    return summarize(events, results, wall, fake)
+
+
+def summarize(events: List[Dict[str, Any]], results: List[Dict[str, Any]], wall: float, fake: FakeOTRS) -> Dict[str, Any]:
+    """Compare replayed calls with the recorded ones, overall and per tool"""
+    round_trips_by_trace: Dict[str, int] = defaultdict(int)
+    for event in events:
+        if event["type"] == "otrs" and event.get("trace_id"):
+            round_trips_by_trace[event["trace_id"]] += 1
+
+    recorded: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: {"ms": [], "round_trips": []})
+    for event in events:
+        if event["type"] == "tool":
+            recorded[event["tool"]]["ms"].append(event.get("duration_ms") or 0.0)
+            recorded[event["tool"]]["round_trips"].append(round_trips_by_trace.get(event.get("trace_id"), 0))
+
+    replayed: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: {"ms": [], "round_trips": []})
+    errors: Dict[str, int] = defaultdict(int)
+    for result in results:
+        replayed[result["tool"]]["ms"].append(result["ms"])
+        replayed[result["tool"]]["round_trips"].append(result["round_trips"])
+        if result["error"]:
+            errors[result["tool"]] += 1
+
+    def mean(values: List[float]) -> Optional[float]:
+        return round(sum(values) / len(values), 3) if values else None
+
+    all_ms = [r["ms"] for r in results]
+    tools = []
+    for name in sorted(replayed, key=lambda n: -len(replayed[n]["ms"])):
+        data = replayed[name]
+        tools.append({
+            "Tool": name,
+            "Calls": len(data["ms"]),
+            "Errors": errors[name],
+            "P50Ms": percentile(data["ms"], 0.5),
+            "P90Ms": percentile(data["ms"], 0.9),
+            "P99Ms": percentile(data["ms"], 0.99),
+            "MaxMs": percentile(data["ms"], 1.0),
+            "RoundTripsPerCall": mean(data["round_trips"]),
+            "RecordedP50Ms": percentile(recorded[name]["ms"], 0.5),
+            "RecordedRoundTripsPerCall": mean(recorded[name]["round_trips"]),
+        })
+    recorded_round_trips = [rt for data in recorded.values() for rt in data["round_trips"]]
+    return {
+        "Calls": len(results),
+        "Errors": sum(errors.values()),
+        "Seconds": round(wall, 3),
+        "CallsPerSecond": round(len(results) / wall, 1) if wall > 0 else None,
+        "P50Ms": percentile(all_ms, 0.5),
+        "P90Ms": percentile(all_ms, 0.9),
+        "P99Ms": percentile(all_ms, 0.99),
+        "MaxMs": percentile(all_ms, 1.0),
+        "OTRSRequests": fake.requests,
+        "UnmatchedRequests": fake.unmatched,
+        "RoundTripsPerCall": mean([r["round_trips"] for r in results]),
+        "RecordedRoundTripsPerCall": mean(recorded_round_trips),
+        "Tools": tools,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    def fmt(value: Any) -> str:
+        return "-" if value is None else f"{value:.1f}" if isinstance(value, float) else str(value)
+
+    print(f"Calls: {report['Calls']} ({report['Errors']} errors) in {report['Seconds']:.2f} s, "
+          f"{fmt(report['CallsPerSecond'])} calls/s")
+    print(f"Latency ms: p50 {fmt(report['P50Ms'])}  p90 {fmt(report['P90Ms'])}  "
+          f"p99 {fmt(report['P99Ms'])}  max {fmt(report['MaxMs'])}")
+    print(f"OTRS round trips per call: {fmt(report['RoundTripsPerCall'])} "
+          f"(recorded {fmt(report['RecordedRoundTripsPerCall'])}), "
+          f"{report['UnmatchedRequests']} of {report['OTRSRequests']} requests had no recorded response")
+    print()
+    print(f"{'tool':28}{'calls':>7}{'errors':>7}{'p50 ms':>9}{'p99 ms':>9}{'rec p50':>9}{'trips':>7}{'rec':>7}")
+    for tool in report["Tools"]:
+        print(f"{tool['Tool'][:27]:28}{tool['Calls']:>7}{tool['Errors']:>7}{fmt(tool['P50Ms']):>9}"
+              f"{fmt(tool['P99Ms']):>9}{fmt(tool['RecordedP50Ms']):>9}"
+              f"{fmt(tool['RoundTripsPerCall']):>7}{fmt(tool['RecordedRoundTripsPerCall']):>7}")
+
+
+def parse_speed(value: str) -> Optional[float]:
+    if value == "max":
+        return None
+    speed = float(value.rstrip("x"))
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive or 'max'")
+    return speed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", help="JSONL file written with OTRS_RECORD_FILE")
+    parser.add_argument("--speed", type=parse_speed, default=1.0, help="1, 10 (times the recorded pace) or max")
+    parser.add_argument("--concurrency", type=int, default=8, help="Calls in flight with --speed max")
+    parser.add_argument("--no-latency", action="store_true", help="Answer OTRS requests immediately")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+    # The fake OTRS answers many requests per second; keep httpx from logging each one
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    events = load_recording(args.recording)
+    if not any(e["type"] == "tool" for e in events):
+        print(f"No tool calls recorded in {args.recording}", file=sys.stderr)
+        return 1
+    report = asyncio.run(replay(events, args.speed, args.concurrency, not args.no_latency))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,68 +1,197 @@
 #!/usr/bin/env python
 
+import asyncio
 import os
 import json
+import re
 import sys
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass
-import httpx
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
-import dotenv
 from mcp.server.fastmcp import FastMCP
+from pydantic import AnyUrl
 
-dotenv.load_dotenv()
-mcp = FastMCP("OTRS API MCP")
+from otrs_mcp.backends import ALL_BACKENDS, Backend, BackendRegistry
+from otrs_mcp.config import OTRSConfig
+from otrs_mcp import jsonutil
+from otrs_mcp.jobs import FINISHED_STATES, JOB_COMPLETED, Job, JobManager
+from otrs_mcp.articles import article_view
+from otrs_mcp.models import (
+    Article,
+    compact_history_result,
+    compact_ticket_result,
+    expand_history_result,
+    expand_ticket_result,
+)
+from otrs_mcp.tracing import span, traced_tool, tracer
+from otrs_mcp.webhook import WebhookStats
+from otrs_mcp.warmup import warm_up
+from otrs_mcp.watch import TOOL_WATCHER, WatchedTicket
 
-@dataclass
-class OTRSConfig:
-    base_url: str = os.getenv("OTRS_BASE_URL", "https://192.168.5.159/otrs/nph-genericinterface.pl/Webservice/TestInterface")
-    username: str = os.getenv("OTRS_USERNAME", "seasonpoon.admin")
-    password: str = os.getenv("OTRS_PASSWORD", "HOJTDVKm")
-    verify_ssl: bool = os.getenv("OTRS_VERIFY_SSL", "false").lower() == "true"
-    default_queue: str = os.getenv("OTRS_DEFAULT_QUEUE", "Raw")
-    default_state: str = os.getenv("OTRS_DEFAULT_STATE", "new")
-    default_priority: str = os.getenv("OTRS_DEFAULT_PRIORITY", "3 normal")
-    default_type: str = os.getenv("OTRS_DEFAULT_TYPE", "Unclassified")
-    # Extract web interface base URL from API URL
-    web_base_url: str = os.getenv("OTRS_WEB_BASE_URL", "https://192.168.5.159/otrs")
+mcp = FastMCP("OTRS API MCP")
 
 config = OTRSConfig()
+backends = BackendRegistry.from_env(config, os.getenv("OTRS_DEFAULT_BACKEND"))
+jobs = JobManager(max_concurrency=config.job_concurrency)
+webhook_stats = WebhookStats()
+# Tickets per TicketGet request in exports
+EXPORT_BATCH_SIZE = 50
+_refresh_tasks: "set[asyncio.Task[Any]]" = set()
 
-def get_ticket_web_url(ticket_id: str) -> str:
+async def close_http_client() -> None:
+    """Close the pooled connections of every backend"""
+    await backends.close()
+
+def get_ticket_web_url(ticket_id: str, backend: Optional[str] = None) -> str:
     """Generate the web interface URL for a ticket"""
-    return f"{config.web_base_url}/index.pl?Action=AgentTicketZoom;TicketID={ticket_id}"
+    return f"{backends.get(backend).config.web_base_url}/index.pl?Action=AgentTicketZoom;TicketID={ticket_id}"
 
-def get_ticket_history_web_url(ticket_id: str) -> str:
+def get_ticket_history_web_url(ticket_id: str, backend: Optional[str] = None) -> str:
     """Generate the web interface URL for ticket history"""
-    return f"{config.web_base_url}/index.pl?Action=AgentTicketHistory;TicketID={ticket_id}"
+    return f"{backends.get(backend).config.web_base_url}/index.pl?Action=AgentTicketHistory;TicketID={ticket_id}"
+
+def get_config_item_web_url(config_item_id: str, backend: Optional[str] = None) -> str:
+    """Generate the web interface URL for a configuration item"""
+    return f"{backends.get(backend).config.web_base_url}/index.pl?Action=AgentITSMConfigItemZoom;ConfigItemID={config_item_id}"
 
-def get_ticket_search_web_url() -> str:
+def get_ticket_search_web_url(backend: Optional[str] = None) -> str:
     """Generate the web interface URL for ticket search"""
-    return f"{config.web_base_url}/index.pl?Action=AgentTicketSearch"
+    return f"{backends.get(backend).config.web_base_url}/index.pl?Action=AgentTicketSearch"
 
-async def make_api_request_with_auth(operation: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
+async def make_api_request_with_auth(operation: str, data: Dict[str, Any] = None, backend: Optional[str] = None) -> Dict[str, Any]:
     """Make API request using UserLogin/Password authentication (no session) - matches working test exactly"""
-    url = f"{config.base_url}/{operation}"
+    return await backends.get(backend).request(operation, data)
+
+async def handle_ticket_event(backend: str, event_name: str, ticket_id: str) -> None:
+    """Invalidate cached data of a ticket that OTRS reported as changed"""
+    otrs = backends.get(backend)
+    otrs.invalidate_ticket(ticket_id)
+    otrs.watcher.mark_changed(ticket_id)
+    if config.webhook_refresh:
+        # Refresh in the background so the OTRS invoker is answered immediately
+        task = asyncio.create_task(_refresh_ticket(otrs.name, ticket_id))
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+
+async def _refresh_ticket(backend: str, ticket_id: str) -> None:
+    """Re-populate the ticket and history caches after an invalidation"""
+    # The tools run nested in this span, so record mode does not take them for client calls
+    with span("webhook.refresh", backend=backend, ticket_id=ticket_id):
+        try:
+            await asyncio.gather(
+                get_ticket(ticket_id=ticket_id, backend=backend),
+                get_ticket_history(ticket_id=ticket_id, backend=backend)
+            )
+        except Exception:
+            # The next read fetches the ticket anyway
+            pass
+
+def create_webhook_app() -> Any:
+    """Build the local HTTP app receiving OTRS ticket events"""
+    from otrs_mcp.webhook import create_app
     
-    request_data = {
-        "UserLogin": config.username,
-        "Password": config.password
-    }
-    if data:
-        request_data.update(data)
-    
-    async with httpx.AsyncClient(verify=config.verify_ssl, follow_redirects=True, timeout=30) as client:
-        response = await client.post(
-            url,
-            json=request_data,
-            headers={"Content-Type": "application/json", "Accept": "application/json"}
-        )
-        response.raise_for_status()
-        return response.json()
+    return create_app(handle_ticket_event, backends.default, config.webhook_token, webhook_stats)
+
+def _cache_ticket(otrs: Backend, ticket: Dict[str, Any]) -> None:
+    """
+    Store a ticket fetched with dynamic fields and extended data as get_ticket
+    would. Watched tickets are kept by the watcher even when the ticket cache
+    is disabled, so get_ticket answers them from the poller's latest fetch.
+    """
+    ticket_id = str(ticket.get("TicketID"))
+    watched = ticket_id in otrs.watcher.tickets
+    if not otrs.ticket_cache.enabled and not watched:
+        return
+    compact = compact_ticket_result({
+        "Ticket": [ticket],
+        "WebURL": get_ticket_web_url(ticket_id, otrs.name),
+        "HistoryWebURL": get_ticket_history_web_url(ticket_id, otrs.name)
+    })
+    otrs.ticket_cache.set((ticket_id, True, True), compact)
+    if watched:
+        otrs.watcher.remember(ticket_id, compact)
+
+def _on_watched_ticket(otrs: Backend):
+    """Poller callback: refresh caches and notify subscribed sessions of changes"""
+    async def on_ticket(ticket: WatchedTicket, data: Dict[str, Any], changed: bool) -> None:
+        if changed:
+            otrs.invalidate_ticket(ticket.ticket_id)
+        _cache_ticket(otrs, data)
+        if not changed:
+            return
+        for watcher in list(ticket.watchers):
+            if not isinstance(watcher, tuple):
+                continue
+            session, uri = watcher
+            try:
+                await session.send_resource_updated(AnyUrl(uri))
+            except Exception:
+                # The client went away; drop all of its subscriptions
+                otrs.watcher.unwatch_all(lambda w: isinstance(w, tuple) and w[0] is session)
+    return on_ticket
+
+for _backend in backends.backends.values():
+    _backend.watcher.on_ticket = _on_watched_ticket(_backend)
+
+async def _watch_tickets(otrs: Backend, ticket_ids: List[str], watcher: Hashable) -> Dict[str, Any]:
+    """
+    Start watching tickets, recording their current change time.
+
+    Tickets already watched or cached need no request; the rest are fetched
+    in one batched TicketGet, which also fills the ticket cache.
+    """
+    baseline: Dict[str, str] = {}
+    fetch = []
+    for ticket_id in dict.fromkeys(str(t) for t in ticket_ids):
+        watched = otrs.watcher.tickets.get(ticket_id)
+        cached = otrs.ticket_cache.get((ticket_id, True, True))
+        if watched is not None:
+            baseline[ticket_id] = watched.changed
+        elif cached is not None and cached.get("Ticket"):
+            baseline[ticket_id] = str(cached["Ticket"][0].get("Changed") or "")
+        else:
+            fetch.append(ticket_id)
+    
+    fetched: List[Dict[str, Any]] = []
+    if fetch:
+        result = await make_api_request_with_auth("TicketGet", {
+            "TicketID": ",".join(fetch),
+            "DynamicFields": 1,
+            "Extended": 1
+        }, otrs.name)
+        if result.get("Error"):
+            return {"Error": result["Error"]}
+        fetched = result.get("Ticket") or []
+        for ticket in fetched:
+            baseline[str(ticket.get("TicketID"))] = str(ticket.get("Changed") or "")
+    
+    missing = [t for t in fetch if t not in baseline]
+    for ticket_id, changed in baseline.items():
+        otrs.watcher.watch(ticket_id, watcher, changed)
+    for ticket in fetched:
+        _cache_ticket(otrs, ticket)
+    return {"Watching": list(baseline), "NotFound": missing}
+
+async def warm_up_backend(backend: Backend) -> Dict[str, Any]:
+    """Pre-connect, authenticate and prefetch metadata (and customers) for one backend"""
+    backend.warmup_report.clear()
+    steps = [warm_up(backend.request, backend.metadata, config.warmup_budget)]
+    if backend.config.customer_directory:
+        steps.append(asyncio.wait_for(backend.customers.ensure_loaded(backend.request), config.warmup_budget))
+    results = await asyncio.gather(*steps, return_exceptions=True)
+    backend.warmup_report.update(results[0] if isinstance(results[0], dict) else {"Error": str(results[0])})
+    if backend.config.customer_directory:
+        backend.warmup_report["CustomerDirectory"] = backend.customers.stats()
+    return backend.warmup_report
+
+async def warm_up_server() -> Dict[str, Any]:
+    """Warm up every backend concurrently within the configured budget"""
+    reports = await asyncio.gather(*(warm_up_backend(b) for b in backends.backends.values()))
+    return dict(zip(backends.names(), reports))
 
 # ... existing code ...
 
 @mcp.tool(description="Create a new ticket in OTRS")
+@traced_tool
 async def create_ticket(
     title: str,
     body: str,
@@ -70,7 +199,8 @@ async def create_ticket(
     priority: Optional[str] = None,
     state: Optional[str] = None,
     customer_user: Optional[str] = None,
-    ticket_type: Optional[str] = None
+    ticket_type: Optional[str] = None,
+    backend: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Create a new ticket in OTRS using the EXACT working syntax from tests.
@@ -81,20 +211,35 @@ async def create_ticket(
     - queue: Queue name (optional, defaults to "Raw" - use valid queue names only)
     - priority: Priority level (optional, will try multiple formats)
     - state: Ticket state (optional, defaults to "new")
-    - customer_user: Customer user login (IGNORED - always uses "Internal" for reliability)
+    - customer_user: Customer user login or email (resolved against the customer directory
+      when OTRS_CUSTOMER_DIRECTORY is enabled; otherwise, or if unknown, "Internal" is used)
     - ticket_type: Ticket type (optional, defaults to configured default)
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
     """
-    # ALWAYS use "Internal" customer user - this is what works in the test
-    # Don't trust user input for customer_user as it's error-prone
-    resolved_customer_user = "Internal"  # Force to working value from test
+    otrs = backends.get(backend)
+    
+    # Use "Internal" customer user unless the local customer directory knows the
+    # requested one - unchecked input for customer_user is error-prone and
+    # makes TicketCreate fail
+    resolved_customer_user = "Internal"  # Working value from test
+    customer_user_known = None
+    if customer_user:
+        try:
+            login = await otrs.resolve_customer_user(customer_user)
+        except LookupError:
+            customer_user_known = False
+        else:
+            if login:
+                resolved_customer_user = login
+                customer_user_known = True
     
     # Fix queue issue - if invalid queue provided, fall back to working default
-    resolved_queue = queue or config.default_queue
+    resolved_queue = queue or otrs.config.default_queue
     
     # If user provided a queue that might not exist, warn them and use default
-    if queue and queue not in ["Raw", "Junk", "Misc"]:  # Common OTRS default queues
+    if queue and queue not in ["Raw", "Junk", "Misc"] + otrs.metadata.queues:  # Common OTRS default queues and queues seen at warm-up
         # Use the working queue from test instead
-        resolved_queue = config.default_queue  # This is "Raw" which works
+        resolved_queue = otrs.config.default_queue  # This is "Raw" which works
     
     # Use EXACT priority variations from working test
     priority_variations = [
@@ -104,9 +249,19 @@ async def create_ticket(
         "4 high",     # High priority
     ]
     
-    # If priority was provided, try it first, then fallback to variations
-    if priority:
-        priority_variations = [priority] + priority_variations
+    # Priorities seen on this instance during warm-up are known to be valid, so
+    # fallbacks among them are tried first. They never replace the default:
+    # the first one seen is just the priority of some sampled ticket.
+    if otrs.metadata.priorities:
+        known = set(otrs.metadata.priorities)
+        priority_variations = (
+            [p for p in priority_variations if p in known]
+            + [p for p in priority_variations if p not in known]
+        )
+    
+    # The requested priority (or the configured default) is always tried first
+    first_priority = priority or otrs.config.default_priority or "3 normal"
+    priority_variations = [first_priority] + [p for p in priority_variations if p != first_priority]
     
     # Keep track of all attempts for debugging
     attempts = []
@@ -117,9 +272,9 @@ async def create_ticket(
                 "Title": title,
                 "Queue": resolved_queue,  # Use the resolved/validated queue
                 "Priority": priority_attempt,
-                "State": state or config.default_state,  # EXACT from test: self.default_state
-                "Type": ticket_type or config.default_type,  # EXACT from test: self.default_type
-                "CustomerUser": resolved_customer_user  # ALWAYS "Internal" - what works in test
+                "State": state or otrs.config.default_state,  # EXACT from test: self.default_state
+                "Type": ticket_type or otrs.config.default_type,  # EXACT from test: self.default_type
+                "CustomerUser": resolved_customer_user  # "Internal" unless validated locally
             },
             "Article": {
                 "Subject": title,
@@ -129,7 +284,7 @@ async def create_ticket(
             }
         }
         
-        result = await make_api_request_with_auth("TicketCreate", ticket_data)
+        result = await make_api_request_with_auth("TicketCreate", ticket_data, otrs.name)
         
         # Add debug info to this attempt (avoid circular reference)
         attempt_info = {
@@ -147,11 +302,12 @@ async def create_ticket(
         if not result.get("Error"):
             # Success - add web URL and debug info
             if result.get("TicketID"):
-                result["WebURL"] = get_ticket_web_url(str(result["TicketID"]))
+                result["WebURL"] = get_ticket_web_url(str(result["TicketID"]), otrs.name)
             
             # Add debug information (avoid circular reference)
             result["_debug"] = {
                 "successful_priority": priority_attempt,
+                "backend": otrs.name,
                 "request_sent": ticket_data,
                 "attempts_made": len(attempts),
                 "parameter_resolution": {
@@ -160,13 +316,14 @@ async def create_ticket(
                     "queue_changed": queue != resolved_queue,
                     "requested_customer_user": customer_user,
                     "resolved_customer_user": resolved_customer_user,
-                    "customer_user_forced": True  # Always forced to "Internal"
+                    "customer_user_forced": resolved_customer_user != customer_user,
+                    "customer_user_known": customer_user_known
                 },
                 "config_used": {
-                    "default_queue": config.default_queue,
-                    "default_state": config.default_state,
-                    "default_priority": config.default_priority,
-                    "default_type": config.default_type
+                    "default_queue": otrs.config.default_queue,
+                    "default_state": otrs.config.default_state,
+                    "default_priority": otrs.config.default_priority,
+                    "default_type": otrs.config.default_type
                 }
             }
             return result
@@ -183,13 +340,14 @@ async def create_ticket(
                     "queue_changed": queue != resolved_queue,
                     "requested_customer_user": customer_user,
                     "resolved_customer_user": resolved_customer_user,
-                    "customer_user_forced": True  # Always forced to "Internal"
+                    "customer_user_forced": resolved_customer_user != customer_user,
+                    "customer_user_known": customer_user_known
                 },
                 "config_used": {
-                    "default_queue": config.default_queue,
-                    "default_state": config.default_state,
-                    "default_priority": config.default_priority,
-                    "default_type": config.default_type
+                    "default_queue": otrs.config.default_queue,
+                    "default_state": otrs.config.default_state,
+                    "default_priority": otrs.config.default_priority,
+                    "default_type": otrs.config.default_type
                 }
             }
             return result
@@ -206,13 +364,14 @@ async def create_ticket(
             "queue_changed": queue != resolved_queue,
             "requested_customer_user": customer_user,
             "resolved_customer_user": resolved_customer_user,
-            "customer_user_forced": True  # Always forced to "Internal"
+            "customer_user_forced": resolved_customer_user != customer_user,
+            "customer_user_known": customer_user_known
         },
         "config_used": {
-            "default_queue": config.default_queue,
-            "default_state": config.default_state,
-            "default_priority": config.default_priority,
-            "default_type": config.default_type
+            "default_queue": otrs.config.default_queue,
+            "default_state": otrs.config.default_state,
+            "default_priority": otrs.config.default_priority,
+            "default_type": otrs.config.default_type
         }
     }
     return result  # Return last attempt result - EXACT from test
@@ -220,10 +379,12 @@ async def create_ticket(
 # ... rest of existing code ...
 
 @mcp.tool(description="Get ticket details from OTRS")
+@traced_tool
 async def get_ticket(
     ticket_id: str,
     include_dynamic_fields: bool = True,
-    include_extended_data: bool = True
+    include_extended_data: bool = True,
+    backend: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get detailed information about a specific ticket using working test syntax.
@@ -231,23 +392,124 @@ async def get_ticket(
     Parameters:
     - ticket_id: The ticket ID to retrieve
     - include_dynamic_fields: Include dynamic field data
-    - include_extended_data: Include extended ticket information
+    - include_extended_data: Include extended ticket information (use get_ticket_articles to read long threads)
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
     """
+    otrs = backends.get(backend)
+    full = include_dynamic_fields and include_extended_data
+    cache_key = (str(ticket_id), include_dynamic_fields, include_extended_data)
+    cached = otrs.ticket_cache.get(cache_key)
+    if cached is None and full:
+        # The watch poller keeps watched tickets current
+        cached = otrs.watcher.latest(ticket_id)
+    if cached is not None:
+        return expand_ticket_result(cached)
+    
     ticket_data = {
         "TicketID": ticket_id,
         "DynamicFields": 1 if include_dynamic_fields else 0,
         "Extended": 1 if include_extended_data else 0
     }
     
-    result = await make_api_request_with_auth("TicketGet", ticket_data)
+    result = await make_api_request_with_auth("TicketGet", ticket_data, otrs.name)
     
     # Add web interface URLs
-    result["WebURL"] = get_ticket_web_url(ticket_id)
-    result["HistoryWebURL"] = get_ticket_history_web_url(ticket_id)
+    result["WebURL"] = get_ticket_web_url(ticket_id, otrs.name)
+    result["HistoryWebURL"] = get_ticket_history_web_url(ticket_id, otrs.name)
     
+    watched = full and str(ticket_id) in otrs.watcher.tickets
+    if not result.get("Error") and (otrs.ticket_cache.enabled or watched):
+        # Cached as compact Ticket objects; see otrs_mcp.models
+        compact = compact_ticket_result(result)
+        otrs.ticket_cache.set(cache_key, compact)
+        if watched:
+            otrs.watcher.remember(ticket_id, compact)
     return result
 
+@mcp.tool(description="Get a window of a ticket's articles (newest first by default) with truncated bodies")
+@traced_tool
+async def get_ticket_articles(
+    ticket_id: str,
+    offset: int = 0,
+    limit: int = 5,
+    newest_first: bool = True,
+    max_body_chars: int = 2000,
+    strip_html: bool = True,
+    backend: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Read a slice of a ticket's articles without loading the whole thread.
+    Only offset + limit articles are requested from OTRS, and articles are
+    cached individually, so paging through a long ticket stays cheap.
+    
+    Parameters:
+    - ticket_id: The ticket ID
+    - offset: Number of articles to skip (default: 0)
+    - limit: Number of articles to return (default: 5)
+    - newest_first: Order articles from newest to oldest (default: True)
+    - max_body_chars: Truncate each body to this many characters (0 for no limit, default: 2000)
+    - strip_html: Convert HTML bodies to plain text (default: True)
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+    offset = max(0, offset)
+    limit = max(1, limit)
+    wanted = offset + limit
+    index_key = (str(ticket_id), newest_first)
+    
+    # Article IDs seen for this ticket, in the requested order; complete=True
+    # means OTRS returned fewer articles than asked for, so there are no more
+    index = otrs.article_index_cache.get(index_key)
+    articles: Optional[List[Article]] = None
+    requests_made = 0
+    if index is not None and (index["complete"] or len(index["ids"]) >= wanted):
+        window_ids = index["ids"][offset:wanted]
+        cached = [otrs.article_cache.get((str(ticket_id), article_id)) for article_id in window_ids]
+        if all(article is not None for article in cached):
+            articles = cached
+            complete = index["complete"] and len(index["ids"]) <= wanted
+    
+    if articles is None:
+        result = await make_api_request_with_auth("TicketGet", {
+            "TicketID": ticket_id,
+            "DynamicFields": 0,
+            "Extended": 0,
+            "AllArticles": 1,
+            "ArticleOrder": "DESC" if newest_first else "ASC",
+            "ArticleLimit": wanted
+        }, otrs.name)
+        requests_made = 1
+        if result.get("Error"):
+            return result
+        tickets = result.get("Ticket") or [{}]
+        raw_articles = tickets[0].get("Article") or []
+        if isinstance(raw_articles, dict):
+            raw_articles = [raw_articles]
+        fetched = [Article.from_dict(a) for a in raw_articles]
+        complete = len(fetched) < wanted
+        # Cached articles are only found through the index
+        if otrs.article_index_cache.enabled:
+            for article in fetched:
+                otrs.article_cache.set((str(ticket_id), str(article.get("ArticleID"))), article)
+            otrs.article_index_cache.set(index_key, {
+                "ids": [str(article.get("ArticleID")) for article in fetched],
+                "complete": complete
+            })
+        articles = fetched[offset:wanted]
+    
+    return {
+        "TicketID": ticket_id,
+        "Offset": offset,
+        "Limit": limit,
+        "Order": "newest_first" if newest_first else "oldest_first",
+        "Articles": [article_view(article, max_body_chars, strip_html) for article in articles],
+        "HasMore": not complete,
+        "Requests": requests_made,
+        "WebURL": get_ticket_web_url(ticket_id, otrs.name)
+    }
+
 @mcp.tool(description="Search for tickets in OTRS")
+@traced_tool
 async def search_tickets(
     customer_user: Optional[str] = None,
     queue: Optional[str] = None,
@@ -256,7 +518,8 @@ async def search_tickets(
     title: Optional[str] = None,
     limit: int = 50,
     sort_by: str = "Age",
-    order_by: str = "Down"
+    order_by: str = "Down",
+    backend: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Search for tickets in OTRS using working test syntax.
@@ -270,6 +533,8 @@ async def search_tickets(
     - limit: Maximum number of results (default: 50)
     - sort_by: Sort field (Age, Created, etc.)
     - order_by: Sort order (Up/Down)
+    - backend: Name of the OTRS backend, or "all" to search every backend concurrently
+      (the limit then applies per backend and results are merged)
     """
     search_data = {
         "Limit": limit,
@@ -290,15 +555,37 @@ async def search_tickets(
     if title:
         search_data["Title"] = title
     
-    result = await make_api_request_with_auth("TicketSearch", search_data)
+    selected = backends.select(backend)
+    if len(selected) == 1:
+        return await _search_backend(selected[0], search_data)
+    
+    # Fan out to every backend at once and merge the per-backend results
+    results = await asyncio.gather(
+        *(_search_backend(b, search_data) for b in selected),
+        return_exceptions=True
+    )
+    merged: Dict[str, Any] = {"TicketID": [], "TicketWebURLs": [], "Backends": {}}
+    for b, result in zip(selected, results):
+        if isinstance(result, Exception):
+            merged["Backends"][b.name] = {"Error": {"ErrorCode": "RequestFailed", "ErrorMessage": str(result)}}
+            continue
+        merged["Backends"][b.name] = result
+        merged["TicketID"].extend(result.get("TicketID") or [])
+        merged["TicketWebURLs"].extend(result.get("TicketWebURLs", []))
+    return merged
+
+async def _search_backend(otrs: Backend, search_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run TicketSearch on one backend and add web interface URLs"""
+    result = await make_api_request_with_auth("TicketSearch", search_data, otrs.name)
     
     # Add web interface URLs for each ticket in results
     if result.get("TicketID") and isinstance(result["TicketID"], list):
-        result["WebSearchURL"] = get_ticket_search_web_url()
+        result["WebSearchURL"] = get_ticket_search_web_url(otrs.name)
         result["TicketWebURLs"] = [
             {
                 "TicketID": ticket_id,
-                "WebURL": get_ticket_web_url(str(ticket_id))
+                "Backend": otrs.name,
+                "WebURL": get_ticket_web_url(str(ticket_id), otrs.name)
             }
             for ticket_id in result["TicketID"]
         ]
@@ -306,6 +593,7 @@ async def search_tickets(
     return result
 
 @mcp.tool(description="Update an existing ticket in OTRS")
+@traced_tool
 async def update_ticket(
     ticket_id: str,
     title: Optional[str] = None,
@@ -313,7 +601,8 @@ async def update_ticket(
     priority: Optional[str] = None,
     state: Optional[str] = None,
     customer_user: Optional[str] = None,
-    owner: Optional[str] = None
+    owner: Optional[str] = None,
+    backend: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Update an existing ticket in OTRS using working test syntax.
@@ -326,7 +615,27 @@ async def update_ticket(
     - state: New ticket state
     - customer_user: New customer user
     - owner: New ticket owner
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
     """
+    otrs = backends.get(backend)
+    
+    # Reject unknown customers locally instead of spending a TicketUpdate on them
+    if customer_user:
+        try:
+            customer_user = await otrs.resolve_customer_user(customer_user) or customer_user
+        except LookupError:
+            return {
+                "Error": {
+                    "ErrorCode": "TicketUpdate.InvalidCustomerUser",
+                    "ErrorMessage": f"Unknown customer user {customer_user!r}"
+                },
+                "Suggestions": otrs.customers.search(customer_user, 5),
+                "WebURL": get_ticket_web_url(ticket_id, otrs.name)
+            }
+    
+    # Cached copies are stale as soon as an update is attempted
+    otrs.invalidate_ticket(ticket_id)
+    
     # Build update data
     updates = {}
     if title:
@@ -353,14 +662,14 @@ async def update_ticket(
                 "Ticket": test_updates
             }
             
-            result = await make_api_request_with_auth("TicketUpdate", update_data)
+            result = await make_api_request_with_auth("TicketUpdate", update_data, otrs.name)
             
             # If successful, return result
             if not result.get("Error"):
-                result["WebURL"] = get_ticket_web_url(ticket_id)
+                result["WebURL"] = get_ticket_web_url(ticket_id, otrs.name)
                 return result
             elif "Priority" not in str(result.get("Error", {})):
-                result["WebURL"] = get_ticket_web_url(ticket_id)
+                result["WebURL"] = get_ticket_web_url(ticket_id, otrs.name)
                 return result
         
         return result
@@ -371,34 +680,539 @@ async def update_ticket(
             "Ticket": updates
         }
         
-        result = await make_api_request_with_auth("TicketUpdate", update_data)
-        result["WebURL"] = get_ticket_web_url(ticket_id)
+        result = await make_api_request_with_auth("TicketUpdate", update_data, otrs.name)
+        result["WebURL"] = get_ticket_web_url(ticket_id, otrs.name)
         return result
 
 @mcp.tool(description="Get ticket history from OTRS")
+@traced_tool
 async def get_ticket_history(
-    ticket_id: str
+    ticket_id: str,
+    backend: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get the history of a specific ticket using working test syntax.
     
     Parameters:
     - ticket_id: The ticket ID to get history for
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
     """
+    otrs = backends.get(backend)
+    cached = otrs.history_cache.get(str(ticket_id))
+    if cached is not None:
+        return expand_history_result(cached)
+    
     history_data = {
         "TicketID": ticket_id
     }
     
-    result = await make_api_request_with_auth("TicketHistoryGet", history_data)
+    result = await make_api_request_with_auth("TicketHistoryGet", history_data, otrs.name)
     
     # Add web interface URLs
-    result["WebURL"] = get_ticket_web_url(ticket_id)
-    result["HistoryWebURL"] = get_ticket_history_web_url(ticket_id)
+    result["WebURL"] = get_ticket_web_url(ticket_id, otrs.name)
+    result["HistoryWebURL"] = get_ticket_history_web_url(ticket_id, otrs.name)
     
+    if not result.get("Error") and otrs.history_cache.enabled:
+        otrs.history_cache.set(str(ticket_id), compact_history_result(result))
     return result
 
+# Ticket watches
+@mcp.tool(description="Watch tickets for changes; all watched tickets are checked together by one poller")
+@traced_tool
+async def watch_ticket(ticket_ids: List[str], backend: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Watch tickets instead of polling get_ticket in a loop.
+    
+    The server checks every watched ticket of a backend with one TicketSearch
+    per interval and fetches only the tickets that changed. Read the changes
+    with get_ticket_changes; get_ticket and the otrs://ticket resources answer
+    watched tickets from the poller's latest fetch, without a request.
+    
+    Parameters:
+    - ticket_ids: Ticket IDs to watch
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+    result = await _watch_tickets(otrs, ticket_ids, TOOL_WATCHER)
+    if result.get("Error"):
+        return {"Error": result["Error"], "Backend": otrs.name}
+    return {
+        "Backend": otrs.name,
+        "Watching": otrs.watcher.watched(TOOL_WATCHER),
+        "NotFound": result["NotFound"],
+        "PollIntervalSeconds": otrs.watcher.interval
+    }
+
+@mcp.tool(description="Stop watching tickets")
+@traced_tool
+async def unwatch_ticket(ticket_ids: List[str], backend: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Stop watching tickets started with watch_ticket.
+    
+    Parameters:
+    - ticket_ids: Ticket IDs to stop watching
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+    removed = [str(t) for t in ticket_ids if otrs.watcher.unwatch(str(t), TOOL_WATCHER)]
+    return {"Backend": otrs.name, "Removed": removed, "Watching": otrs.watcher.watched(TOOL_WATCHER)}
+
+@mcp.tool(description="Get changes detected on watched tickets since the last call")
+@traced_tool
+async def get_ticket_changes(drain: bool = True, backend: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Return ticket changes found by the watch poller, oldest first.
+    
+    Parameters:
+    - drain: Remove the returned changes so the next call only shows new ones (default: true)
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+    changes = otrs.watcher.drain() if drain else list(otrs.watcher.changes)
+    return {
+        "Backend": otrs.name,
+        "Changes": changes,
+        "Watching": otrs.watcher.watched(TOOL_WATCHER),
+        "Poller": otrs.watcher.stats()
+    }
+
+# Customer users
+@mcp.tool(description="Autocomplete customer users by login, email or name prefix from the local directory")
+@traced_tool
+async def search_customer_users(
+    prefix: str,
+    limit: int = 10,
+    refresh: bool = False,
+    backend: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Search the in-memory customer user directory. The directory is loaded with
+    CustomerUserSearch on first use and refreshed periodically, so lookups do
+    not reach OTRS.
+    
+    Parameters:
+    - prefix: Start of a login, email address, first or last name
+    - limit: Maximum number of results (default: 10)
+    - refresh: Reload the directory from OTRS first
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+    if not otrs.config.customer_directory:
+        return {"Error": {"ErrorCode": "CustomerDirectory.Disabled", "ErrorMessage": "Set OTRS_CUSTOMER_DIRECTORY=true to enable the customer directory"}}
+    if refresh:
+        refreshed = await otrs.customers.refresh(otrs.request)
+        if refreshed.get("Error"):
+            return refreshed
+    elif not await otrs.customers.ensure_loaded(otrs.request):
+        return {"Error": {"ErrorCode": "CustomerDirectory.Unavailable", "ErrorMessage": otrs.customers.error}}
+    return {
+        "CustomerUsers": otrs.customers.search(prefix, limit),
+        "Directory": otrs.customers.stats()
+    }
+
+# Configuration items (CMDB)
+@mcp.tool(description="Get many configuration items (CMDB) at once, batched and cached")
+@traced_tool
+async def get_config_items(
+    config_item_ids: List[str],
+    backend: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get configuration items by ID. IDs are sent in batches per ConfigItemGet
+    request, batches are fetched concurrently and results are cached.
+    
+    Parameters:
+    - config_item_ids: The configuration item IDs to retrieve
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+    requested = list(dict.fromkeys(str(ci_id) for ci_id in config_item_ids))
+    
+    found: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for ci_id in requested:
+        cached = otrs.config_item_cache.get(ci_id)
+        if cached is not None:
+            found[ci_id] = cached
+        else:
+            missing.append(ci_id)
+    cache_hits = len(found)
+    
+    batch_size = max(1, otrs.config.config_item_batch_size)
+    batches = [missing[i:i + batch_size] for i in range(0, len(missing), batch_size)]
+    semaphore = asyncio.Semaphore(max(1, otrs.config.config_item_concurrency))
+    errors = []
+    
+    async def fetch(batch: List[str]) -> None:
+        async with semaphore:
+            result = await make_api_request_with_auth(
+                "ConfigItemGet",
+                {"ConfigItemID": ",".join(batch)},
+                otrs.name
+            )
+        if result.get("Error"):
+            errors.append({"ConfigItemIDs": batch, "Error": result["Error"]})
+            return
+        items = result.get("ConfigItem") or []
+        if isinstance(items, dict):
+            items = [items]
+        for item in items:
+            ci_id = str(item.get("ConfigItemID"))
+            item["WebURL"] = get_config_item_web_url(ci_id, otrs.name)
+            otrs.config_item_cache.set(ci_id, item)
+            found[ci_id] = item
+    
+    await asyncio.gather(*(fetch(batch) for batch in batches))
+    
+    failed = {ci_id for error in errors for ci_id in error["ConfigItemIDs"]}
+    return {
+        "ConfigItem": [found[ci_id] for ci_id in requested if ci_id in found],
+        "NotFound": [ci_id for ci_id in requested if ci_id not in found and ci_id not in failed],
+        "Errors": errors,
+        "CacheHits": cache_hits,
+        "Requests": len(batches)
+    }
+
+@mcp.tool(description="Search configuration items (CMDB), optionally returning their full data")
+@traced_tool
+async def search_config_items(
+    class_name: Optional[str] = None,
+    name: Optional[str] = None,
+    number: Optional[str] = None,
+    deployment_state: Optional[str] = None,
+    incident_state: Optional[str] = None,
+    limit: int = 50,
+    resolve: bool = False,
+    backend: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Search configuration items in the OTRS CMDB. Results are cached.
+    
+    Parameters:
+    - class_name: Filter by config item class (e.g. "Computer")
+    - name: Filter by name (supports * wildcards)
+    - number: Filter by config item number
+    - deployment_state: Filter by deployment state (e.g. "Production")
+    - incident_state: Filter by incident state (e.g. "Operational")
+    - limit: Maximum number of results (default: 50)
+    - resolve: Also fetch the matching config items in the same call
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+    criteria: Dict[str, Any] = {"Limit": limit}
+    if class_name:
+        criteria["Class"] = class_name
+    if name:
+        criteria["Name"] = name
+    if number:
+        criteria["Number"] = number
+    if deployment_state:
+        criteria["DeplStates"] = [deployment_state]
+    if incident_state:
+        criteria["InciStates"] = [incident_state]
+    
+    cache_key = json.dumps(criteria, sort_keys=True)
+    result = otrs.config_item_search_cache.get(cache_key)
+    if result is None:
+        result = await make_api_request_with_auth("ConfigItemSearch", {"ConfigItem": criteria}, otrs.name)
+        if result.get("Error"):
+            return result
+        otrs.config_item_search_cache.set(cache_key, result)
+    result = dict(result)
+    
+    if resolve and result.get("ConfigItemIDs"):
+        result["ConfigItems"] = await get_config_items(
+            config_item_ids=[str(ci_id) for ci_id in result["ConfigItemIDs"]],
+            backend=otrs.name
+        )
+    return result
+
+# Background jobs for long-running operations
+@mcp.tool(description="Start a background export of tickets matching a search; returns a job ID")
+@traced_tool
+async def submit_ticket_export(
+    queue: Optional[str] = None,
+    state: Optional[str] = None,
+    priority: Optional[str] = None,
+    customer_user: Optional[str] = None,
+    title: Optional[str] = None,
+    limit: int = 1000,
+    include_dynamic_fields: bool = False,
+    include_extended_data: bool = False,
+    backend: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Search tickets and fetch them in batches in a background job.
+    
+    Parameters:
+    - queue, state, priority, customer_user, title: Search filters as in search_tickets
+    - limit: Maximum number of tickets to export (default: 1000)
+    - include_dynamic_fields: Include dynamic field data for each ticket
+    - include_extended_data: Include extended ticket information for each ticket
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+
+    async def export(job: Job) -> Dict[str, Any]:
+        job.update(message="Searching tickets")
+        search = await search_tickets(
+            customer_user=customer_user,
+            queue=queue,
+            state=state,
+            priority=priority,
+            title=title,
+            limit=limit,
+            backend=otrs.name
+        )
+        if search.get("Error"):
+            raise RuntimeError(f"TicketSearch failed: {search['Error']}")
+        ticket_ids = search.get("TicketID") or []
+        job.update(done=0, total=len(ticket_ids), message="Fetching tickets")
+        
+        tickets = []
+        errors = []
+        # TicketGet accepts comma-separated IDs, so fetch many tickets per request
+        for start in range(0, len(ticket_ids), EXPORT_BATCH_SIZE):
+            batch = [str(ticket_id) for ticket_id in ticket_ids[start:start + EXPORT_BATCH_SIZE]]
+            result = await make_api_request_with_auth("TicketGet", {
+                "TicketID": ",".join(batch),
+                "DynamicFields": 1 if include_dynamic_fields else 0,
+                "Extended": 1 if include_extended_data else 0
+            }, otrs.name)
+            if result.get("Error"):
+                errors.extend({"TicketID": ticket_id, "Error": result["Error"]} for ticket_id in batch)
+            else:
+                tickets.extend(result.get("Ticket", []))
+            job.advance(len(batch))
+        
+        job.update(message="Export finished")
+        return {"Tickets": tickets, "Count": len(tickets), "Errors": errors}
+    
+    job = jobs.submit("ticket_export", export)
+    return job.to_status()
+
+@mcp.tool(description="Start a background update of many tickets with the same changes; returns a job ID")
+@traced_tool
+async def submit_bulk_update(
+    ticket_ids: List[str],
+    title: Optional[str] = None,
+    queue: Optional[str] = None,
+    priority: Optional[str] = None,
+    state: Optional[str] = None,
+    customer_user: Optional[str] = None,
+    owner: Optional[str] = None,
+    backend: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Apply the same update to a list of tickets in a background job.
+    
+    Parameters:
+    - ticket_ids: The ticket IDs to update
+    - title, queue, priority, state, customer_user, owner: Fields to change as in update_ticket
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+
+    async def bulk_update(job: Job) -> Dict[str, Any]:
+        job.update(done=0, total=len(ticket_ids), message="Updating tickets")
+        updated = []
+        errors = []
+        for ticket_id in ticket_ids:
+            result = await update_ticket(
+                ticket_id=ticket_id,
+                title=title,
+                queue=queue,
+                priority=priority,
+                state=state,
+                customer_user=customer_user,
+                owner=owner,
+                backend=otrs.name
+            )
+            if result.get("Error"):
+                errors.append({"TicketID": ticket_id, "Error": result["Error"]})
+            else:
+                updated.append(ticket_id)
+            job.advance()
+        
+        job.update(message="Bulk update finished")
+        return {"Updated": updated, "Errors": errors}
+    
+    job = jobs.submit("bulk_update", bulk_update)
+    return job.to_status()
+
+@mcp.tool(description="Get progress, throughput and ETA of a background job")
+@traced_tool
+async def job_status(job_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Report the status of one background job, or of all known jobs.
+    
+    Parameters:
+    - job_id: The job ID returned when the job was submitted (omit to list all jobs)
+    """
+    if job_id is None:
+        return {"Jobs": [job.to_status() for job in jobs.jobs.values()]}
+    job = jobs.get(job_id)
+    if job is None:
+        return {"Error": {"ErrorCode": "JobNotFound", "ErrorMessage": f"Unknown job ID {job_id}"}}
+    return job.to_status()
+
+@mcp.tool(description="Get a page of the result of a finished background job")
+@traced_tool
+async def job_result(job_id: str, offset: int = 0, limit: int = 100) -> Dict[str, Any]:
+    """
+    Return the result of a completed job, or its status if it has not completed.
+    
+    Lists in the result (e.g. the Tickets of an export) are paged, so a large
+    export is read in several calls instead of one multi-megabyte response.
+    
+    Parameters:
+    - job_id: The job ID returned when the job was submitted
+    - offset: Index of the first list entry to return (default: 0)
+    - limit: Maximum number of entries per list (default: 100)
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        return {"Error": {"ErrorCode": "JobNotFound", "ErrorMessage": f"Unknown job ID {job_id}"}}
+    status = job.to_status()
+    if job.status == JOB_COMPLETED:
+        offset = max(0, offset)
+        limit = max(1, limit)
+        result = job.result
+        if isinstance(result, dict):
+            totals = {key: len(value) for key, value in result.items() if isinstance(value, list)}
+            result = {
+                key: value[offset:offset + limit] if key in totals else value
+                for key, value in result.items()
+            }
+            status["Page"] = {
+                "Offset": offset,
+                "Limit": limit,
+                "Totals": totals,
+                "HasMore": any(total > offset + limit for total in totals.values())
+            }
+        status["Result"] = result
+    return status
+
+@mcp.tool(description="Cancel a queued or running background job")
+@traced_tool
+async def job_cancel(job_id: str) -> Dict[str, Any]:
+    """
+    Cancel a background job. Work already sent to OTRS is not rolled back.
+    
+    Parameters:
+    - job_id: The job ID returned when the job was submitted
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        return {"Error": {"ErrorCode": "JobNotFound", "ErrorMessage": f"Unknown job ID {job_id}"}}
+    if job.status in FINISHED_STATES:
+        return job.to_status()
+    jobs.cancel(job_id)
+    # Give the task a chance to process the cancellation before reporting
+    await asyncio.sleep(0)
+    return job.to_status()
+
+@mcp.tool(description="Show configured OTRS rate limits and time spent waiting on them")
+@traced_tool
+async def rate_limit_status(backend: Optional[str] = ALL_BACKENDS) -> Dict[str, Any]:
+    """
+    Report the token bucket of every rate-limited operation, including how many
+    requests were delayed and how long callers waited in total.
+    
+    Parameters:
+    - backend: Name of the OTRS backend (defaults to "all")
+    """
+    return {"RateLimits": {b.name: b.rate_limiter.stats() for b in backends.select(backend)}}
+
+@mcp.tool(description="Show queue, state, priority and type names known from warm-up")
+@traced_tool
+async def get_ticket_metadata(refresh: bool = False, backend: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Return the queue, state, priority and type names collected from recent tickets.
+    
+    Parameters:
+    - refresh: Run the warm-up again before answering
+    - backend: Name of the OTRS backend (optional, defaults to the default backend)
+    """
+    otrs = backends.get(backend)
+    if refresh or otrs.metadata.loaded_at is None:
+        await warm_up_backend(otrs)
+    return {"Backend": otrs.name, "Metadata": otrs.metadata.to_dict(), "WarmUp": otrs.warmup_report}
+
+@mcp.tool(description="List the configured OTRS backends")
+@traced_tool
+async def list_backends() -> Dict[str, Any]:
+    """
+    List the configured OTRS backends with their web URLs, cache statistics
+    and per-operation request latency (including hedged requests).
+    """
+    return {
+        "Default": backends.default,
+        "Webhook": webhook_stats.to_dict() if config.webhook_port else None,
+        "Backends": [
+            {
+                "Name": b.name,
+                "WebBaseURL": b.config.web_base_url,
+                "TicketCache": b.ticket_cache.stats(),
+                "HistoryCache": b.history_cache.stats(),
+                "ConfigItemCache": b.config_item_cache.stats(),
+                "CustomerDirectory": b.customers.stats() if b.config.customer_directory else None,
+                "Requests": b.hedger.stats(),
+                "Watcher": b.watcher.stats()
+            }
+            for b in backends.backends.values()
+        ]
+    }
+
+@mcp.tool(description="Show the most recent slow tool calls with their OTRS sub-call timings")
+@traced_tool
+async def get_slow_calls(limit: int = 10) -> Dict[str, Any]:
+    """
+    Return recent tool-call traces that exceeded the slow-call threshold.
+    Each trace has a root span for the tool and child spans for every OTRS
+    request, with rate limit wait, connect, TLS, server, serialization and
+    JSON decode times.
+    
+    Parameters:
+    - limit: Maximum number of traces to return, newest first (default: 10)
+    """
+    traces = list(tracer.recent_slow)[-limit:] if limit > 0 else []
+    return {"SlowThresholdMs": tracer.slow_ms, "Traces": traces[::-1]}
+
+@mcp.tool(description="Admin: start profiling the running server for N seconds in the background; returns a job ID")
+@traced_tool
+async def profile_server(seconds: float = 10, interval_ms: float = 5) -> Dict[str, Any]:
+    """
+    Sample Python stacks, event loop lag and per-coroutine run versus wait
+    time inside the live server. Stacks are written in folded format (for
+    flamegraph.pl or speedscope) to OTRS_PROFILE_DIR. Only available with
+    OTRS_PROFILING=true.
+    
+    The profile runs as a background job so long profiles do not hit client
+    timeouts; read the summary with job_result.
+    
+    Parameters:
+    - seconds: How long to profile, up to 300 (default: 10)
+    - interval_ms: Milliseconds between stack samples (default: 5)
+    """
+    if not config.profiling:
+        return {"Error": {"ErrorCode": "Profiling.Disabled", "ErrorMessage": "Set OTRS_PROFILING=true to enable profiling"}}
+    from otrs_mcp import profiling
+    
+    if profiling.is_running():
+        return {"Error": {"ErrorCode": "Profiling.Busy", "ErrorMessage": "A profile is already running"}}
+    seconds = min(max(seconds, 0.1), 300)
+    
+    async def run_profile(job: Job) -> Dict[str, Any]:
+        job.update(message=f"Profiling for {seconds:g}s")
+        return await profiling.profile(seconds, config.profile_dir, max(interval_ms, 1) / 1000)
+    
+    job = jobs.submit("profile", run_profile)
+    return job.to_status()
+
 # Resources for easy data access
 @mcp.resource("otrs://ticket/{ticket_id}")
+@traced_tool
 async def ticket_resource(ticket_id: str) -> str:
     """
     Resource that returns ticket data with web interface links.
@@ -408,11 +1222,12 @@ async def ticket_resource(ticket_id: str) -> str:
     """
     try:
         ticket = await get_ticket(ticket_id=ticket_id)
-        return json.dumps(ticket, indent=2)
+        return jsonutil.dumps(ticket)
     except Exception as e:
         return f"Error retrieving ticket: {str(e)}"
 
 @mcp.resource("otrs://ticket/{ticket_id}/history")
+@traced_tool
 async def ticket_history_resource(ticket_id: str) -> str:
     """
     Resource that returns ticket history with web interface links.
@@ -422,21 +1237,106 @@ async def ticket_history_resource(ticket_id: str) -> str:
     """
     try:
         history = await get_ticket_history(ticket_id=ticket_id)
-        return json.dumps(history, indent=2)
+        return jsonutil.dumps(history)
     except Exception as e:
         return f"Error retrieving ticket history: {str(e)}"
 
+@mcp.resource("otrs://backend/{backend}/ticket/{ticket_id}")
+@traced_tool
+async def backend_ticket_resource(backend: str, ticket_id: str) -> str:
+    """
+    Resource that returns ticket data from a named backend.
+    
+    Parameters:
+    - backend: The OTRS backend name
+    - ticket_id: The ticket ID
+    """
+    try:
+        ticket = await get_ticket(ticket_id=ticket_id, backend=backend)
+        return jsonutil.dumps(ticket)
+    except Exception as e:
+        return f"Error retrieving ticket: {str(e)}"
+
+@mcp.resource("otrs://backend/{backend}/ticket/{ticket_id}/history")
+@traced_tool
+async def backend_ticket_history_resource(backend: str, ticket_id: str) -> str:
+    """
+    Resource that returns ticket history from a named backend.
+    
+    Parameters:
+    - backend: The OTRS backend name
+    - ticket_id: The ticket ID
+    """
+    try:
+        history = await get_ticket_history(ticket_id=ticket_id, backend=backend)
+        return jsonutil.dumps(history)
+    except Exception as e:
+        return f"Error retrieving ticket history: {str(e)}"
+
+@mcp.resource("otrs://configitem/{config_item_id}")
+@traced_tool
+async def config_item_resource(config_item_id: str) -> str:
+    """
+    Resource that returns configuration item data with a web interface link.
+    
+    Parameters:
+    - config_item_id: The configuration item ID
+    """
+    try:
+        config_items = await get_config_items(config_item_ids=[config_item_id])
+        return jsonutil.dumps(config_items)
+    except Exception as e:
+        return f"Error retrieving configuration item: {str(e)}"
+
 @mcp.resource("otrs://search/tickets")
+@traced_tool
 async def search_tickets_resource() -> str:
     """
     Resource that returns recent tickets with web interface links.
     """
     try:
         tickets = await search_tickets(limit=20)
-        return json.dumps(tickets, indent=2)
+        return jsonutil.dumps(tickets)
     except Exception as e:
         return f"Error searching tickets: {str(e)}"
 
+# Resource subscriptions for tickets, served by the same poller as watch_ticket
+_TICKET_URI = re.compile(r"^otrs://(?:backend/(?P<backend>[^/]+)/)?ticket/(?P<ticket_id>[^/]+)$")
+
+def parse_ticket_uri(uri: str) -> Optional[Tuple[Optional[str], str]]:
+    """Return (backend, ticket ID) for a ticket resource URI, or None"""
+    match = _TICKET_URI.match(uri)
+    return (match["backend"], match["ticket_id"]) if match else None
+
+@mcp._mcp_server.subscribe_resource()
+async def subscribe_resource(uri: AnyUrl) -> None:
+    parsed = parse_ticket_uri(str(uri))
+    if parsed is None:
+        raise ValueError(f"Only otrs://ticket/{{ticket_id}} resources can be subscribed, not {uri}")
+    backend, ticket_id = parsed
+    session = mcp._mcp_server.request_context.session
+    result = await _watch_tickets(backends.get(backend), [ticket_id], (session, str(uri)))
+    if result.get("Error") or result["NotFound"]:
+        raise ValueError(f"Cannot subscribe to {uri}: {result.get('Error') or 'ticket not found'}")
+
+@mcp._mcp_server.unsubscribe_resource()
+async def unsubscribe_resource(uri: AnyUrl) -> None:
+    parsed = parse_ticket_uri(str(uri))
+    if parsed is not None:
+        backend, ticket_id = parsed
+        backends.get(backend).watcher.unwatch(ticket_id, (mcp._mcp_server.request_context.session, str(uri)))
+
+def _get_capabilities_with_subscribe(get_capabilities):
+    """FastMCP always advertises resources without subscribe support"""
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+    return wrapper
+
+mcp._mcp_server.get_capabilities = _get_capabilities_with_subscribe(mcp._mcp_server.get_capabilities)
+
 if __name__ == "__main__":
     print(f"🚀 Starting OTRS MCP Server...")
     mcp.run()
\ No newline at end of file
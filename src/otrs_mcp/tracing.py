@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import logging.handlers
+import os
+import secrets
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+import httpx
+
+from otrs_mcp import recording
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("otrs_mcp_span", default=None)
+
+# Children kept per span; a job touching thousands of tickets would otherwise
+# hold (and export) one span per request until it finishes
+MAX_CHILDREN = 200
+
+
+class Span:
+    """
+    A timed operation within a tool call trace.
+
+    Only the first MAX_CHILDREN children are kept; later ones still time
+    their block but are only counted in `dropped_children`.
+    """
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent", "attributes", "children", "dropped_children",
+        "start_time", "_start_perf", "duration_ms", "error", "finished"
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, **attributes: Any):
+        self.name = name
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.attributes: Dict[str, Any] = dict(attributes)
+        self.children: List["Span"] = []
+        self.dropped_children = 0
+        self.start_time = time.time()
+        self._start_perf = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.finished = False
+        if parent:
+            if len(parent.children) < MAX_CHILDREN:
+                parent.children.append(self)
+            else:
+                parent.dropped_children += 1
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.duration_ms = (time.perf_counter() - self._start_perf) * 1000
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.finished = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "span_id": self.span_id,
+            "start": self.start_time,
+            "duration_ms": round(self.duration_ms or 0.0, 3),
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        if self.dropped_children:
+            data["dropped_children"] = self.dropped_children
+        return data
+
+    def walk(self) -> Iterator["Span"]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time a block as a child of the current span, or as a new trace root.
+
+    A parent that already finished (e.g. a tool that submitted a background
+    job) does not adopt new children; the block starts its own trace instead.
+    """
+    parent = _current_span.get()
+    if parent is not None and parent.finished:
+        parent = None
+    current = Span(name, parent, **attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.finish(e)
+        raise
+    else:
+        current.finish()
+    finally:
+        _current_span.reset(token)
+        if current.parent is None:
+            tracer.record(current)
+
+
+def traced_tool(func: F) -> F:
+    """
+    Wrap an MCP tool or resource function in a root span named after it.
+
+    In record mode, top-level calls are also written to the recording with
+    their arguments (calls made by other tools are not, as replaying the
+    outer call repeats them).
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with span(f"tool.{func.__name__}") as current:
+            if current.parent is not None or not recording.recorder.enabled:
+                return await func(*args, **kwargs)
+            error = None
+            try:
+                return await func(*args, **kwargs)
+            except BaseException as e:
+                error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                recording.recorder.record_tool(
+                    func.__name__,
+                    dict(signature.bind_partial(*args, **kwargs).arguments),
+                    current.start_time,
+                    (time.perf_counter() - current._start_perf) * 1000,
+                    current.trace_id,
+                    error,
+                )
+    return wrapper  # type: ignore[return-value]
+
+
+class HttpTimings:
+    """
+    Collect connection phase timings from httpx/httpcore trace events.
+
+    Pass `extensions={"trace": timings.trace}` on a request; afterwards
+    `as_dict()` returns connect, TLS, server and download times in ms.
+    """
+
+    def __init__(self) -> None:
+        self.events: Dict[str, float] = {}
+
+    async def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        self.events[event_name] = time.perf_counter()
+
+    def _between(self, start: str, end: str) -> Optional[float]:
+        started = self._find(start)
+        ended = self._find(end)
+        if started is None or ended is None:
+            return None
+        return round((ended - started) * 1000, 3)
+
+    def _find(self, suffix: str) -> Optional[float]:
+        # Event names are prefixed with the protocol, e.g. "http11." or "http2."
+        for name, value in self.events.items():
+            if name.endswith(suffix):
+                return value
+        return None
+
+    def as_dict(self) -> Dict[str, Any]:
+        timings = {
+            "connect_ms": self._between("connect_tcp.started", "connect_tcp.complete"),
+            "tls_ms": self._between("start_tls.started", "start_tls.complete"),
+            "server_ms": self._between("send_request_body.complete", "receive_response_headers.complete"),
+            "download_ms": self._between("receive_response_body.started", "receive_response_body.complete"),
+        }
+        timings["connection_reused"] = timings["connect_ms"] is None
+        return {key: value for key, value in timings.items() if value is not None}
+
+
+class Tracer:
+    """Writes slow traces to a rotating JSONL file and optionally exports all traces as OTLP"""
+
+    def __init__(
+        self,
+        path: str = "",
+        slow_ms: float = 1000.0,
+        max_bytes: int = 10 * 1024 * 1024,
+        backups: int = 5,
+        otlp_endpoint: str = "",
+        service_name: str = "otrs-mcp-server",
+        keep_recent: int = 50,
+    ):
+        self.slow_ms = slow_ms
+        self.otlp_endpoint = otlp_endpoint
+        self.service_name = service_name
+        self.recent_slow: Deque[Dict[str, Any]] = deque(maxlen=keep_recent)
+        self._logger: Optional[logging.Logger] = None
+        self._otlp_client: Optional[httpx.AsyncClient] = None
+        self._pending: "set[asyncio.Task[Any]]" = set()
+        if path:
+            self._logger = logging.getLogger(f"otrs_mcp.traces.{id(self)}")
+            self._logger.propagate = False
+            self._logger.setLevel(logging.INFO)
+            handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger.addHandler(handler)
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        return cls(
+            path=os.getenv("OTRS_TRACE_FILE", ""),
+            slow_ms=float(os.getenv("OTRS_TRACE_SLOW_MS", "1000")),
+            max_bytes=int(os.getenv("OTRS_TRACE_MAX_BYTES", str(10 * 1024 * 1024))),
+            backups=int(os.getenv("OTRS_TRACE_BACKUPS", "5")),
+            otlp_endpoint=os.getenv("OTRS_TRACE_OTLP_ENDPOINT", ""),
+        )
+
+    def record(self, root: Span) -> None:
+        """Handle a finished trace"""
+        if root.duration_ms is not None and root.duration_ms >= self.slow_ms:
+            trace = {"trace_id": root.trace_id, **root.to_dict()}
+            self.recent_slow.append(trace)
+            if self._logger is not None:
+                self._logger.info(json.dumps(trace, default=str))
+        if self.otlp_endpoint:
+            self._export_otlp(root)
+
+    def _export_otlp(self, root: Span) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._post_otlp(root))
+        # Keep a reference until the export completes
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _post_otlp(self, root: Span) -> None:
+        if self._otlp_client is None:
+            self._otlp_client = httpx.AsyncClient(timeout=5)
+        try:
+            await self._otlp_client.post(self.otlp_endpoint, json=to_otlp(root, self.service_name))
+        except httpx.HTTPError:
+            # A missing collector must never affect tool calls
+            pass
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(root: Span, service_name: str) -> Dict[str, Any]:
+    """Convert a trace into an OTLP/HTTP JSON ExportTraceServiceRequest"""
+    spans = []
+    for s in root.walk():
+        start_ns = int(s.start_time * 1e9)
+        end_ns = start_ns + int((s.duration_ms or 0.0) * 1e6)
+        attributes = dict(s.attributes)
+        if s.dropped_children:
+            attributes["dropped_children"] = s.dropped_children
+        otlp_span: Dict[str, Any] = {
+            "traceId": s.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 2 if s.parent is None else 3,
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()],
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+        }
+        if s.parent is not None:
+            otlp_span["parentSpanId"] = s.parent.span_id
+        spans.append(otlp_span)
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{"scope": {"name": "otrs_mcp"}, "spans": spans}],
+        }]
+    }
+
+
+tracer = Tracer.from_env()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+Request = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class OTRSMetadata:
+    """Queue, state, priority and type names observed on the OTRS instance"""
+    queues: List[str] = field(default_factory=list)
+    states: List[str] = field(default_factory=list)
+    priorities: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    session_id: Optional[str] = None
+    loaded_at: Optional[float] = None
+
+    def record_ticket(self, ticket: Dict[str, Any]) -> None:
+        """Remember the names used by a ticket returned from TicketGet"""
+        for key, values in (
+            ("Queue", self.queues),
+            ("State", self.states),
+            ("Priority", self.priorities),
+            ("Type", self.types),
+        ):
+            value = ticket.get(key)
+            if value and value not in values:
+                values.append(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "Queues": self.queues,
+            "States": self.states,
+            "Priorities": self.priorities,
+            "Types": self.types,
+            "HasSession": self.session_id is not None,
+            "LoadedAt": self.loaded_at,
+        }
+
+
+async def create_session(request: Request, metadata: OTRSMetadata) -> None:
+    """
+    Authenticate once so the TLS connection and OTRS login are warm.
+
+    The SessionID is only reported by get_ticket_metadata; requests keep
+    authenticating with UserLogin/Password.
+    """
+    result = await request("SessionCreate", {})
+    if result.get("SessionID"):
+        metadata.session_id = result["SessionID"]
+
+
+async def prefetch_metadata(request: Request, metadata: OTRSMetadata, sample_size: int = 50) -> None:
+    """
+    Collect queue, state and priority names from recent tickets.
+
+    The standard GenericTicketConnector has no list operations for these, so
+    the names are taken from one TicketSearch and one batched TicketGet.
+    """
+    search = await request("TicketSearch", {
+        "Limit": sample_size,
+        "Result": "ARRAY",
+        "SortBy": "Age",
+        "OrderBy": "Down"
+    })
+    ticket_ids = search.get("TicketID") or []
+    if not ticket_ids:
+        metadata.loaded_at = time.time()
+        return
+
+    tickets = await request("TicketGet", {
+        "TicketID": ",".join(str(ticket_id) for ticket_id in ticket_ids),
+        "DynamicFields": 0,
+        "Extended": 0
+    })
+    for ticket in tickets.get("Ticket", []):
+        metadata.record_ticket(ticket)
+    metadata.loaded_at = time.time()
+
+
+async def warm_up(request: Request, metadata: OTRSMetadata, budget: float, sample_size: int = 50) -> Dict[str, Any]:
+    """
+    Pre-connect, authenticate and prefetch metadata within `budget` seconds.
+
+    SessionCreate and the metadata prefetch run concurrently, which also opens
+    more than one pooled connection. Failures are reported, never raised.
+    """
+    started = time.monotonic()
+    steps = {
+        "SessionCreate": create_session(request, metadata),
+        "Metadata": prefetch_metadata(request, metadata, sample_size),
+    }
+    report: Dict[str, Any] = {"BudgetSeconds": budget, "Steps": {}}
+
+    async def run_step(name: str, step: Awaitable[None]) -> None:
+        step_started = time.monotonic()
+        try:
+            await step
+            report["Steps"][name] = {"Status": "ok"}
+        except Exception as e:
+            report["Steps"][name] = {"Status": "failed", "Error": str(e)}
+        report["Steps"][name]["Seconds"] = round(time.monotonic() - step_started, 3)
+
+    tasks = [asyncio.ensure_future(run_step(name, step)) for name, step in steps.items()]
+    done, pending = await asyncio.wait(tasks, timeout=budget)
+    for task in pending:
+        task.cancel()
+    for name in steps:
+        report["Steps"].setdefault(name, {"Status": "timed out"})
+    report["Seconds"] = round(time.monotonic() - started, 3)
+    return report
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Set
+
+Request = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+# Called with each ticket dict fetched by the poller and whether it changed
+TicketHandler = Callable[["WatchedTicket", Dict[str, Any], bool], Awaitable[None]]
+
+# Watcher key used by the watch_ticket tool; resource subscriptions use (session, uri)
+TOOL_WATCHER = "tools"
+
+
+class WatchedTicket:
+    """A watched ticket, the last change time seen and who is watching it"""
+
+    __slots__ = ("ticket_id", "changed", "confirmed", "watchers", "data")
+
+    def __init__(self, ticket_id: str, changed: str):
+        self.ticket_id = ticket_id
+        self.changed = changed
+        # Fetched twice at the same change time, so nothing happened in that second
+        self.confirmed = False
+        self.watchers: Set[Hashable] = set()
+        # Latest full TicketGet result, kept current by the poller
+        self.data: Optional[Any] = None
+
+
+class TicketWatcher:
+    """
+    Polls every watched ticket of one backend together.
+
+    Each poll is one TicketSearch for the watched IDs changed since the newest
+    change time seen, followed by one batched TicketGet for the tickets it
+    returned. The cost of a quiet poll does not depend on the number of
+    watchers or watched tickets.
+
+    OTRS compares change times by the second and inclusively, so tickets
+    changed exactly at the watermark come back from every search. They are
+    fetched once more to catch changes within the same second and skipped
+    after that.
+    """
+
+    def __init__(self, request: Request, interval: float = 30.0, batch_size: int = 100, history: int = 1000):
+        self.request = request
+        self.interval = max(1.0, interval)
+        self.batch_size = batch_size
+        self.on_ticket: Optional[TicketHandler] = None
+        self.tickets: Dict[str, WatchedTicket] = {}
+        self.changes: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._forced: Set[str] = set()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.polls = 0
+        self.fetched = 0
+        self.detected = 0
+        self.last_poll: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def watch(self, ticket_id: str, watcher: Hashable, changed: str) -> bool:
+        """Add a watcher with the ticket's current change time; returns whether the ticket is new"""
+        ticket_id = str(ticket_id)
+        ticket = self.tickets.get(ticket_id)
+        new = ticket is None
+        if ticket is None:
+            ticket = self.tickets[ticket_id] = WatchedTicket(ticket_id, changed)
+        ticket.watchers.add(watcher)
+        self.start()
+        return new
+
+    def unwatch(self, ticket_id: str, watcher: Hashable) -> bool:
+        """Remove a watcher; the ticket is dropped when nobody watches it any more"""
+        ticket = self.tickets.get(str(ticket_id))
+        if ticket is None or watcher not in ticket.watchers:
+            return False
+        ticket.watchers.discard(watcher)
+        if not ticket.watchers:
+            del self.tickets[ticket.ticket_id]
+        return True
+
+    def unwatch_all(self, matches: Callable[[Hashable], bool]) -> int:
+        """Remove every watcher for which `matches` is true, e.g. a closed session"""
+        removed = 0
+        for ticket in list(self.tickets.values()):
+            for watcher in [w for w in ticket.watchers if matches(w)]:
+                self.unwatch(ticket.ticket_id, watcher)
+                removed += 1
+        return removed
+
+    def mark_changed(self, ticket_id: str) -> None:
+        """Fetch a watched ticket on the next poll, e.g. after a webhook event"""
+        if str(ticket_id) in self.tickets:
+            self._forced.add(str(ticket_id))
+
+    def remember(self, ticket_id: str, data: Optional[Any]) -> None:
+        """Keep the latest TicketGet result of a watched ticket (None forgets it)"""
+        ticket = self.tickets.get(str(ticket_id))
+        if ticket is not None:
+            ticket.data = data
+
+    def latest(self, ticket_id: str) -> Optional[Any]:
+        """The remembered TicketGet result of a watched ticket, if any"""
+        ticket = self.tickets.get(str(ticket_id))
+        return ticket.data if ticket is not None else None
+
+    def watched(self, watcher: Optional[Hashable] = None) -> List[str]:
+        return [t.ticket_id for t in self.tickets.values() if watcher is None or watcher in t.watchers]
+
+    def drain(self) -> List[Dict[str, Any]]:
+        changes = list(self.changes)
+        self.changes.clear()
+        return changes
+
+    async def _changed_since_watermark(self) -> Set[str]:
+        if not self.tickets:
+            return set()
+        watermark = max(t.changed for t in self.tickets.values())
+        result = await self.request("TicketSearch", {
+            "TicketID": list(self.tickets),
+            "TicketChangeTimeNewerDate": watermark,
+            "Limit": len(self.tickets),
+        })
+        if result.get("Error"):
+            raise RuntimeError(f"TicketSearch failed: {result['Error']}")
+        ids = result.get("TicketID") or []
+        candidates = set()
+        for ticket_id in ids if isinstance(ids, list) else [ids]:
+            ticket = self.tickets.get(str(ticket_id))
+            if ticket is not None and not (ticket.changed == watermark and ticket.confirmed):
+                candidates.add(ticket.ticket_id)
+        return candidates
+
+    async def poll(self) -> Dict[str, Any]:
+        """Check every watched ticket once; returns the IDs fetched and changed"""
+        started = time.monotonic()
+        candidates = await self._changed_since_watermark()
+        candidates.update(t for t in self._forced if t in self.tickets)
+        self._forced.clear()
+
+        fetch = sorted(candidates)
+        changed: List[str] = []
+        for start in range(0, len(fetch), self.batch_size):
+            chunk = fetch[start:start + self.batch_size]
+            result = await self.request("TicketGet", {
+                "TicketID": ",".join(chunk),
+                "DynamicFields": 1,
+                "Extended": 1,
+            })
+            if result.get("Error"):
+                raise RuntimeError(f"TicketGet failed: {result['Error']}")
+            self.fetched += len(chunk)
+            for data in result.get("Ticket") or []:
+                ticket = self.tickets.get(str(data.get("TicketID")))
+                if ticket is None:
+                    # Unwatched while the request was running
+                    continue
+                change_time = str(data.get("Changed") or "")
+                is_change = change_time != ticket.changed
+                if is_change:
+                    ticket.changed = change_time
+                    ticket.confirmed = False
+                    changed.append(ticket.ticket_id)
+                    self.detected += 1
+                    self.changes.append({
+                        "TicketID": ticket.ticket_id,
+                        "TicketNumber": data.get("TicketNumber"),
+                        "Title": data.get("Title"),
+                        "State": data.get("State"),
+                        "Changed": change_time,
+                    })
+                else:
+                    ticket.confirmed = True
+                if self.on_ticket is not None:
+                    await self.on_ticket(ticket, data, is_change)
+
+        self.polls += 1
+        self.last_poll = time.time()
+        return {"Fetched": fetch, "Changed": changed, "Seconds": round(time.monotonic() - started, 3)}
+
+    def start(self) -> None:
+        """Start the poller if tickets are watched and it is not running"""
+        if self.tickets and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while self.tickets:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.poll()
+                self.error = None
+            except Exception as e:
+                # Keep polling; the next round may succeed
+                self.error = str(e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "Watched": len(self.tickets),
+            "Watchers": sum(len(t.watchers) for t in self.tickets.values()),
+            "IntervalSeconds": self.interval,
+            "Polls": self.polls,
+            "TicketsFetched": self.fetched,
+            "ChangesDetected": self.detected,
+            "PendingChanges": len(self.changes),
+            "LastPoll": self.last_poll,
+            "Error": self.error,
+        }
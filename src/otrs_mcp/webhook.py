@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+import hmac
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Starlette and uvicorn come with the mcp package; they are imported lazily in
+# create_app/serve so the stdio entry point does not pay for them unless the
+# webhook endpoint is enabled.
+
+EventHandler = Callable[[str, str, str], Awaitable[None]]
+
+TOKEN_HEADER = "X-OTRS-Webhook-Token"
+
+
+@dataclass
+class WebhookStats:
+    received: int = 0
+    invalidated: int = 0
+    rejected: int = 0
+    last_event: Optional[Dict[str, Any]] = None
+    by_event: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "Received": self.received,
+            "Invalidated": self.invalidated,
+            "Rejected": self.rejected,
+            "ByEvent": self.by_event,
+            "LastEvent": self.last_event,
+        }
+
+
+def extract_ticket_events(payload: Any) -> List[Tuple[str, str]]:
+    """
+    Return (event name, ticket ID) pairs from an OTRS invoker payload.
+
+    The HTTP::REST invoker sends whatever the outbound mapping produces, so
+    the common shapes are accepted: a flat {"Event": ..., "TicketID": ...},
+    the default {"Event": {"Event": ..., "TicketID": ...}, "Ticket": {...}},
+    or a list of either.
+    """
+    if isinstance(payload, list):
+        return [event for item in payload for event in extract_ticket_events(item)]
+    if not isinstance(payload, dict):
+        return []
+
+    event = payload.get("Event")
+    event_data = event if isinstance(event, dict) else {}
+    ticket = payload.get("Ticket") if isinstance(payload.get("Ticket"), dict) else {}
+    event_name = (
+        event_data.get("Event")
+        or (event if isinstance(event, str) else None)
+        or payload.get("EventName")
+        or "TicketEvent"
+    )
+    ticket_id = event_data.get("TicketID") or payload.get("TicketID") or ticket.get("TicketID")
+    if not ticket_id:
+        return []
+    return [(str(event_name), str(ticket_id))]
+
+
+def create_app(handler: EventHandler, default_backend: str, token: str = "", stats: Optional[WebhookStats] = None) -> Any:
+    """Build the Starlette app receiving OTRS ticket events"""
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    stats = stats if stats is not None else WebhookStats()
+
+    async def receive(request: Request) -> JSONResponse:
+        if token:
+            supplied = request.headers.get(TOKEN_HEADER) or request.query_params.get("token") or ""
+            if not hmac.compare_digest(supplied, token):
+                stats.rejected += 1
+                return JSONResponse({"Error": "invalid token"}, status_code=401)
+        try:
+            payload = await request.json()
+        except ValueError:
+            stats.rejected += 1
+            return JSONResponse({"Error": "invalid JSON"}, status_code=400)
+
+        backend = request.path_params.get("backend", default_backend)
+        events = extract_ticket_events(payload)
+        stats.received += 1
+        for event_name, ticket_id in events:
+            try:
+                await handler(backend, event_name, ticket_id)
+            except ValueError as e:
+                stats.rejected += 1
+                return JSONResponse({"Error": str(e)}, status_code=404)
+            stats.invalidated += 1
+            stats.by_event[event_name] = stats.by_event.get(event_name, 0) + 1
+            stats.last_event = {"Backend": backend, "Event": event_name, "TicketID": ticket_id}
+        return JSONResponse({"Backend": backend, "Invalidated": [ticket_id for _, ticket_id in events]}, status_code=202)
+
+    return Starlette(routes=[
+        Route("/otrs/events", receive, methods=["POST"]),
+        Route("/otrs/events/{backend}", receive, methods=["POST"]),
+    ])
+
+
+async def serve(app: Any, host: str, port: int) -> None:
+    """
+    Serve the webhook app until the task is cancelled.
+
+    A webhook that cannot start (e.g. the port is in use, which uvicorn
+    reports with sys.exit) is logged and the task ends; the stdio server
+    keeps running without it.
+    """
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning", lifespan="off"))
+    try:
+        await server.serve()
+    except (SystemExit, OSError) as e:
+        reason = f"exit code {e.code}" if isinstance(e, SystemExit) else str(e)
+        print(f"[WEBHOOK] Not receiving events on http://{host}:{port}: {reason}", file=sys.stderr)
+    finally:
+        server.should_exit = True
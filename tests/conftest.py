@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Shared test fixtures
+"""
+
+import json
+
+import httpx
+import pytest
+
+from otrs_mcp import server
+
+
+@pytest.fixture
+def mock_otrs(monkeypatch):
+    """
+    Answer a server backend's GenericInterface requests from a function.
+
+    Call the fixture with `respond(operation, body)`, which returns the JSON
+    response (or an httpx.Response). Returns the list of (operation, body)
+    requests made.
+    """
+    def install(respond, backend=None):
+        requests = []
+
+        def handler(request):
+            operation = request.url.path.rsplit("/", 1)[1]
+            body = json.loads(request.content)
+            requests.append((operation, body))
+            response = respond(operation, body)
+            return response if isinstance(response, httpx.Response) else httpx.Response(200, json=response)
+
+        target = server.backends.get(backend)
+        monkeypatch.setattr(target, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        return requests
+    return install
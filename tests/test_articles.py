@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for windowed article retrieval
+"""
+
+import pytest
+
+from otrs_mcp import server
+from otrs_mcp.articles import article_view, strip_html
+from otrs_mcp.models import Article
+
+TOTAL_ARTICLES = 400
+
+
+@pytest.fixture
+def otrs(mock_otrs):
+    def respond(operation, body):
+        ids = list(range(1, TOTAL_ARTICLES + 1))
+        if body["ArticleOrder"] == "DESC":
+            ids.reverse()
+        articles = [
+            {"ArticleID": str(i), "Subject": f"Message {i}", "Body": f"<p>Body {i}</p>" * 100, "ContentType": "text/html; charset=utf-8"}
+            for i in ids[:body["ArticleLimit"]]
+        ]
+        return {"Ticket": [{"TicketID": body["TicketID"], "Article": articles}]}
+
+    requests = mock_otrs(respond)
+    backend = server.backends.get()
+    backend.article_cache.clear()
+    backend.article_index_cache.clear()
+    return requests
+
+
+async def test_last_five_articles_of_long_ticket(otrs):
+    result = await server.get_ticket_articles("1", limit=5, max_body_chars=50)
+    assert [a["ArticleID"] for a in result["Articles"]] == ["400", "399", "398", "397", "396"]
+    assert otrs[0][1]["ArticleLimit"] == 5
+    assert result["HasMore"] is True
+    first = result["Articles"][0]
+    assert first["BodyTruncated"] is True
+    assert len(first["Body"]) == 50
+    assert "<p>" not in first["Body"]
+
+
+async def test_window_is_served_from_cache(otrs):
+    await server.get_ticket_articles("1", offset=0, limit=10)
+    result = await server.get_ticket_articles("1", offset=5, limit=5)
+    assert result["Requests"] == 0
+    assert [a["ArticleID"] for a in result["Articles"]] == ["395", "394", "393", "392", "391"]
+    assert len(otrs) == 1
+
+    # Invalidation (e.g. a webhook event) forces a fresh article list
+    server.backends.get().invalidate_ticket("1")
+    result = await server.get_ticket_articles("1", offset=5, limit=5)
+    assert result["Requests"] == 1
+
+
+async def test_articles_are_not_cached_without_index(otrs, monkeypatch):
+    backend = server.backends.get()
+    monkeypatch.setattr(backend.article_index_cache, "ttl", 0)
+    await server.get_ticket_articles("1", limit=5)
+    assert len(backend.article_cache) == 0
+    result = await server.get_ticket_articles("1", limit=5)
+    assert result["Requests"] == 1
+
+
+async def test_oldest_first_and_end_of_thread(otrs):
+    result = await server.get_ticket_articles("1", offset=398, limit=5, newest_first=False, strip_html=False)
+    assert [a["ArticleID"] for a in result["Articles"]] == ["399", "400"]
+    assert result["HasMore"] is False
+    assert result["Articles"][0]["Body"].startswith("<p>")
+
+
+def test_strip_html():
+    text = strip_html("<html><head><style>p{}</style></head><p>Hello&nbsp;<b>World</b></p><br>Bye")
+    assert text == "Hello\xa0World\n\nBye"
+    view = article_view(Article.from_dict({"ArticleID": "1", "Body": "plain <b>text</b>", "ContentType": "text/plain"}), strip=True)
+    assert view["Body"] == "plain <b>text</b>"
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for multi-instance backend configuration, routing and caches
+"""
+
+import pytest
+
+from otrs_mcp.backends import Backend, BackendRegistry
+from otrs_mcp.cache import TTLCache
+from otrs_mcp.config import OTRSConfig
+
+
+def test_backend_config_falls_back_to_global(monkeypatch):
+    monkeypatch.setenv("OTRS_EU_BASE_URL", "https://eu.example.com/api")
+    monkeypatch.setenv("OTRS_EU_VERIFY_SSL", "true")
+    monkeypatch.setenv("OTRS_EU_MAX_CONNECTIONS", "3")
+    eu = OTRSConfig.for_backend("eu")
+    us = OTRSConfig.for_backend("us")
+    assert eu.base_url == "https://eu.example.com/api"
+    assert eu.verify_ssl is True
+    assert eu.max_connections == 3
+    assert us.base_url == OTRSConfig().base_url
+
+
+def test_registry_from_env(monkeypatch):
+    monkeypatch.setenv("OTRS_BACKENDS", "eu, us")
+    registry = BackendRegistry.from_env(OTRSConfig(), default="us")
+    assert registry.names() == ["eu", "us"]
+    assert registry.get().name == "us"
+    assert [b.name for b in registry.select("all")] == ["eu", "us"]
+    with pytest.raises(ValueError):
+        registry.get("apac")
+
+
+def test_single_default_backend(monkeypatch):
+    monkeypatch.delenv("OTRS_BACKENDS", raising=False)
+    registry = BackendRegistry.from_env(OTRSConfig())
+    assert registry.names() == ["default"]
+
+
+def test_invalidate_ticket_drops_all_variants():
+    backend = Backend("test", OTRSConfig(ticket_cache_ttl=60))
+    backend.ticket_cache.set(("1", True, True), {"Ticket": []})
+    backend.ticket_cache.set(("1", False, False), {"Ticket": []})
+    backend.ticket_cache.set(("2", True, True), {"Ticket": []})
+    backend.history_cache.set("1", {"TicketHistory": []})
+    backend.invalidate_ticket("1")
+    assert len(backend.ticket_cache) == 1
+    assert backend.history_cache.get("1") is None
+
+
+def test_ttl_cache_expiry_and_lru(monkeypatch):
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    cache.set("d", 4, ttl=-1)
+    assert cache.get("d") is None
+    assert TTLCache(ttl=0).enabled is False
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched, cached configuration item tools
+"""
+
+import pytest
+
+from otrs_mcp import server
+
+
+@pytest.fixture
+def otrs(mock_otrs, monkeypatch):
+    def respond(operation, body):
+        if operation == "ConfigItemSearch":
+            return {"ConfigItemIDs": ["1", "2", "3"]}
+        ids = body["ConfigItemID"].split(",")
+        return {"ConfigItem": [{"ConfigItemID": i, "Name": f"CI {i}"} for i in ids if i != "404"]}
+
+    requests = mock_otrs(respond)
+    backend = server.backends.get()
+    monkeypatch.setattr(backend.config, "config_item_batch_size", 2)
+    backend.config_item_cache.clear()
+    backend.config_item_search_cache.clear()
+    return requests
+
+
+async def test_get_config_items_batches_and_caches(otrs):
+    result = await server.get_config_items(["1", "2", "3", "404", "1"])
+    assert [ci["ConfigItemID"] for ci in result["ConfigItem"]] == ["1", "2", "3"]
+    assert result["NotFound"] == ["404"]
+    assert result["Requests"] == 2
+    assert sorted(body["ConfigItemID"] for _, body in otrs) == ["1,2", "3,404"]
+
+    again = await server.get_config_items(["2", "3"])
+    assert again["CacheHits"] == 2
+    assert again["Requests"] == 0
+    assert len(otrs) == 2
+
+
+async def test_search_config_items_resolves_in_one_call(otrs):
+    result = await server.search_config_items(class_name="Computer", resolve=True)
+    assert result["ConfigItemIDs"] == ["1", "2", "3"]
+    assert len(result["ConfigItems"]["ConfigItem"]) == 3
+    assert otrs[0] == ("ConfigItemSearch", {
+        "UserLogin": server.config.username,
+        "Password": server.config.password,
+        "ConfigItem": {"Limit": 50, "Class": "Computer"},
+    })
+
+    await server.search_config_items(class_name="Computer")
+    assert [operation for operation, _ in otrs].count("ConfigItemSearch") == 1
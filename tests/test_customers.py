@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the customer user directory
+"""
+
+import asyncio
+
+import pytest
+
+from otrs_mcp.backends import Backend
+from otrs_mcp.config import OTRSConfig
+from otrs_mcp.customers import CustomerDirectory, CustomerUser, PrefixIndex, parse_customer_users
+
+
+def test_parse_customer_user_shapes():
+    users = parse_customer_users({"CustomerUser": {"jdoe": "John Doe <john@example.com>"}})
+    assert users[0].to_dict() == {"UserLogin": "jdoe", "UserEmail": "john@example.com", "Name": "John Doe"}
+    users = parse_customer_users({"CustomerUser": [{"UserLogin": "ann", "UserEmail": "ann@example.com", "UserFirstname": "Ann", "UserLastname": "Lee"}]})
+    assert users[0].name == "Ann Lee"
+    assert [u.login for u in parse_customer_users({"CustomerUserLogin": ["a", "b"]})] == ["a", "b"]
+
+
+def test_prefix_index_matches_login_email_and_name():
+    index = PrefixIndex()
+    index.rebuild([
+        CustomerUser("jdoe", "john@example.com", "John Doe"),
+        CustomerUser("jane", "jane@corp.example", "Jane Roe"),
+        CustomerUser("bob", "bob@example.com", "Bob Stone"),
+    ])
+    assert index.search("j") == ["jane", "jdoe"]
+    assert index.search("ROE") == ["jane"]
+    assert index.search("bob@") == ["bob"]
+    assert index.search("j", limit=1) == ["jane"]
+    index.add(CustomerUser("jack", "jack@example.com"))
+    index.add(CustomerUser("jack", "jack@example.com"))
+    assert index.search("ja") == ["jack", "jane"]
+
+
+async def test_directory_refresh_and_resolve():
+    responses = {
+        "*": {"CustomerUser": {"jdoe": "John Doe <john@example.com>", "old": "Old User <old@example.com>"}},
+    }
+
+    async def request(operation, data):
+        assert operation == "CustomerUserSearch"
+        return responses[data["Search"]]
+
+    directory = CustomerDirectory()
+    assert await directory.ensure_loaded(request)
+    assert directory.resolve("JOHN@example.com") == "jdoe"
+    assert directory.resolve("jdoe") == "jdoe"
+    assert directory.resolve("nobody") is None
+
+    # Narrow searches merge, full refreshes replace
+    responses["new*"] = {"CustomerUser": {"newbie": "New Bie <new@example.com>"}}
+    await directory.refresh(request, search="new*")
+    assert directory.resolve("newbie") == "newbie"
+    assert directory.resolve("old") == "old"
+    responses["*"] = {"CustomerUser": {"jdoe": "John Doe <john@example.com>"}}
+    result = await directory.refresh(request)
+    assert result["Removed"] == 2
+    assert directory.resolve("old") is None
+    assert directory.search("john") == [{"UserLogin": "jdoe", "UserEmail": "john@example.com", "Name": "John Doe"}]
+
+
+async def test_directory_reports_errors():
+    async def request(operation, data):
+        return {"Error": {"ErrorCode": "CustomerUserSearch.NotFound"}}
+
+    directory = CustomerDirectory()
+    assert not await directory.ensure_loaded(request)
+    assert "NotFound" in directory.error
+
+
+async def test_stale_directory_reloads_in_background():
+    release = asyncio.Event()
+    searches = []
+
+    async def request(operation, data):
+        searches.append(data["Search"])
+        if len(searches) > 1:
+            await release.wait()
+        return {"CustomerUser": {"jdoe": "John Doe <john@example.com>"}}
+
+    directory = CustomerDirectory(refresh_interval=0)
+    assert await directory.ensure_loaded(request)
+    # Stale: the caller is answered from the loaded directory while it reloads
+    assert await asyncio.wait_for(directory.ensure_loaded(request), 1)
+    assert await directory.ensure_loaded(request)
+    await asyncio.sleep(0)
+    assert searches == ["*", "*"]
+    release.set()
+    await directory.stop()
+
+
+async def test_unknown_customer_is_searched_before_rejecting():
+    users = {"jdoe": "John Doe <john@example.com>"}
+    searches = []
+
+    async def request(operation, data):
+        searches.append(data["Search"])
+        if data["Search"] == "*":
+            return {"CustomerUser": dict(users)}
+        return {"CustomerUser": {login: label for login, label in users.items() if data["Search"] in (login, label)}}
+
+    backend = Backend("test", OTRSConfig(customer_directory=True))
+    backend.request = request
+    assert await backend.resolve_customer_user("jdoe") == "jdoe"
+
+    # Added in OTRS after the directory was loaded
+    users["newbie"] = "New Bie <new@example.com>"
+    assert await backend.resolve_customer_user("newbie") == "newbie"
+    assert await backend.resolve_customer_user("newbie") == "newbie"
+    # Unknown values are remembered instead of searched for again
+    for value in ("nobody", "NOBODY"):
+        with pytest.raises(LookupError):
+            await backend.resolve_customer_user(value)
+    assert searches == ["*", "newbie", "nobody"]
+
+
+async def test_narrow_search_does_not_wait_for_reload():
+    release = asyncio.Event()
+
+    async def request(operation, data):
+        if data["Search"] == "*":
+            await release.wait()
+            return {"CustomerUser": {}}
+        return {"CustomerUser": {"newbie": "New Bie <new@example.com>"}}
+
+    directory = CustomerDirectory()
+    reload = asyncio.ensure_future(directory.refresh(request))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(directory.refresh(request, search="newbie"), 1)
+    assert directory.resolve("newbie") == "newbie"
+    release.set()
+    await reload
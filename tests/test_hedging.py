@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Tests for latency histograms and hedged read requests
+"""
+
+import asyncio
+import itertools
+
+import httpx
+import pytest
+
+from otrs_mcp.backends import Backend
+from otrs_mcp.config import OTRSConfig
+from otrs_mcp.hedging import HedgeBudget, Hedger, LatencyHistogram
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.2)
+    for _ in range(10):
+        histogram.record(5.0)
+    assert histogram.percentile(0.5) == pytest.approx(0.2, rel=0.1)
+    assert histogram.percentile(0.95) == pytest.approx(5.0, rel=0.1)
+    assert histogram.stats()["Samples"] == 100
+
+
+def test_histogram_forgets_old_samples():
+    histogram = LatencyHistogram(window=100)
+    for _ in range(100):
+        histogram.record(5.0)
+    for _ in range(400):
+        histogram.record(0.1)
+    assert histogram.percentile(0.9) == pytest.approx(0.1, rel=0.1)
+
+
+def test_budget_caps_hedges():
+    budget = HedgeBudget(ratio=0.1, burst=1)
+    granted = 0
+    for _ in range(100):
+        budget.on_request()
+        granted += budget.try_acquire()
+    assert granted <= 11
+
+
+def test_only_reads_can_be_hedged():
+    hedger = Hedger.from_spec("TicketGet, TicketSearch", 95, 0.05, 20)
+    assert hedger.operations == {"TicketGet", "TicketSearch"}
+    assert hedger.percentile == 0.95
+    assert not Hedger.from_spec("", 95, 0.05, 20).enabled
+    with pytest.raises(ValueError):
+        Hedger.from_spec("TicketGet,TicketCreate", 95, 0.05, 20)
+
+
+def warm(hedger: Hedger, operation: str, seconds: float, count: int = 50) -> None:
+    for _ in range(count):
+        hedger.record(operation, seconds)
+
+
+async def test_slow_primary_is_hedged():
+    hedger = Hedger(["TicketGet"], percentile=0.95, min_samples=10, min_delay=0.01)
+    warm(hedger, "TicketGet", 0.01)
+
+    async def attempt(hedge: bool) -> str:
+        await asyncio.sleep(0.001 if hedge else 1.0)
+        return "hedge" if hedge else "primary"
+
+    assert await asyncio.wait_for(hedger.run("TicketGet", attempt), 0.5) == "hedge"
+    assert hedger.hedged == 1
+    assert hedger.hedge_wins == 1
+
+
+async def test_fast_primary_and_unlisted_operations_are_not_hedged():
+    hedger = Hedger(["TicketGet"], min_samples=10, min_delay=0.05)
+    warm(hedger, "TicketGet", 0.05)
+    warm(hedger, "TicketCreate", 0.001)
+    calls = []
+
+    async def attempt(hedge: bool) -> bool:
+        calls.append(hedge)
+        return hedge
+
+    assert await hedger.run("TicketGet", attempt) is False
+    assert await hedger.run("TicketCreate", attempt) is False
+    assert calls == [False, False]
+    assert hedger.hedged == 0
+
+
+async def test_failed_attempt_falls_back_to_the_other():
+    hedger = Hedger(["TicketSearch"], min_samples=10, min_delay=0.01)
+    warm(hedger, "TicketSearch", 0.01)
+
+    async def attempt(hedge: bool) -> str:
+        if hedge:
+            raise httpx.ConnectError("node down")
+        await asyncio.sleep(0.05)
+        return "primary"
+
+    assert await hedger.run("TicketSearch", attempt) == "primary"
+
+
+async def test_backend_hedges_slow_ticket_get():
+    config = OTRSConfig(base_url="https://otrs.example.com/api", hedge_operations="TicketGet", hedge_min_samples=5)
+    backend = Backend("default", config)
+    warm(backend.hedger, "TicketGet", 0.01)
+    counter = itertools.count()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # The first request lands on the slow frontend
+        if next(counter) == 0:
+            await asyncio.sleep(2)
+        return httpx.Response(200, json={"Ticket": [{"TicketID": "1"}]})
+
+    backend._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    result = await asyncio.wait_for(backend.request("TicketGet", {"TicketID": "1"}), 1)
+    assert result["Ticket"][0]["TicketID"] == "1"
+    assert backend.hedger.hedge_wins == 1
+    assert backend.hedger.stats()["Latency"]["TicketGet"]["Samples"] > 50
+    await backend.close()
+
+
+async def test_beaten_primary_records_its_latency():
+    hedger = Hedger(["TicketGet"], percentile=0.95, min_samples=10, min_delay=0.01)
+    warm(hedger, "TicketGet", 0.01)
+    delay = hedger.delay_for("TicketGet")
+
+    async def attempt(hedge: bool) -> str:
+        await asyncio.sleep(0.001 if hedge else 1.0)
+        return "hedge" if hedge else "primary"
+
+    assert await hedger.run("TicketGet", attempt) == "hedge"
+    histogram = hedger.histogram("TicketGet")
+    assert histogram.samples == 51
+    # The new sample lies in a bucket at or above the hedge delay
+    assert histogram.percentile(1.0) >= delay
+
+
+async def test_cancelled_caller_cancels_primary():
+    hedger = Hedger(["TicketGet"], min_samples=10, min_delay=0.5)
+    warm(hedger, "TicketGet", 0.5)
+    cancelled = asyncio.Event()
+
+    async def attempt(hedge: bool) -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "primary"
+
+    caller = asyncio.ensure_future(hedger.run("TicketGet", attempt))
+    await asyncio.sleep(0.01)
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+async def test_rate_limit_wait_does_not_trigger_hedge():
+    config = OTRSConfig(
+        base_url="https://otrs.example.com/api",
+        rate_limits="TicketGet=10:1",
+        hedge_operations="TicketGet",
+        hedge_min_samples=5,
+    )
+    backend = Backend("default", config)
+    warm(backend.hedger, "TicketGet", 0.01)
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"Ticket": [{"TicketID": "1"}]})
+
+    backend._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    # The second request waits ~100 ms for a token, far beyond the hedge delay
+    for _ in range(2):
+        await backend.request("TicketGet", {"TicketID": "1"})
+    assert len(requests) == 2
+    assert backend.hedger.hedged == 0
+    await backend.close()
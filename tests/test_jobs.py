@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the background job manager
+"""
+
+import asyncio
+
+from otrs_mcp import server
+from otrs_mcp.jobs import (
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PENDING,
+    JOB_RUNNING,
+    JobManager,
+)
+
+
+async def test_job_reports_progress_and_result():
+    manager = JobManager(max_concurrency=1)
+
+    async def work(job):
+        job.update(done=0, total=4)
+        for _ in range(4):
+            await asyncio.sleep(0.01)
+            job.advance()
+        return "done"
+
+    job = manager.submit("test", work)
+    assert job.status == JOB_PENDING
+    await job.task
+
+    status = job.to_status()
+    assert job.status == JOB_COMPLETED
+    assert job.result == "done"
+    assert status["Progress"]["Percent"] == 100.0
+    assert status["ItemsPerSecond"] > 0
+
+
+async def test_failed_job_records_error():
+    manager = JobManager()
+
+    async def work(job):
+        raise ValueError("boom")
+
+    job = manager.submit("test", work)
+    await job.task
+    assert job.status == JOB_FAILED
+    assert job.error == "boom"
+
+
+async def test_concurrency_cap_and_cancel():
+    manager = JobManager(max_concurrency=1)
+    release = asyncio.Event()
+
+    async def blocking(job):
+        await release.wait()
+
+    first = manager.submit("test", blocking)
+    second = manager.submit("test", blocking)
+    await asyncio.sleep(0.01)
+    assert first.status == JOB_RUNNING
+    assert second.status == JOB_PENDING
+
+    manager.cancel(second.job_id)
+    manager.cancel(first.job_id)
+    await asyncio.gather(first.task, second.task, return_exceptions=True)
+    assert first.status == JOB_CANCELLED
+    assert second.status == JOB_CANCELLED
+
+
+async def test_finished_jobs_are_pruned():
+    manager = JobManager(max_retained=2)
+
+    async def work(job):
+        return None
+
+    for _ in range(4):
+        await manager.submit("test", work).task
+    manager.submit("test", work)
+    assert len(manager.jobs) == 2
+
+
+async def test_ticket_export_fetches_tickets_in_batches(mock_otrs):
+    ticket_ids = [str(i) for i in range(1, 121)]
+
+    def respond(operation, body):
+        if operation == "TicketSearch":
+            return {"TicketID": ticket_ids}
+        return {"Ticket": [{"TicketID": t} for t in body["TicketID"].split(",")]}
+
+    requests = mock_otrs(respond)
+
+    status = await server.submit_ticket_export(limit=500)
+    job = server.jobs.get(status["JobID"])
+    await job.task
+
+    assert job.status == JOB_COMPLETED
+    assert job.result["Count"] == 120
+    assert [t["TicketID"] for t in job.result["Tickets"]] == ticket_ids
+    assert [operation for operation, _ in requests] == ["TicketSearch"] + ["TicketGet"] * 3
+    assert job.done == job.total == 120
+
+    page = await server.job_result(status["JobID"], offset=100, limit=50)
+    assert [t["TicketID"] for t in page["Result"]["Tickets"]] == ticket_ids[100:]
+    assert page["Result"]["Count"] == 120
+    assert page["Page"] == {"Offset": 100, "Limit": 50, "Totals": {"Tickets": 120, "Errors": 0}, "HasMore": False}
+    first = await server.job_result(status["JobID"])
+    assert len(first["Result"]["Tickets"]) == 100
+    assert first["Page"]["HasMore"] is True
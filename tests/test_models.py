@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact ticket model and JSON helpers
+"""
+
+import json
+
+from otrs_mcp import jsonutil
+from otrs_mcp.models import (
+    Ticket,
+    compact_history_result,
+    compact_ticket_result,
+    expand_history_result,
+    expand_ticket_result,
+)
+
+TICKET = {
+    "TicketID": "42",
+    "Title": "Printer broken",
+    "Queue": "Raw",
+    "State": "open",
+    "UnknownKey": {"kept": True},
+    "DynamicField": [{"Name": "Severity", "Value": "high"}, {"Name": "Site", "Value": None}],
+    "Article": [{"ArticleID": "7", "Body": "Hello", "Attachment": []}],
+}
+
+
+def test_ticket_round_trip():
+    ticket = Ticket.from_dict(TICKET)
+    assert ticket.to_dict() == TICKET
+    assert ticket.get("UnknownKey") == {"kept": True}
+    assert ticket.get("Owner", "nobody") == "nobody"
+    assert ticket.dynamic_field("Severity") == "high"
+    assert ticket.articles[0].get("Body") == "Hello"
+
+
+def test_dynamic_field_schema_is_shared():
+    first = Ticket.from_dict(TICKET)
+    second = Ticket.from_dict({**TICKET, "TicketID": "43"})
+    assert first.dynamic_schema is second.dynamic_schema
+
+
+def test_unusual_dynamic_fields_are_kept_verbatim():
+    ticket = Ticket.from_dict({"TicketID": "1", "DynamicField": [{"Name": "A", "Value": 1, "Label": "x"}]})
+    assert ticket.dynamic_schema is None
+    assert ticket.to_dict()["DynamicField"] == [{"Name": "A", "Value": 1, "Label": "x"}]
+
+
+def test_result_compaction_round_trip():
+    result = {"Ticket": [TICKET], "WebURL": "https://otrs/index.pl"}
+    assert expand_ticket_result(compact_ticket_result(result)) == result
+    history = {"TicketHistory": [{"TicketID": "42", "History": [{"HistoryType": "NewTicket", "Name": "x"}]}]}
+    assert expand_history_result(compact_history_result(history)) == history
+
+
+def test_compact_json_output():
+    data = {"Ticket": [TICKET], "Text": "Grüße"}
+    encoded = jsonutil.dumps(data)
+    assert "\n" not in encoded
+    assert len(encoded) < len(json.dumps(data, indent=2))
+    assert jsonutil.loads(encoded) == data
+    assert jsonutil.loads(jsonutil.dumps_bytes(data)) == data
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process sampling profiler
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from otrs_mcp import server
+from otrs_mcp.profiling import CoroutineStats, ProfilerBusy, TimedCoroutine, profile
+
+
+def busy_wait(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def blocking_handler():
+    for _ in range(5):
+        busy_wait(0.02)
+        await asyncio.sleep(0.01)
+
+
+async def test_profile_writes_folded_stacks(tmp_path):
+    async def load():
+        await asyncio.sleep(0.05)
+        await asyncio.gather(*(asyncio.create_task(blocking_handler()) for _ in range(2)))
+
+    background = asyncio.create_task(load())
+    result = await profile(0.4, str(tmp_path), interval=0.002)
+    await background
+
+    assert Path(result["File"]).parent == tmp_path
+    lines = Path(result["File"]).read_text().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0 and ";" in stack
+    assert any("busy_wait" in line for line in lines)
+    assert any(f["Function"].endswith(":busy_wait") for f in result["TopFunctions"])
+    assert result["EventLoopLag"]["MaxMs"] >= 10
+
+    handler = next(c for c in result["Coroutines"] if c["Coroutine"] == "blocking_handler")
+    assert handler["Tasks"] == 2
+    assert handler["RunMs"] >= 150
+    assert handler["LongestStepMs"] >= 15
+
+
+async def test_timed_coroutine_splits_run_and_wait():
+    stats = CoroutineStats()
+
+    async def work():
+        busy_wait(0.02)
+        await asyncio.sleep(0.05)
+        return 42
+
+    assert await asyncio.ensure_future(TimedCoroutine(work(), stats)) == 42
+    data = stats.to_dict("work")
+    assert data["Finished"] == 1
+    assert 15 <= data["RunMs"] < 45
+    assert data["WaitMs"] >= 40
+
+
+async def test_profile_tool_is_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(server.config, "profiling", False)
+    result = await server.profile_server(seconds=1)
+    assert result["Error"]["ErrorCode"] == "Profiling.Disabled"
+
+
+async def test_profile_tool_rejects_concurrent_profiles(monkeypatch, tmp_path):
+    monkeypatch.setattr(server.config, "profiling", True)
+    monkeypatch.setattr(server.config, "profile_dir", str(tmp_path))
+    status = await server.profile_server(seconds=0.2)
+    job = server.jobs.get(status["JobID"])
+    await asyncio.sleep(0.05)
+    result = await server.profile_server(seconds=0.1)
+    assert result["Error"]["ErrorCode"] == "Profiling.Busy"
+    await job.task
+    assert "File" in (await server.job_result(status["JobID"]))["Result"]
+
+
+async def test_profile_rejects_concurrent_profiles_with_own_error(tmp_path):
+    first = asyncio.ensure_future(profile(0.1, str(tmp_path)))
+    await asyncio.sleep(0.01)
+    with pytest.raises(ProfilerBusy):
+        await profile(0.1, str(tmp_path))
+    await first
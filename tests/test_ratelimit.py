@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-operation token bucket rate limiter
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from otrs_mcp.ratelimit import RateLimiter, TokenBucket, parse_rate_limits
+
+
+def test_parse_rate_limits():
+    limits = parse_rate_limits("TicketSearch=20, TicketCreate=5:10")
+    assert limits["TicketSearch"].rate == 20
+    assert limits["TicketSearch"].burst == 20
+    assert limits["TicketCreate"].rate == 5
+    assert limits["TicketCreate"].burst == 10
+    assert parse_rate_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_rate_limits("TicketSearch")
+    with pytest.raises(ValueError):
+        parse_rate_limits("TicketCreate=5:0.5")
+
+
+async def test_burst_then_throttle():
+    bucket = TokenBucket(rate=50, burst=2)
+    started = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    elapsed = time.monotonic() - started
+    # Two requests fit in the burst, the other two wait ~20ms each
+    assert elapsed >= 0.035
+    assert bucket.delayed == 2
+    assert bucket.total_wait > 0
+
+
+async def test_waiters_are_served_in_order():
+    bucket = TokenBucket(rate=100, burst=1)
+    order = []
+
+    async def caller(index):
+        await bucket.acquire()
+        order.append(index)
+
+    await asyncio.gather(*(caller(i) for i in range(5)))
+    assert order == [0, 1, 2, 3, 4]
+
+
+async def test_wildcard_applies_to_unlisted_operations():
+    limiter = RateLimiter.from_spec("TicketCreate=5,*=100")
+    assert limiter.bucket_for("TicketCreate").rate == 5
+    assert limiter.bucket_for("TicketGet").rate == 100
+    assert await RateLimiter().acquire("TicketGet") == 0.0
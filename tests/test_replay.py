@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for record mode and the replay harness
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from otrs_mcp import recording, server
+from otrs_mcp.recording import Recorder, redact, sanitize_args, shape
+from otrs_mcp.replay import FakeOTRS, load_recording, replay
+
+
+def test_shape_masks_free_text_only():
+    ticket = {"TicketID": "7", "Title": "VPN down for Alice", "State": "open", "Age": 42,
+              "CustomerUserID": "alice", "Article": [{"ArticleID": "3", "Body": "secret"}]}
+    masked = shape(ticket)
+    assert masked == {"TicketID": "7", "Title": "x" * 18, "State": "open", "Age": 42,
+                      "CustomerUserID": "xxxxx", "Article": [{"ArticleID": "3", "Body": "xxxxxx"}]}
+    assert sanitize_args({"ticket_id": "7", "title": "Hi", "limit": 5}) == {"ticket_id": "7", "title": "xx", "limit": 5}
+    # CustomerUserSearch mappings are keyed by login or email
+    customers = shape({"CustomerUser": {"jdoe@example.com": "John Doe <john@example.com>", "ann": "Ann"}})
+    assert customers == {"CustomerUser": {"x0xxxxxxxxxxxxxx": "x" * 27, "x1x": "xxx"}}
+
+
+def test_credentials_are_masked_in_every_mode():
+    response = {"SessionID": "s3cr3t", "Data": {"UserLogin": "agent", "ChallengeToken": "tok"}, "TicketID": "7"}
+    masked = {"SessionID": "xxxxxx", "Data": {"UserLogin": "xxxxx", "ChallengeToken": "xxx"}, "TicketID": "7"}
+    assert shape(response) == masked
+    assert redact(response) == masked
+    assert redact({"Ticket": [{"Title": "kept"}]}) == {"Ticket": [{"Title": "kept"}]}
+
+
+def test_fake_assembles_ticket_get_from_recorded_tickets():
+    events = [
+        {"type": "otrs", "backend": "default", "operation": "TicketGet", "request": {"TicketID": "1"},
+         "response": {"Ticket": [{"TicketID": "1"}]}, "duration_ms": 5},
+        {"type": "otrs", "backend": "default", "operation": "TicketGet", "request": {"TicketID": "2"},
+         "response": {"Ticket": [{"TicketID": "2"}]}, "duration_ms": 7},
+    ]
+    fake = FakeOTRS(events)
+    event, latency = fake.lookup("default", "TicketGet", {"TicketID": "1,2"})
+    assert event["response"] == {"Ticket": [{"TicketID": "1"}, {"TicketID": "2"}]}
+    assert latency > 0
+    assert fake.lookup("default", "TicketCreate", {})[0] is None
+
+
+@pytest.fixture
+def recorded(mock_otrs, monkeypatch, tmp_path):
+    path = tmp_path / "recording.jsonl"
+    monkeypatch.setattr(recording, "recorder", Recorder(str(path)))
+
+    def respond(operation, body):
+        if operation == "TicketSearch":
+            return {"TicketID": ["1", "2"]}
+        ids = str(body["TicketID"]).split(",")
+        return {"Ticket": [{"TicketID": i, "Title": f"Printer {i}", "State": "open"} for i in ids]}
+
+    mock_otrs(respond)
+    return path
+
+
+async def test_webhook_refresh_is_not_recorded_as_tool_calls(recorded, monkeypatch):
+    monkeypatch.setattr(server.config, "webhook_refresh", True)
+    await server.handle_ticket_event("default", "TicketUpdate", "1")
+    await asyncio.gather(*server._refresh_tasks)
+    recording.recorder.close()
+
+    events = load_recording(str(recorded))
+    assert [e["type"] for e in events if e["type"] == "tool"] == []
+    assert {e["operation"] for e in events} == {"TicketGet", "TicketHistoryGet"}
+
+
+async def test_record_then_replay(recorded):
+    await server.get_ticket("1")
+    await server.search_tickets(title="printer", limit=5)
+    # Nested tool calls are part of the outer call and not recorded separately
+    await server.ticket_resource("2")
+    recording.recorder.close()
+
+    events = load_recording(str(recorded))
+    tools = [e for e in events if e["type"] == "tool"]
+    assert [e["tool"] for e in tools] == ["get_ticket", "search_tickets", "ticket_resource"]
+    assert tools[1]["args"]["title"] == "xxxxxxx"
+    otrs = [e for e in events if e["type"] == "otrs"]
+    assert {e["trace_id"] for e in otrs} <= {e["trace_id"] for e in tools}
+    assert "Password" not in json.dumps(events)
+
+    report = await replay(events, speed=None, concurrency=2, latency=False)
+    assert report["Calls"] == 3
+    assert report["Errors"] == 0
+    assert report["UnmatchedRequests"] == 0
+    assert report["RoundTripsPerCall"] == report["RecordedRoundTripsPerCall"]
+    assert {t["Tool"] for t in report["Tools"]} == {"get_ticket", "search_tickets", "ticket_resource"}
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Startup regression tests for the stdio entry point
+
+The budget is generous by default so slow CI machines pass; tighten it with
+OTRS_STARTUP_BUDGET_MS, or use benchmarks/startup_bench.py for real numbers.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+STARTUP_BUDGET_MS = float(os.getenv("OTRS_STARTUP_BUDGET_MS", "5000"))
+
+SERVER_ENV = {
+    **os.environ,
+    "OTRS_BASE_URL": "https://otrs.invalid/otrs/nph-genericinterface.pl/Webservice/Test",
+    "OTRS_USERNAME": "test",
+    "OTRS_PASSWORD": "test",
+    "OTRS_WARMUP": "false",
+}
+
+
+def test_entry_point_import_is_lightweight():
+    result = subprocess.run(
+        [sys.executable, "-c", (
+            "import sys, otrs_mcp.main; "
+            "print(sorted(m for m in ('otrs_mcp.server', 'mcp', 'httpx') if m in sys.modules))"
+        )],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_first_stdout_line_is_initialize_response():
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "startup-test", "version": "0"},
+        },
+    }
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from otrs_mcp.main import run_server; run_server()"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=SERVER_ENV,
+        text=True,
+    )
+    try:
+        process.stdin.write(json.dumps(request) + "\n")
+        process.stdin.flush()
+        # Any banner on stdout would corrupt the protocol and fail to parse here
+        response = json.loads(process.stdout.readline())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    finally:
+        process.kill()
+        process.wait()
+
+    assert response["id"] == 1
+    assert "result" in response
+    assert elapsed_ms < STARTUP_BUDGET_MS
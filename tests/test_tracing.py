@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for tool-call tracing
+"""
+
+import json
+
+import pytest
+
+from otrs_mcp import tracing
+from otrs_mcp.tracing import HttpTimings, Span, Tracer, span, to_otlp, traced_tool
+
+
+@pytest.fixture
+def recorder(monkeypatch, tmp_path):
+    recorder = Tracer(path=str(tmp_path / "traces.jsonl"), slow_ms=0)
+    monkeypatch.setattr(tracing, "tracer", recorder)
+    return recorder
+
+
+async def test_tool_span_contains_sub_calls(recorder, tmp_path):
+    @traced_tool
+    async def get_thing(thing_id: str) -> str:
+        with span("otrs.TicketGet", operation="TicketGet") as child:
+            child.set(status_code=200)
+        with pytest.raises(ValueError):
+            with span("otrs.TicketHistoryGet"):
+                raise ValueError("bad")
+        return thing_id
+
+    assert await get_thing("1") == "1"
+    assert get_thing.__name__ == "get_thing"
+
+    lines = (tmp_path / "traces.jsonl").read_text().splitlines()
+    assert len(lines) == 1
+    trace = json.loads(lines[0])
+    assert trace["name"] == "tool.get_thing"
+    assert [c["name"] for c in trace["children"]] == ["otrs.TicketGet", "otrs.TicketHistoryGet"]
+    assert trace["children"][0]["attributes"]["status_code"] == 200
+    assert trace["children"][1]["error"] == "ValueError: bad"
+
+
+async def test_slow_threshold_filters_fast_calls(monkeypatch):
+    recorder = Tracer(slow_ms=10_000)
+    monkeypatch.setattr(tracing, "tracer", recorder)
+    with span("tool.fast"):
+        pass
+    assert len(recorder.recent_slow) == 0
+
+
+async def test_finished_parent_starts_new_trace(recorder):
+    with span("tool.submit") as parent:
+        pass
+    token = tracing._current_span.set(parent)
+    try:
+        with span("job.export") as child:
+            pass
+    finally:
+        tracing._current_span.reset(token)
+    assert child.parent is None
+    assert child.trace_id != parent.trace_id
+
+
+async def test_children_beyond_cap_are_counted(recorder, monkeypatch):
+    monkeypatch.setattr(tracing, "MAX_CHILDREN", 3)
+    with span("job.ticket_export") as root:
+        for _ in range(5):
+            with span("otrs.TicketGet"):
+                pass
+    assert len(root.children) == 3
+    trace = recorder.recent_slow[-1]
+    assert len(trace["children"]) == 3
+    assert trace["dropped_children"] == 2
+    attributes = to_otlp(root, "test")["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["attributes"]
+    assert {"key": "dropped_children", "value": {"intValue": "2"}} in attributes
+
+
+async def test_http_timings():
+    timings = HttpTimings()
+    for event in (
+        "connection.connect_tcp.started",
+        "connection.connect_tcp.complete",
+        "http11.send_request_body.complete",
+        "http11.receive_response_headers.complete",
+    ):
+        await timings.trace(event, {})
+    result = timings.as_dict()
+    assert result["connect_ms"] >= 0
+    assert result["server_ms"] >= 0
+    assert result["connection_reused"] is False
+    assert "tls_ms" not in result
+
+
+def test_otlp_payload():
+    root = Span("tool.get_ticket")
+    child = Span("otrs.TicketGet", root, status_code=200)
+    child.finish()
+    root.finish()
+    spans = to_otlp(root, "test")["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in spans] == ["tool.get_ticket", "otrs.TicketGet"]
+    assert spans[1]["parentSpanId"] == root.span_id
+    assert spans[1]["traceId"] == root.trace_id
+    assert spans[1]["attributes"] == [{"key": "status_code", "value": {"intValue": "200"}}]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the startup warm-up
+"""
+
+import asyncio
+
+from otrs_mcp import server
+from otrs_mcp.warmup import OTRSMetadata, warm_up
+
+
+async def test_warm_up_collects_metadata():
+    calls = []
+
+    async def request(operation, data):
+        calls.append(operation)
+        if operation == "SessionCreate":
+            return {"SessionID": "abc"}
+        if operation == "TicketSearch":
+            return {"TicketID": ["1", "2"]}
+        return {"Ticket": [
+            {"Queue": "Raw", "State": "new", "Priority": "3 normal", "Type": "Unclassified"},
+            {"Queue": "Misc", "State": "open", "Priority": "3 normal", "Type": "Incident"},
+        ]}
+
+    metadata = OTRSMetadata()
+    report = await warm_up(request, metadata, budget=1)
+    assert report["Steps"]["SessionCreate"]["Status"] == "ok"
+    assert report["Steps"]["Metadata"]["Status"] == "ok"
+    assert metadata.session_id == "abc"
+    assert metadata.queues == ["Raw", "Misc"]
+    assert metadata.priorities == ["3 normal"]
+    # One TicketGet for all sampled tickets
+    assert calls.count("TicketGet") == 1
+
+
+async def test_warm_up_respects_budget_and_errors():
+    async def request(operation, data):
+        if operation == "SessionCreate":
+            raise ConnectionError("refused")
+        await asyncio.sleep(10)
+
+    report = await warm_up(request, OTRSMetadata(), budget=0.05)
+    assert report["Steps"]["SessionCreate"]["Status"] == "failed"
+    assert report["Steps"]["Metadata"]["Status"] == "timed out"
+    assert report["Seconds"] < 1
+
+
+async def test_create_ticket_keeps_default_priority_after_warm_up(mock_otrs, monkeypatch):
+    requests = mock_otrs(lambda operation, body: {"TicketID": "1", "TicketNumber": "2024000001"})
+    backend = server.backends.get()
+    monkeypatch.setattr(backend.metadata, "priorities", ["5 very high", "4 high"])
+    monkeypatch.setattr(backend.config, "default_priority", "3 normal")
+
+    await server.create_ticket(title="Printer", body="Broken")
+    await server.create_ticket(title="Printer", body="Broken", priority="1 very low")
+    assert [body["Ticket"]["Priority"] for _, body in requests] == ["3 normal", "1 very low"]
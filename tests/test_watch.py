@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for ticket watches, resource subscriptions and the change poller
+"""
+
+import json
+from types import SimpleNamespace
+
+import mcp.types as types
+import pytest
+from mcp.server.lowlevel import NotificationOptions
+
+from otrs_mcp import server
+from otrs_mcp.watch import TOOL_WATCHER, TicketWatcher, WatchedTicket
+
+
+class FakeOTRS:
+    """TicketSearch/TicketGet over a dict of ticket ID -> Changed time"""
+
+    def __init__(self, changed):
+        self.changed = dict(changed)
+        self.calls = []
+
+    def ticket(self, ticket_id):
+        return {"TicketID": ticket_id, "Title": f"Ticket {ticket_id}", "State": "open", "Changed": self.changed[ticket_id]}
+
+    def respond(self, operation, data):
+        self.calls.append((operation, data))
+        if operation == "TicketSearch":
+            since = data["TicketChangeTimeNewerDate"]
+            return {"TicketID": [t for t in data["TicketID"] if self.changed[t] >= since]}
+        ids = data["TicketID"].split(",")
+        return {"Ticket": [self.ticket(t) for t in ids if t in self.changed]}
+
+    async def request(self, operation, data):
+        return self.respond(operation, data)
+
+
+async def test_quiet_poll_is_one_search():
+    otrs = FakeOTRS({str(i): "2024-05-01 10:00:00" for i in range(1, 51)})
+    otrs.changed["7"] = "2024-05-01 10:05:00"
+    watcher = TicketWatcher(otrs.request)
+    for ticket_id, changed in otrs.changed.items():
+        watcher.watch(ticket_id, TOOL_WATCHER, changed)
+    await watcher.stop()
+
+    # The ticket at the watermark is confirmed once, then skipped
+    assert (await watcher.poll())["Fetched"] == ["7"]
+    otrs.calls.clear()
+    result = await watcher.poll()
+    assert result == {"Fetched": [], "Changed": [], "Seconds": result["Seconds"]}
+    assert [operation for operation, _ in otrs.calls] == ["TicketSearch"]
+
+
+async def test_poll_fetches_only_changed_tickets():
+    otrs = FakeOTRS({"1": "2024-05-01 10:00:00", "2": "2024-05-01 10:00:00", "3": "2024-05-01 09:00:00"})
+    watcher = TicketWatcher(otrs.request)
+    for ticket_id, changed in otrs.changed.items():
+        watcher.watch(ticket_id, "a", changed)
+        watcher.watch(ticket_id, "b", changed)
+    await watcher.stop()
+    await watcher.poll()
+
+    otrs.changed["3"] = "2024-05-01 10:10:00"
+    otrs.calls.clear()
+    result = await watcher.poll()
+    assert result["Changed"] == ["3"]
+    assert otrs.calls[1] == ("TicketGet", {"TicketID": "3", "DynamicFields": 1, "Extended": 1})
+    assert [c["TicketID"] for c in watcher.drain()] == ["3"]
+    assert watcher.drain() == []
+
+
+def test_unwatch_drops_ticket_without_watchers():
+    watcher = TicketWatcher(FakeOTRS({}).request)
+    watcher.tickets["1"] = WatchedTicket("1", "")
+    watcher.tickets["1"].watchers.update({"a", "b"})
+    assert watcher.unwatch("1", "a")
+    assert "1" in watcher.tickets
+    assert watcher.unwatch("1", "b")
+    assert "1" not in watcher.tickets
+    assert not watcher.unwatch("1", "b")
+
+
+class FakeSession:
+    def __init__(self):
+        self.updated = []
+
+    async def send_resource_updated(self, uri):
+        self.updated.append(str(uri))
+
+
+@pytest.fixture
+def otrs(mock_otrs, monkeypatch):
+    fake = FakeOTRS({"1": "2024-05-01 10:00:00", "2": "2024-05-01 10:00:00"})
+    mock_otrs(fake.respond)
+    backend = server.backends.get()
+    monkeypatch.setattr(backend, "watcher", TicketWatcher(backend.request))
+    backend.watcher.on_ticket = server._on_watched_ticket(backend)
+    yield fake, backend
+    backend.watcher.tickets.clear()
+
+
+async def test_watch_tool_and_subscription_share_one_poller(otrs, monkeypatch):
+    fake, backend = otrs
+
+    result = await server.watch_ticket(["1", "2"])
+    assert result["Watching"] == ["1", "2"]
+    await backend.watcher.stop()
+
+    session = FakeSession()
+    monkeypatch.setattr(type(server.mcp._mcp_server), "request_context", property(lambda self: SimpleNamespace(session=session)))
+    await server.subscribe_resource("otrs://ticket/2")
+    await backend.watcher.stop()
+    # Both tickets were fetched once, in one request, when first watched
+    assert [operation for operation, _ in fake.calls] == ["TicketGet"]
+
+    fake.changed["2"] = "2024-05-01 11:00:00"
+    await backend.watcher.poll()
+    assert session.updated == ["otrs://ticket/2"]
+    changes = await server.get_ticket_changes()
+    assert [c["TicketID"] for c in changes["Changes"]] == ["2"]
+
+    # get_ticket answers from the poller's latest fetch, with the ticket cache at its default (off)
+    assert not backend.ticket_cache.enabled
+    calls = len(fake.calls)
+    ticket = await server.get_ticket("2")
+    assert ticket["Ticket"][0]["Changed"] == "2024-05-01 11:00:00"
+    assert len(fake.calls) == calls
+
+    for _ in range(3):
+        assert json.loads(await server.ticket_resource("2"))["Ticket"][0]["Changed"] == "2024-05-01 11:00:00"
+    assert len(fake.calls) == calls
+
+    # A webhook event drops the copy until the ticket is fetched again
+    await server.handle_ticket_event(backend.name, "TicketUpdate", "2")
+    await server.get_ticket("2")
+    await server.get_ticket("2")
+    assert len(fake.calls) == calls + 1
+
+    await server.unsubscribe_resource("otrs://ticket/2")
+    assert (await server.unwatch_ticket(["1", "2"]))["Watching"] == []
+    assert backend.watcher.tickets == {}
+
+
+def test_ticket_uris_and_capabilities():
+    assert server.parse_ticket_uri("otrs://ticket/42") == (None, "42")
+    assert server.parse_ticket_uri("otrs://backend/eu/ticket/42") == ("eu", "42")
+    assert server.parse_ticket_uri("otrs://ticket/42/history") is None
+    capabilities = server.mcp._mcp_server.get_capabilities(NotificationOptions(), {})
+    assert capabilities.resources.subscribe is True
+    assert types.SubscribeRequest in server.mcp._mcp_server.request_handlers
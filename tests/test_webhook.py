@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the OTRS ticket event webhook
+"""
+
+import socket
+
+from starlette.testclient import TestClient
+
+from otrs_mcp.webhook import TOKEN_HEADER, WebhookStats, create_app, extract_ticket_events, serve
+
+
+def test_extract_ticket_events_shapes():
+    assert extract_ticket_events({"Event": {"Event": "TicketUpdate", "TicketID": 5}}) == [("TicketUpdate", "5")]
+    assert extract_ticket_events({"Event": "ArticleCreate", "TicketID": "7"}) == [("ArticleCreate", "7")]
+    assert extract_ticket_events({"Ticket": {"TicketID": "9"}}) == [("TicketEvent", "9")]
+    assert extract_ticket_events([{"TicketID": "1"}, {"TicketID": "2"}]) == [("TicketEvent", "1"), ("TicketEvent", "2")]
+    assert extract_ticket_events({"Event": "Ping"}) == []
+
+
+def test_events_reach_handler_with_backend_and_token():
+    received = []
+
+    async def handler(backend, event_name, ticket_id):
+        if backend == "unknown":
+            raise ValueError("Unknown OTRS backend")
+        received.append((backend, event_name, ticket_id))
+
+    stats = WebhookStats()
+    client = TestClient(create_app(handler, "default", token="secret", stats=stats))
+    event = {"Event": {"Event": "TicketUpdate", "TicketID": "42"}}
+
+    assert client.post("/otrs/events", json=event).status_code == 401
+    response = client.post("/otrs/events", json=event, headers={TOKEN_HEADER: "secret"})
+    assert response.status_code == 202
+    assert client.post("/otrs/events/eu?token=secret", json=event).status_code == 202
+    assert client.post("/otrs/events/unknown?token=secret", json=event).status_code == 404
+
+    assert received == [("default", "TicketUpdate", "42"), ("eu", "TicketUpdate", "42")]
+    assert stats.invalidated == 2
+    assert stats.rejected == 2
+
+
+async def test_port_in_use_does_not_exit(capsys):
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        port = taken.getsockname()[1]
+        await serve(create_app(lambda *_: None, "default"), "127.0.0.1", port)
+    assert f"Not receiving events on http://127.0.0.1:{port}" in capsys.readouterr().err